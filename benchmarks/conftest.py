@@ -0,0 +1,55 @@
+"""Shared inputs for the microbenchmarks.
+
+Run with ``make bench``; ``make bench-baseline`` saves a baseline that
+``make bench-compare`` compares later runs against.
+"""
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from netcommander import NetCommanderClient
+
+# Outlet counts of the netBooter models (NP-05B up to NP-16) plus a stress case
+OUTLET_COUNTS = [5, 8, 16, 32]
+
+# Response shapes as they reach the parsers
+SHAPES = ["raw", "stripped", "text"]
+
+DEVICE_INFO_RESPONSES = {
+    "full": "$A0,NP0501DU, HW4.3 BL1.6 -7.72-8.5",
+    "model_only": "$A0,NP0801D",
+}
+
+
+def status_response(num_outlets: int, shape: str = "raw"):
+    """Build a $A5 response with every other outlet ON.
+
+    Shapes: "raw" is the bytes as received (with the trailing CRLFs),
+    "stripped" the bytes after the client strips them and "text" the
+    decoded string.
+    """
+    bits = ("10" * num_outlets)[:num_outlets]
+    response = f"$A0,{bits},2.50,XX"
+    if shape == "raw":
+        return (response + "\r\n\r\n\r\n").encode("ascii")
+    if shape == "stripped":
+        return response.encode("ascii")
+    return response
+
+
+def root_page(size: int) -> str:
+    """Build a root web page of about size bytes with the MAC near the end."""
+    filler = "<tr><td>Outlet</td><td>ON</td><td>0.25 A</td></tr>\n"
+    body = filler * max(0, (size - 200) // len(filler))
+    return (
+        "<html><head><title>netBooter</title></head><body><table>\n"
+        f"{body}</table><p>MAC Address: 0C:73:EB:B0:9E:5C</p></body></html>"
+    )
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Client whose parsing methods are benchmarked (never connects)."""
+    return NetCommanderClient("192.0.2.1", "admin", "admin")
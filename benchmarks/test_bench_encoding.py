@@ -0,0 +1,27 @@
+"""Benchmarks for command encoding."""
+import pytest
+
+from netcommander.protocol import (
+    encode_set_outlet,
+    encode_toggle_outlet,
+)
+from netcommander.transports.telnet import translate_command
+
+
+@pytest.mark.benchmark(group="encode")
+def test_encode_set_outlet(benchmark):
+    """$A3 command string."""
+    benchmark(encode_set_outlet, 5, True)
+
+
+@pytest.mark.benchmark(group="encode")
+def test_encode_toggle_outlet(benchmark):
+    """rly command string."""
+    benchmark(encode_toggle_outlet, 5)
+
+
+@pytest.mark.benchmark(group="encode")
+@pytest.mark.parametrize("command", ["$A5", "$A3 5 1"])
+def test_translate_command(benchmark, command):
+    """HTTP-style command to a Telnet/serial line."""
+    benchmark(translate_command, command)
@@ -0,0 +1,58 @@
+"""Benchmarks for status model construction."""
+import pytest
+
+from netcommander.models import CompactStatus, DeviceStatus
+
+from conftest import OUTLET_COUNTS
+
+
+def outlets_dict(num_outlets: int) -> dict[int, bool]:
+    """Every other outlet ON."""
+    return {i: i % 2 == 1 for i in range(1, num_outlets + 1)}
+
+
+@pytest.mark.benchmark(group="model-construct")
+@pytest.mark.parametrize("num_outlets", OUTLET_COUNTS)
+def test_device_status_validated(benchmark, num_outlets):
+    """DeviceStatus(...) with its outlets validator."""
+    outlets = outlets_dict(num_outlets)
+    benchmark(
+        DeviceStatus,
+        outlets=outlets,
+        total_current_amps=2.5,
+        temperature="XX",
+        raw_response="$A0,10101,2.50,XX",
+    )
+
+
+@pytest.mark.benchmark(group="model-construct")
+@pytest.mark.parametrize("num_outlets", OUTLET_COUNTS)
+def test_device_status_from_bitmask(benchmark, num_outlets):
+    """DeviceStatus.from_bitmask from a parsed bitmask."""
+    bitmask = (1 << num_outlets) - 1
+    benchmark(DeviceStatus.from_bitmask, bitmask, num_outlets, 2.5, "XX", "")
+
+
+@pytest.mark.benchmark(group="model-construct")
+@pytest.mark.parametrize("num_outlets", OUTLET_COUNTS)
+def test_compact_status(benchmark, num_outlets):
+    """CompactStatus(...)."""
+    bitmask = (1 << num_outlets) - 1
+    benchmark(CompactStatus, bitmask, num_outlets, 2.5, "XX")
+
+
+@pytest.mark.benchmark(group="model-convert")
+@pytest.mark.parametrize("num_outlets", OUTLET_COUNTS)
+def test_compact_to_device_status(benchmark, num_outlets):
+    """CompactStatus.to_device_status."""
+    status = CompactStatus((1 << num_outlets) - 1, num_outlets, 2.5, "XX")
+    benchmark(status.to_device_status)
+
+
+@pytest.mark.benchmark(group="model-convert")
+@pytest.mark.parametrize("num_outlets", OUTLET_COUNTS)
+def test_device_status_outlets_on(benchmark, num_outlets):
+    """DeviceStatus.outlets_on."""
+    bitmask = (1 << num_outlets) - 1
+    status = DeviceStatus.from_bitmask(bitmask, num_outlets, 2.5, "XX", "")
+    benchmark(lambda: status.outlets_on)
@@ -0,0 +1,81 @@
+"""Benchmarks for response parsing."""
+import pytest
+
+from netcommander.parser import parse_status_bytes
+from netcommander.protocol import (
+    decode_device_info,
+    decode_mac_address,
+    decode_status,
+    decode_status_batch,
+)
+
+from conftest import (
+    DEVICE_INFO_RESPONSES,
+    OUTLET_COUNTS,
+    SHAPES,
+    root_page,
+    status_response,
+)
+
+
+@pytest.mark.benchmark(group="parse-status")
+@pytest.mark.parametrize("shape", SHAPES)
+@pytest.mark.parametrize("num_outlets", OUTLET_COUNTS)
+def test_parse_status_bytes(benchmark, num_outlets, shape):
+    """Byte-level $A5 parser."""
+    response = status_response(num_outlets, shape)
+    benchmark(parse_status_bytes, response)
+
+
+@pytest.mark.benchmark(group="parse-status")
+@pytest.mark.parametrize("num_outlets", OUTLET_COUNTS)
+def test_decode_status(benchmark, num_outlets):
+    """$A5 into a CompactStatus."""
+    response = status_response(num_outlets, "stripped")
+    benchmark(decode_status, response)
+
+
+@pytest.mark.benchmark(group="parse-status")
+@pytest.mark.parametrize("num_outlets", OUTLET_COUNTS)
+def test_client_parse_status_response(benchmark, client, num_outlets):
+    """NetCommanderClient._parse_status_response: $A5 into a DeviceStatus."""
+    response = status_response(num_outlets, "text")
+    benchmark(client._parse_status_response, response)
+
+
+@pytest.mark.benchmark(group="parse-status")
+@pytest.mark.parametrize("num_outlets", OUTLET_COUNTS)
+def test_client_parse_status_compact(benchmark, client, num_outlets):
+    """NetCommanderClient._parse_status_compact."""
+    response = status_response(num_outlets, "stripped")
+    benchmark(client._parse_status_compact, response)
+
+
+@pytest.mark.benchmark(group="parse-status-batch")
+@pytest.mark.parametrize("count", [10, 100, 1000])
+def test_decode_status_batch(benchmark, count):
+    """Many $A5 responses into column arrays."""
+    responses = [status_response(OUTLET_COUNTS[i % 4]) for i in range(count)]
+    benchmark(decode_status_batch, responses)
+
+
+@pytest.mark.benchmark(group="parse-device-info")
+@pytest.mark.parametrize("shape", list(DEVICE_INFO_RESPONSES))
+def test_client_parse_device_info_response(benchmark, client, shape):
+    """NetCommanderClient._parse_device_info_response."""
+    benchmark(client._parse_device_info_response, DEVICE_INFO_RESPONSES[shape])
+
+
+@pytest.mark.benchmark(group="parse-device-info")
+def test_decode_device_info_bytes(benchmark):
+    """$A8 straight from response bytes."""
+    response = DEVICE_INFO_RESPONSES["full"].encode("ascii")
+    benchmark(decode_device_info, response)
+
+
+@pytest.mark.benchmark(group="mac-scan")
+@pytest.mark.parametrize("size", [512, 4096, 32768])
+def test_mac_scan(benchmark, size):
+    """MAC address scan of the root page done by get_device_info()."""
+    page = root_page(size)
+    assert benchmark(decode_mac_address, page) == "0C:73:EB:B0:9E:5C"
@@ -0,0 +1,28 @@
+"""Benchmarks for request statistics, paid on every device request."""
+import pytest
+
+from netcommander.stats import OUTCOME_OK, LatencyHistogram, StatsRecorder
+
+
+@pytest.mark.benchmark(group="stats")
+@pytest.mark.parametrize("command", ["$A5", "$A3 5 1"])
+def test_record_request(benchmark, command):
+    """Count and time one request."""
+    recorder = StatsRecorder("10.0.0.1", 80)
+    benchmark(recorder.record, command, OUTCOME_OK, 0.031)
+
+
+@pytest.mark.benchmark(group="stats")
+def test_histogram_record(benchmark):
+    """Add one latency to a histogram."""
+    benchmark(LatencyHistogram().record, 0.031)
+
+
+@pytest.mark.benchmark(group="stats")
+def test_snapshot(benchmark):
+    """DeviceStats snapshot with four commands."""
+    recorder = StatsRecorder("10.0.0.1", 80)
+    for latency in (0.02, 0.03, 0.05, 0.4):
+        for command in ("$A5", "$A3 1 1", "$A8", "rly=0"):
+            recorder.record(command, OUTCOME_OK, latency)
+    benchmark(recorder.snapshot)
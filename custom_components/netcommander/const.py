@@ -6,8 +6,10 @@ DOMAIN = "netcommander"
 CONF_SCAN_INTERVAL = "scan_interval"
 CONF_REBOOT_DELAY = "reboot_delay"
 DEFAULT_SCAN_INTERVAL = 30  # seconds
-DEFAULT_COMMAND_DELAY = 0.5  # seconds to wait after command before refresh
+DEFAULT_COMMAND_DELAY = 0.5  # seconds after last command before verification poll
 DEFAULT_REBOOT_DELAY = 5  # seconds to wait between off and on during reboot
+HISTORY_DURATION = 3600  # seconds of status samples kept in memory
+SHORT_WINDOW = 300  # seconds; window of the 5-minute current sensors
 
 # Device info
 MANUFACTURER = "Synaccess"
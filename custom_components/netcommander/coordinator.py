@@ -7,12 +7,19 @@ import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .lib.netcommander_lib import NetCommanderClient, DeviceStatus, DeviceInfo
+from .lib.netcommander_lib import NetCommanderClient, DeviceStatus, DeviceInfo, StatusHistory
 from .lib.netcommander_lib.exceptions import NetCommanderError
 
-from .const import DEFAULT_SCAN_INTERVAL, DEFAULT_COMMAND_DELAY, DEFAULT_REBOOT_DELAY, DOMAIN
+from .const import (
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_COMMAND_DELAY,
+    DEFAULT_REBOOT_DELAY,
+    DOMAIN,
+    HISTORY_DURATION,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,6 +42,11 @@ class NetCommanderCoordinator(DataUpdateCoordinator[DeviceStatus]):
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=scan_interval),
+            # Outlet commands update state optimistically and request one
+            # verification poll, fired once the device has applied them
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=DEFAULT_COMMAND_DELAY, immediate=False
+            ),
         )
         self.host = host
         self.username = username
@@ -42,6 +54,9 @@ class NetCommanderCoordinator(DataUpdateCoordinator[DeviceStatus]):
         self.reboot_delay = reboot_delay
         self.client = NetCommanderClient(host, username, password)
         self.device_info: DeviceInfo | None = None
+        # Polled samples of the last hour for derived sensors; optimistic
+        # updates after commands are not recorded
+        self.history = StatusHistory(capacity=HISTORY_DURATION // scan_interval + 1)
 
     async def _async_update_data(self) -> DeviceStatus:
         """Fetch data from the device."""
@@ -57,6 +72,7 @@ class NetCommanderCoordinator(DataUpdateCoordinator[DeviceStatus]):
 
             # Get current status
             status = await self.client.get_status()
+            self.history.add(status)
             _LOGGER.debug(
                 "Status updated: %d outlets on, %.2fA current",
                 len(status.outlets_on),
@@ -71,40 +87,53 @@ class NetCommanderCoordinator(DataUpdateCoordinator[DeviceStatus]):
         """Shutdown the coordinator."""
         await self.client.close()
 
+    def _async_set_outlet_state(self, outlet_number: int, state: bool) -> None:
+        """Apply a commanded outlet state to the cached status."""
+        if self.data is None or outlet_number not in self.data.outlets:
+            return
+        self.async_set_updated_data(self.data.with_outlet(outlet_number, state))
+
     async def async_turn_on(self, outlet_number: int) -> bool:
         """Turn on an outlet."""
         try:
             result = await self.client.turn_on(outlet_number)
-            # Give device time to process the command before refreshing state
-            await asyncio.sleep(DEFAULT_COMMAND_DELAY)
-            await self.async_refresh()  # Wait for refresh to complete
-            return result
         except NetCommanderError as err:
             _LOGGER.error("Failed to turn on outlet %d: %s", outlet_number, err)
             return False
 
+        if result:
+            self._async_set_outlet_state(outlet_number, True)
+        # Debounced poll corrects the optimistic state if the device disagrees
+        await self.async_request_refresh()
+        return result
+
     async def async_turn_off(self, outlet_number: int) -> bool:
         """Turn off an outlet."""
         try:
             result = await self.client.turn_off(outlet_number)
-            # Give device time to process the command before refreshing state
-            await asyncio.sleep(DEFAULT_COMMAND_DELAY)
-            await self.async_refresh()  # Wait for refresh to complete
-            return result
         except NetCommanderError as err:
             _LOGGER.error("Failed to turn off outlet %d: %s", outlet_number, err)
             return False
 
+        if result:
+            self._async_set_outlet_state(outlet_number, False)
+        # Debounced poll corrects the optimistic state if the device disagrees
+        await self.async_request_refresh()
+        return result
+
     async def async_reboot_outlet(self, outlet_number: int) -> bool:
         """Reboot an outlet (off, wait, on)."""
         try:
             # Turn off
-            await self.client.turn_off(outlet_number)
+            if await self.client.turn_off(outlet_number):
+                self._async_set_outlet_state(outlet_number, False)
             # Wait configured delay
             await asyncio.sleep(self.reboot_delay)
             # Turn on
             result = await self.client.turn_on(outlet_number)
-            await self.async_refresh()  # Wait for refresh to complete
+            if result:
+                self._async_set_outlet_state(outlet_number, True)
+            await self.async_request_refresh()
             return result
         except NetCommanderError as err:
             _LOGGER.error("Failed to reboot outlet %d: %s", outlet_number, err)
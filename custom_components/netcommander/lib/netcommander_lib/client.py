@@ -2,35 +2,63 @@
 
 import asyncio
 import logging
-import re
-from typing import Optional
+import time
+from functools import partial
+from typing import Awaitable, Callable, Mapping, Optional, TypeVar, Union
 import aiohttp
 
-from .models import DeviceStatus, OutletState, DeviceInfo
+from .models import (
+    CompactStatus,
+    DeviceStatus,
+    DeviceInfo,
+    OutletBatchResult,
+    DeviceStats,
+)
+from .scheduler import CommandScheduler, PRIORITY_POLL, get_scheduler
+from .protocol import (
+    check_response,
+    decode_ack,
+    decode_device_info,
+    decode_device_status,
+    decode_mac_address,
+    decode_status,
+    encode_get_info,
+    encode_get_status,
+    encode_set_outlet,
+    encode_toggle_outlet,
+)
+from .rtt import AdaptiveTimeouts, get_adaptive_timeouts
+from .stats import CommandEvent, classify, command_kind, get_stats_recorder
+from .resilience import (
+    CircuitBreaker,
+    backoff_delay,
+    get_circuit_breaker,
+    is_idempotent,
+)
+from .transports import AiohttpTransport, Transport, create_transport
 from .exceptions import (
-    AuthenticationError,
+    NetCommanderError,
     NetCommanderConnectionError,
-    CommandError,
     InvalidOutletError,
-    ParseError,
 )
 from .const import (
     CMD_ENDPOINT,
-    CMD_GET_STATUS,
-    CMD_GET_INFO,
-    CMD_SET_OUTLET,
-    CMD_TOGGLE_OUTLET,
-    RESPONSE_SUCCESS,
-    RESPONSE_FAILED,
-    NUM_OUTLETS,
-    OUTLET_RANGE,
-    get_status_position,
-    get_rly_index,
     DEFAULT_TIMEOUT,
+    DEFAULT_MIN_TIMEOUT,
+    DEFAULT_STATUS_MAX_AGE,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_COMMAND_STAGGER,
+    DEFAULT_RETRIES,
+    DEFAULT_RETRY_BACKOFF,
+    DEFAULT_RETRY_MAX_BACKOFF,
+    DEFAULT_FAILURE_THRESHOLD,
+    DEFAULT_RESET_TIMEOUT,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 
 class NetCommanderClient:
     """Async client for Synaccess netCommander API.
@@ -43,6 +71,26 @@ class NetCommanderClient:
         ...     status = await client.get_status()
         ...     print(f"Outlet 1 is {'ON' if status.outlets[1] else 'OFF'}")
         ...     await client.set_outlet(1, True)  # Turn ON
+
+    Status reads can be served from an in-memory cache by passing
+    ``status_max_age`` (or ``max_age=`` per call). Outlet commands sent
+    through this client patch the cached status, so cached reads stay
+    consistent with changes made here.
+
+    All requests to a device are serialized through a CommandScheduler shared
+    by every client of the same host and port, with outlet commands running
+    ahead of queued polls.
+
+    Idempotent commands ($A5, $A8, $A3) are retried with jittered backoff
+    after connection errors; rly toggles are never retried. A circuit breaker
+    shared per device fails requests fast with CircuitOpenError while the
+    device is known to be down.
+
+    Command timeouts adapt to each device's measured round-trip time,
+    between ``min_timeout`` and ``timeout``.
+
+    Every request is counted and timed per command in statistics shared by
+    all clients of the device (see stats()).
     """
 
     def __init__(
@@ -51,8 +99,19 @@ class NetCommanderClient:
         username: str,
         password: str,
         port: int = 80,
-        timeout: int = DEFAULT_TIMEOUT,
+        timeout: float = DEFAULT_TIMEOUT,
         session: Optional[aiohttp.ClientSession] = None,
+        status_max_age: float = DEFAULT_STATUS_MAX_AGE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        command_stagger: float = DEFAULT_COMMAND_STAGGER,
+        transport: Union[Transport, str, None] = None,
+        retries: int = DEFAULT_RETRIES,
+        retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        min_timeout: float = DEFAULT_MIN_TIMEOUT,
+        collect_stats: bool = True,
+        on_command: Optional[Callable[[CommandEvent], None]] = None,
     ):
         """Initialize the client.
 
@@ -61,19 +120,89 @@ class NetCommanderClient:
             username: Authentication username
             password: Authentication password
             port: HTTP port (default: 80)
-            timeout: Request timeout in seconds (default: 10)
+            timeout: Request timeout ceiling in seconds (default: 10)
             session: Optional existing aiohttp session (for connection pooling)
+                used by the default HTTP transport
+            status_max_age: Serve status reads from cache if younger than this
+                many seconds (default: 0, always query the device)
+            max_concurrency: Requests allowed in flight to the device and
+                default fan-out for bulk operations (default: 1, serial)
+            command_stagger: Minimum seconds between command starts in bulk
+                operations (default: 0)
+            transport: Transport or transport URL (e.g. "telnet://host",
+                "serial:///dev/ttyACM0"); default is HTTP over an aiohttp
+                session. Closed together with the client
+            retries: Extra attempts for idempotent commands after connection
+                errors (default: 2)
+            retry_backoff: Backoff ceiling in seconds for the first retry,
+                doubled for each further retry (default: 0.25)
+            failure_threshold: Consecutive failed calls (after their retries)
+                before the device's circuit opens; 0 disables the breaker
+                (default: 3)
+            reset_timeout: Seconds the circuit stays open before a probe
+                request is let through (default: 30)
+            min_timeout: Floor for the adaptive command timeouts in seconds;
+                set equal to timeout for a fixed timeout (default: 0.5)
+            collect_stats: Count and time every request in the device's
+                statistics (default: True); see stats()
+            on_command: Called with a CommandEvent after every request to
+                the device; exceptions it raises are logged
+
+        Raises:
+            ValueError: retries is negative
         """
+        if retries < 0:
+            raise ValueError(f"retries must be >= 0, got {retries}")
+
         self.host = host
         self.username = username
         self.password = password
         self.port = port
         self.timeout = timeout
+        self.min_timeout = min_timeout
+        self.status_max_age = status_max_age
+        self.max_concurrency = max_concurrency
+        self.command_stagger = command_stagger
+        self.retries = retries
+        self.retry_backoff = retry_backoff
         self.base_url = f"http://{host}:{port}{CMD_ENDPOINT}"
 
-        self._external_session = session is not None
-        self._session = session
-        self._auth = aiohttp.BasicAuth(username, password)
+        if transport is None:
+            transport = AiohttpTransport(
+                host, port, username, password, timeout, session=session
+            )
+        elif isinstance(transport, str):
+            transport = create_transport(transport, username, password, timeout)
+        self._transport: Transport = transport
+        self._scheduler = get_scheduler(host, port, max_concurrency)
+        # Queued polls are only shared with clients that would fetch the
+        # same response: same credentials over the same kind of transport
+        self._fold_key = (username, password, type(transport).__name__)
+        self._timeouts = get_adaptive_timeouts(host, port, min_timeout, timeout)
+        self._breaker = get_circuit_breaker(
+            host, port, failure_threshold, reset_timeout
+        )
+        self._stats = get_stats_recorder(host, port) if collect_stats else None
+        self.on_command = on_command
+
+        # In-flight $A5 request shared by concurrent get_status() callers
+        self._status_request: Optional[asyncio.Future] = None
+
+        # Cached status and the monotonic time it was read from the device.
+        # The generation is bumped on every outlet command so that requests
+        # started before a write never overwrite the patched cache.
+        self._status_cache: Optional[CompactStatus] = None
+        self._status_cache_time = 0.0
+        self._status_generation = 0
+        self._status_request_generation = 0
+
+        # Last parsed status with its raw response, and the DeviceStatus view
+        # handed out for it, so repeat readers share one object
+        self._status_response: tuple[Optional[CompactStatus], bytes] = (None, b"")
+        self._status_view: tuple[Optional[CompactStatus], Optional[DeviceStatus]] = (
+            None,
+            None,
+        )
 
         _LOGGER.debug(
             "Initialized NetCommanderClient for %s:%d", self.host, self.port
@@ -81,34 +210,62 @@ class NetCommanderClient:
 
     async def __aenter__(self):
         """Async context manager entry."""
-        await self._ensure_session()
+        await self._transport.open()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
         await self.close()
 
-    async def _ensure_session(self) -> None:
-        """Ensure we have an active session."""
-        if self._session is None:
-            timeout = aiohttp.ClientTimeout(total=self.timeout)
-            self._session = aiohttp.ClientSession(
-                auth=self._auth,
-                timeout=timeout,
-                headers={"User-Agent": "NetCommander-Python/2025.10.15"},
-            )
-            _LOGGER.debug("Created new aiohttp session")
-
     async def close(self) -> None:
-        """Close the session if we own it."""
-        if self._session and not self._external_session:
-            await self._session.close()
-            self._session = None
-            _LOGGER.debug("Closed aiohttp session")
+        """Close the transport (and the aiohttp session if we own it)."""
+        await self._transport.close()
+
+    @property
+    def transport(self) -> Transport:
+        """Transport used to reach the device."""
+        return self._transport
+
+    @property
+    def _session(self) -> Optional[aiohttp.ClientSession]:
+        """aiohttp session of the default HTTP transport."""
+        return getattr(self._transport, "session", None)
+
+    @property
+    def scheduler(self) -> CommandScheduler:
+        """Command scheduler shared by all clients of this device."""
+        return self._scheduler
+
+    @property
+    def timeouts(self) -> AdaptiveTimeouts:
+        """Adaptive connect/read timeouts for this device."""
+        return self._timeouts
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker:
+        """Circuit breaker shared by all clients of this device."""
+        return self._breaker
+
+    def stats(self) -> DeviceStats:
+        """Get a snapshot of the device's request counters and latencies.
+
+        Example:
+            >>> stats = client.stats().commands["$A5"]
+            >>> print(stats.requests, stats.timeouts, stats.p99)
+
+        Returns:
+            DeviceStats with a CommandStats per command sent so far (empty
+            if the client was created with collect_stats=False)
+        """
+        if self._stats is None:
+            return DeviceStats(host=self.host, port=self.port)
+        return self._stats.snapshot()
 
     async def _send_command(self, command: str) -> str:
         """Send a command to the device and return response.
 
+        The request waits its turn in the device's command queue.
+
         Args:
             command: Command string (e.g., "$A5", "$A3 1 1", "rly=0")
 
@@ -117,42 +274,113 @@ class NetCommanderClient:
 
         Raises:
             NetCommanderConnectionError: Cannot reach device
+            CircuitOpenError: Device is known to be down
             AuthenticationError: Invalid credentials
             CommandError: Command failed
         """
-        await self._ensure_session()
+        response = await self._send_raw(command)
+        return response.decode("latin-1")
 
-        url = f"{self.base_url}?{command}"
-        _LOGGER.debug("Sending command: %s", command)
+    async def _send_raw(self, command: str) -> bytes:
+        """Send a command through the device's command queue.
 
-        try:
-            async with self._session.get(url) as resp:
-                if resp.status == 401:
-                    raise AuthenticationError(
-                        f"Authentication failed for {self.username}@{self.host}"
-                    )
+        Returns:
+            Response bytes from device, stripped of surrounding whitespace
+        """
+        attempts = 1 + self.retries if is_idempotent(command) else 1
 
-                if resp.status != 200:
-                    raise NetCommanderConnectionError(
-                        self.host, f"HTTP {resp.status}: {resp.reason}"
-                    )
+        # The breaker counts calls, not attempts: one call that fails after
+        # its retries is one failure
+        self._breaker.before_request()
+        for attempt in range(attempts):
+            try:
+                response: bytes = await self._scheduler.submit(
+                    command,
+                    partial(self._request_command, command),
+                    key=self._fold_key,
+                )
+            except NetCommanderConnectionError as err:
+                if attempt + 1 >= attempts:
+                    self._breaker.record_failure()
+                    raise
+                delay = backoff_delay(
+                    attempt, self.retry_backoff, DEFAULT_RETRY_MAX_BACKOFF
+                )
+                _LOGGER.debug(
+                    "Retrying %s in %.2fs (%d/%d): %s",
+                    command,
+                    delay,
+                    attempt + 1,
+                    attempts - 1,
+                    err,
+                )
+                await asyncio.sleep(delay)
+            except NetCommanderError:
+                # The device answered, so it is reachable
+                self._breaker.record_success()
+                raise
+            else:
+                self._breaker.record_success()
+                return response
 
-                text = await resp.text()
-                response = text.strip()
-                _LOGGER.debug("Response: %s", response)
+        # Unreachable: the last attempt returns or raises
+        raise AssertionError(f"{command} made no attempt")
 
-                # Check for command failure
-                if response.startswith(RESPONSE_FAILED):
-                    raise CommandError(command, response)
+    async def _request_command(self, command: str) -> bytes:
+        """Perform the request for a command (called by the scheduler)."""
+        return await self._measure(command, partial(self._exchange, command))
 
-                return response
+    async def _exchange(self, command: str) -> bytes:
+        """Send a command and check the response."""
+        _LOGGER.debug("Sending command: %s", command)
+
+        response = (
+            await self._transport.send_command(command, self._timeouts)
+        ).strip()
+        _LOGGER.debug("Response: %s", response)
+
+        # Check for command failure
+        return check_response(command, response)
 
-        except asyncio.TimeoutError as e:
-            raise NetCommanderConnectionError(self.host, f"Connection timeout after {self.timeout}s")
-        except aiohttp.ClientConnectorError as e:
-            raise NetCommanderConnectionError(self.host, f"Connection failed: {e}")
-        except aiohttp.ClientError as e:
-            raise NetCommanderConnectionError(self.host, f"Request error: {e}")
+    async def _measure(
+        self, command: str, request: Callable[[], Awaitable[_T]]
+    ) -> _T:
+        """Run a device request, recording it in the statistics."""
+        if self._stats is None and self.on_command is None:
+            return await request()
+
+        started = time.perf_counter()
+        try:
+            result = await request()
+        except NetCommanderError as err:
+            self._record(command, time.perf_counter() - started, err)
+            raise
+        self._record(command, time.perf_counter() - started, None)
+        return result
+
+    def _record(
+        self, command: str, latency: float, error: Optional[NetCommanderError]
+    ) -> None:
+        """Count a finished request and notify the on_command hook."""
+        outcome = classify(error)
+        if self._stats is not None:
+            self._stats.record(command, outcome, latency)
+        if self.on_command is not None:
+            try:
+                self.on_command(
+                    CommandEvent(
+                        self.host,
+                        self.port,
+                        command,
+                        command_kind(command),
+                        outcome,
+                        latency,
+                        error,
+                    )
+                )
+            except Exception:
+                # A broken hook must not fail the request
+                _LOGGER.exception("on_command hook %r failed", self.on_command)
 
     def _parse_status_response(self, response: str) -> DeviceStatus:
         """Parse status response into DeviceStatus model.
@@ -172,55 +400,34 @@ class NetCommanderClient:
         Raises:
             ParseError: Cannot parse response
         """
-        try:
-            parts = response.split(",")
-
-            if len(parts) < 3:
-                raise ParseError(
-                    response, f"Expected at least 3 parts, got {len(parts)}"
-                )
+        return decode_device_status(response)
 
-            if not parts[0].startswith(RESPONSE_SUCCESS):
-                raise ParseError(response, f"Expected {RESPONSE_SUCCESS}, got {parts[0]}")
+    def _parse_status_compact(self, response: Union[str, bytes]) -> CompactStatus:
+        """Parse status response into a CompactStatus.
 
-            # Detect outlet count from status string length
-            outlets_str = parts[1]
-            num_outlets = len(outlets_str)
+        Args:
+            response: Raw response from $A5 command
 
-            if num_outlets == 0:
-                raise ParseError(response, "Outlet status string is empty")
+        Returns:
+            CompactStatus object
 
-            # Parse outlets (reverse order: rightmost=outlet1, leftmost=outlet_N)
-            # Position (num_outlets - 1) = Outlet N
-            # Position (num_outlets - 2) = Outlet N-1
-            # ...
-            # Position 0 = Outlet 1
-            outlets = {}
-            for outlet_num in range(1, num_outlets + 1):
-                pos = num_outlets - outlet_num
-                outlets[outlet_num] = outlets_str[pos] == "1"
+        Raises:
+            ParseError: Cannot parse response
+        """
+        return decode_status(response)
 
-            # Parse current
-            try:
-                current = float(parts[2])
-            except ValueError:
-                raise ParseError(response, f"Invalid current value: {parts[2]}")
-
-            # Parse temperature (may be 'XX')
-            temperature = parts[3] if len(parts) > 3 else None
-
-            return DeviceStatus(
-                outlets=outlets,
-                total_current_amps=current,
-                temperature=temperature,
-                raw_response=response,
-            )
+    async def get_status(
+        self, max_age: Optional[float] = None, force: bool = False
+    ) -> DeviceStatus:
+        """Get current status of all outlets and device metrics.
 
-        except IndexError as e:
-            raise ParseError(response, f"Index error: {e}")
+        Concurrent calls on the same client share a single in-flight $A5
+        request and all receive the same DeviceStatus.
 
-    async def get_status(self) -> DeviceStatus:
-        """Get current status of all outlets and device metrics.
+        Args:
+            max_age: Accept a cached status up to this many seconds old
+                (default: the client's status_max_age)
+            force: Always query the device, ignoring the cache
 
         Returns:
             DeviceStatus with outlet states, current, and temperature
@@ -230,9 +437,122 @@ class NetCommanderClient:
             AuthenticationError: Invalid credentials
             ParseError: Cannot parse response
         """
+        status = await self.get_status_compact(max_age=max_age, force=force)
+        return self._device_status_view(status)
+
+    async def get_status_compact(
+        self, max_age: Optional[float] = None, force: bool = False
+    ) -> CompactStatus:
+        """Get current status as a CompactStatus.
+
+        Same as get_status() without building the per-outlet dict or the
+        Pydantic model; preferred for high-rate polling and history keeping.
+
+        Args:
+            max_age: Accept a cached status up to this many seconds old
+                (default: the client's status_max_age)
+            force: Always query the device, ignoring the cache
+
+        Returns:
+            CompactStatus with outlet bitmask, current, and temperature
+
+        Raises:
+            NetCommanderConnectionError: Cannot reach device
+            AuthenticationError: Invalid credentials
+            ParseError: Cannot parse response
+        """
+        if not force:
+            cached = self._get_cached_status(max_age)
+            if cached is not None:
+                _LOGGER.debug("Serving device status from cache")
+                return cached
+
         _LOGGER.info("Getting device status")
-        response = await self._send_command(CMD_GET_STATUS)
-        return self._parse_status_response(response)
+
+        # Coalesce concurrent callers onto a single device round trip. The
+        # firmware handles one request at a time, so overlapping $A5 requests
+        # only queue up on the device and time out. A request started before
+        # the last outlet command may be stale, so it is not joined.
+        request = self._status_request
+        if (
+            request is None
+            or request.done()
+            or self._status_request_generation != self._status_generation
+        ):
+            request = asyncio.ensure_future(
+                self._fetch_status(self._status_generation)
+            )
+            request.add_done_callback(self._status_request_done)
+            self._status_request = request
+            self._status_request_generation = self._status_generation
+        else:
+            _LOGGER.debug("Joining in-flight status request")
+
+        # Shield so one cancelled caller does not cancel the shared request
+        return await asyncio.shield(request)
+
+    async def _fetch_status(self, generation: int) -> CompactStatus:
+        """Send $A5, parse the response and update the cache."""
+        response = await self._send_raw(encode_get_status())
+        status = self._parse_status_compact(response)
+        self._status_response = (status, response)
+        if generation == self._status_generation:
+            self._status_cache = status
+            self._status_cache_time = time.monotonic()
+        return status
+
+    def _device_status_view(self, status: CompactStatus) -> DeviceStatus:
+        """Get the DeviceStatus for a compact status, built once per status."""
+        source, view = self._status_view
+        if source is status and view is not None:
+            return view
+        parsed, response = self._status_response
+        view = status.to_device_status(
+            raw_response=response.decode("latin-1") if parsed is status else None
+        )
+        self._status_view = (status, view)
+        return view
+
+    def _status_request_done(self, request: asyncio.Future) -> None:
+        """Clear the shared status request once it has completed."""
+        if self._status_request is request:
+            self._status_request = None
+        # Mark the exception as retrieved in case every caller was cancelled
+        if not request.cancelled():
+            request.exception()
+
+    def _get_cached_status(self, max_age: Optional[float]) -> Optional[CompactStatus]:
+        """Return the cached status if it is younger than max_age seconds."""
+        if max_age is None:
+            max_age = self.status_max_age
+        if self._status_cache is None or max_age <= 0:
+            return None
+        if time.monotonic() - self._status_cache_time > max_age:
+            return None
+        return self._status_cache
+
+    def _patch_status_cache(self, outlet_number: int, state: Optional[bool]) -> None:
+        """Apply an outlet change to the cached status.
+
+        Args:
+            outlet_number: Outlet that was changed
+            state: New state, or None to flip the cached state (toggle)
+        """
+        self._status_generation += 1
+        cached = self._status_cache
+        if cached is None:
+            return
+        if not 1 <= outlet_number <= cached.num_outlets:
+            self.invalidate_status_cache()
+            return
+        if state is None:
+            state = not cached.get_outlet_state(outlet_number)
+        self._status_cache = cached.with_outlet(outlet_number, state)
+
+    def invalidate_status_cache(self) -> None:
+        """Discard the cached status so the next read queries the device."""
+        self._status_generation += 1
+        self._status_cache = None
 
     def _parse_device_info_response(self, response: str) -> DeviceInfo:
         """Parse device info response into DeviceInfo model.
@@ -249,53 +569,12 @@ class NetCommanderClient:
         Raises:
             ParseError: Cannot parse response
         """
-        try:
-            if not response.startswith(RESPONSE_SUCCESS + ","):
-                raise ParseError(
-                    response, f"Expected {RESPONSE_SUCCESS}, got {response[:10]}"
-                )
+        return decode_device_info(response)
 
-            # Remove "$A0," prefix
-            data = response[4:]
-            parts = data.split(",")
-
-            if len(parts) < 1:
-                raise ParseError(response, "No model information found")
-
-            model = parts[0].strip()
-            hardware_version = None
-            firmware_version = None
-            bootloader_version = None
-
-            if len(parts) >= 2:
-                details = parts[1].strip()
-
-                # Parse hardware version
-                hw_match = re.search(r"HW\s*([0-9.]+)", details)
-                if hw_match:
-                    hardware_version = hw_match.group(1)
-
-                # Parse bootloader version
-                bl_match = re.search(r"BL\s*([0-9.]+)", details)
-                if bl_match:
-                    bootloader_version = bl_match.group(1)
-
-                # Parse firmware version (everything after BL)
-                fw_match = re.search(r"BL[0-9.]+\s+(.+)", details)
-                if fw_match:
-                    firmware_version = fw_match.group(1).strip()
-
-            return DeviceInfo(
-                model=model,
-                hardware_version=hardware_version,
-                firmware_version=firmware_version,
-                bootloader_version=bootloader_version,
-                mac_address=None,  # Will be populated separately if available
-                raw_response=response,
-            )
-
-        except IndexError as e:
-            raise ParseError(response, f"Index error: {e}")
+    async def _fetch_web_page(self) -> str:
+        """Fetch the device's root web page (called by the scheduler)."""
+        page = await self._measure("GET /", partial(self._transport.get_page, "/"))
+        return page.decode("latin-1")
 
     async def get_device_info(self) -> DeviceInfo:
         """Get device hardware and firmware information.
@@ -309,40 +588,45 @@ class NetCommanderClient:
             ParseError: Cannot parse response
         """
         _LOGGER.info("Getting device information")
-        response = await self._send_command(CMD_GET_INFO)
+        response = await self._send_command(encode_get_info())
         device_info = self._parse_device_info_response(response)
 
         # Try to get MAC address from web interface
         try:
-            await self._ensure_session()
-            url = f"http://{self.host}:{self.port}/"
-            async with self._session.get(url) as resp:
-                if resp.status == 200:
-                    html = await resp.text()
-                    # Look for MAC address pattern
-                    mac_match = re.search(
-                        r"([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})", html
-                    )
-                    if mac_match:
-                        # Update device_info with MAC (create new immutable object)
-                        device_info = DeviceInfo(
-                            model=device_info.model,
-                            hardware_version=device_info.hardware_version,
-                            firmware_version=device_info.firmware_version,
-                            bootloader_version=device_info.bootloader_version,
-                            mac_address=mac_match.group(0),
-                            raw_response=device_info.raw_response,
-                        )
+            html = await self._scheduler.submit(
+                "GET /",
+                self._fetch_web_page,
+                priority=PRIORITY_POLL,
+                key=self._fold_key,
+            )
+            mac_address = decode_mac_address(html) if html is not None else None
+            if mac_address:
+                # Update device_info with MAC (create new immutable object)
+                device_info = DeviceInfo(
+                    model=device_info.model,
+                    hardware_version=device_info.hardware_version,
+                    firmware_version=device_info.firmware_version,
+                    bootloader_version=device_info.bootloader_version,
+                    mac_address=mac_address,
+                    raw_response=device_info.raw_response,
+                )
         except Exception as e:
             _LOGGER.debug("Could not get MAC address from web interface: %s", e)
 
         return device_info
 
-    async def get_outlet_state(self, outlet_number: int) -> bool:
+    async def get_outlet_state(
+        self,
+        outlet_number: int,
+        max_age: Optional[float] = None,
+        force: bool = False,
+    ) -> bool:
         """Get state of a specific outlet.
 
         Args:
             outlet_number: Outlet number (1-N)
+            max_age: Accept a cached status up to this many seconds old
+            force: Always query the device, ignoring the cache
 
         Returns:
             True if outlet is ON, False if OFF
@@ -352,13 +636,13 @@ class NetCommanderClient:
             NetCommanderConnectionError: Cannot reach device
         """
         _LOGGER.debug("Getting state for outlet %d", outlet_number)
-        status = await self.get_status()
+        status = await self.get_status_compact(max_age=max_age, force=force)
 
         # Validate outlet number based on actual device outlets
-        if outlet_number not in status.outlets:
+        if not 1 <= outlet_number <= status.num_outlets:
             raise InvalidOutletError(outlet_number, status.num_outlets)
 
-        return status.outlets[outlet_number]
+        return status.get_outlet_state(outlet_number)
 
     async def set_outlet(self, outlet_number: int, state: bool) -> bool:
         """Set outlet to explicit ON or OFF state.
@@ -373,22 +657,39 @@ class NetCommanderClient:
             True if command succeeded
 
         Raises:
-            InvalidOutletError: Outlet number out of range (validated by device response)
+            InvalidOutletError: Outlet number below 1 or above the outlets of
+                the last status read (otherwise validated by the device)
             CommandError: Command failed
             NetCommanderConnectionError: Cannot reach device
         """
-        # Note: No pre-validation of outlet number - device will reject invalid outlets
-        # This allows supporting devices with different outlet counts dynamically
-        value = 1 if state else 0
-        # CRITICAL: Use SPACE between arguments, not comma!
-        command = f"{CMD_SET_OUTLET} {outlet_number} {value}"
+        # Only checked against a status already read; otherwise the device
+        # rejects invalid outlets, so any outlet count is supported
+        cached = self._status_cache
+        if outlet_number < 1 or (
+            cached is not None and outlet_number > cached.num_outlets
+        ):
+            raise InvalidOutletError(
+                outlet_number, cached.num_outlets if cached is not None else 5
+            )
+        command = encode_set_outlet(outlet_number, state)
 
         _LOGGER.info(
             "Setting outlet %d to %s", outlet_number, "ON" if state else "OFF"
         )
 
-        response = await self._send_command(command)
-        return response.startswith(RESPONSE_SUCCESS)
+        try:
+            response = await self._send_command(command)
+        except Exception:
+            # Outcome unknown, the next read must go to the device
+            self.invalidate_status_cache()
+            raise
+
+        success = decode_ack(response)
+        if success:
+            self._patch_status_cache(outlet_number, state)
+        else:
+            self.invalidate_status_cache()
+        return success
 
     async def turn_on(self, outlet_number: int) -> bool:
         """Turn outlet ON.
@@ -427,46 +728,178 @@ class NetCommanderClient:
             InvalidOutletError: Outlet number out of range (validated by device response)
         """
         # Note: No pre-validation - device will reject invalid outlets
-        rly_index = get_rly_index(outlet_number)
-        command = f"{CMD_TOGGLE_OUTLET}={rly_index}"
+        command = encode_toggle_outlet(outlet_number)
+
+        _LOGGER.info("Toggling outlet %d (%s)", outlet_number, command)
+
+        try:
+            response = await self._send_command(command)
+        except Exception:
+            self.invalidate_status_cache()
+            raise
+
+        success = decode_ack(response)
+        if success:
+            self._patch_status_cache(outlet_number, None)
+        else:
+            self.invalidate_status_cache()
+        return success
+
+    async def set_outlets(
+        self,
+        outlets: Mapping[int, bool],
+        max_age: Optional[float] = None,
+        concurrency: Optional[int] = None,
+        stagger: Optional[float] = None,
+    ) -> OutletBatchResult:
+        """Set several outlets in one call, skipping those already in state.
+
+        Reads the current status once, sends $A3 only for outlets whose state
+        differs from the target, then reads the status once more to confirm.
+        A failing outlet does not stop the others.
+
+        Args:
+            outlets: Mapping of outlet_number → target state (True for ON)
+            max_age: Accept a cached status up to this many seconds old for
+                the initial read (default: the client's status_max_age)
+            concurrency: Commands sent at once (default: the client's
+                max_concurrency; the device scheduler still applies)
+            stagger: Minimum seconds between command starts (default: the
+                client's command_stagger)
+
+        Returns:
+            OutletBatchResult with per-outlet success, the outlets that were
+            changed and the confirming status
 
-        _LOGGER.info("Toggling outlet %d (rly=%d)", outlet_number, rly_index)
+        Raises:
+            InvalidOutletError: Outlet number not present on the device
+            NetCommanderConnectionError: Cannot reach device
+        """
+        status = await self.get_status_compact(max_age=max_age)
+        return await self._apply_outlets(outlets, status, concurrency, stagger)
 
-        response = await self._send_command(command)
-        return response.startswith(RESPONSE_SUCCESS)
+    async def _apply_outlets(
+        self,
+        outlets: Mapping[int, bool],
+        status: CompactStatus,
+        concurrency: Optional[int] = None,
+        stagger: Optional[float] = None,
+    ) -> OutletBatchResult:
+        """Send commands for outlets that differ from status, then confirm."""
+        for outlet in outlets:
+            if not 1 <= outlet <= status.num_outlets:
+                raise InvalidOutletError(outlet, status.num_outlets)
+
+        changed = [
+            outlet
+            for outlet, state in outlets.items()
+            if status.get_outlet_state(outlet) != state
+        ]
+        _LOGGER.info(
+            "Setting %d outlets (%d need changes)", len(outlets), len(changed)
+        )
+
+        results = {outlet: True for outlet in outlets}
+        outcomes = await self._fan_out(
+            [partial(self.set_outlet, outlet, outlets[outlet]) for outlet in changed],
+            concurrency if concurrency is not None else self.max_concurrency,
+            stagger if stagger is not None else self.command_stagger,
+        )
+        for outlet, outcome in zip(changed, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                _LOGGER.error("Failed to set outlet %d: %s", outlet, outcome)
+                results[outlet] = False
+            else:
+                results[outlet] = outcome
+
+        confirmed: Optional[DeviceStatus] = None
+        try:
+            confirmed = (
+                await self.get_status(force=True)
+                if changed
+                else self._device_status_view(status)
+            )
+        except NetCommanderError as e:
+            _LOGGER.warning("Could not confirm outlet states: %s", e)
+
+        return OutletBatchResult(results=results, changed=changed, status=confirmed)
+
+    async def _fan_out(
+        self, calls: list, concurrency: int, stagger: float
+    ) -> list:
+        """Run calls with bounded concurrency and spaced start times.
+
+        Args:
+            calls: Coroutine functions taking no arguments
+            concurrency: Calls allowed to run at once
+            stagger: Minimum seconds between call starts
 
-    async def turn_on_all(self) -> dict[int, bool]:
+        Returns:
+            Result or exception of each call, in order
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        next_start = loop.time()
+
+        async def run(call):
+            nonlocal next_start
+            async with semaphore:
+                if stagger > 0:
+                    now = loop.time()
+                    start = max(now, next_start)
+                    next_start = start + stagger
+                    if start > now:
+                        await asyncio.sleep(start - now)
+                return await call()
+
+        return await asyncio.gather(
+            *(run(call) for call in calls), return_exceptions=True
+        )
+
+    async def turn_on_all(
+        self, concurrency: Optional[int] = None, stagger: Optional[float] = None
+    ) -> dict[int, bool]:
         """Turn all outlets ON.
 
+        Outlets that are already ON are left alone.
+
+        Args:
+            concurrency: Commands sent at once (default: max_concurrency)
+            stagger: Minimum seconds between command starts
+
         Returns:
             Dict of outlet_number → success (bool)
         """
         _LOGGER.info("Turning all outlets ON")
-        # Get current status to determine outlet count
-        status = await self.get_status()
-        results = {}
-        for outlet in status.outlets.keys():
-            try:
-                results[outlet] = await self.turn_on(outlet)
-            except Exception as e:
-                _LOGGER.error("Failed to turn on outlet %d: %s", outlet, e)
-                results[outlet] = False
-        return results
+        status = await self.get_status_compact()
+        result = await self._apply_outlets(
+            {outlet: True for outlet in range(1, status.num_outlets + 1)},
+            status,
+            concurrency,
+            stagger,
+        )
+        return result.results
 
-    async def turn_off_all(self) -> dict[int, bool]:
+    async def turn_off_all(
+        self, concurrency: Optional[int] = None, stagger: Optional[float] = None
+    ) -> dict[int, bool]:
         """Turn all outlets OFF.
 
+        Outlets that are already OFF are left alone.
+
+        Args:
+            concurrency: Commands sent at once (default: max_concurrency)
+            stagger: Minimum seconds between command starts
+
         Returns:
             Dict of outlet_number → success (bool)
         """
         _LOGGER.info("Turning all outlets OFF")
-        # Get current status to determine outlet count
-        status = await self.get_status()
-        results = {}
-        for outlet in status.outlets.keys():
-            try:
-                results[outlet] = await self.turn_off(outlet)
-            except Exception as e:
-                _LOGGER.error("Failed to turn off outlet %d: %s", outlet, e)
-                results[outlet] = False
-        return results
+        status = await self.get_status_compact()
+        result = await self._apply_outlets(
+            {outlet: False for outlet in range(1, status.num_outlets + 1)},
+            status,
+            concurrency,
+            stagger,
+        )
+        return result.results
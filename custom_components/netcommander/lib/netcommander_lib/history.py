@@ -0,0 +1,203 @@
+"""Rolling in-memory history of device status.
+
+A fixed-size ring buffer of recent samples (timestamp, total current,
+temperature, outlet bitmask) held in typed arrays, so windowed figures such
+as the average or peak current of the last five minutes are computed from
+memory instead of a database. Memory is fixed: 24 bytes per sample.
+"""
+
+import math
+import time
+from array import array
+from typing import Iterator, NamedTuple, Optional, Union
+
+from .models import CompactStatus, DeviceStatus
+
+DEFAULT_HISTORY_SIZE = 720  # samples; an hour at one poll per 5 seconds
+
+HISTORY_FIELDS = ("current", "temperature")
+
+
+class HistorySample(NamedTuple):
+    """One status sample."""
+
+    timestamp: float  # wall clock seconds
+    current: float  # Amps
+    temperature: Optional[float]  # °C, None without a sensor
+    bitmask: int  # bit N-1 = outlet N
+
+
+def parse_temperature(temperature: Optional[str]) -> Optional[float]:
+    """Get a temperature reading in °C ("XX" means no sensor)."""
+    if temperature is None:
+        return None
+    try:
+        return float(temperature)
+    except ValueError:
+        return None
+
+
+class StatusHistory:
+    """Ring buffer of the most recent status samples.
+
+    Example:
+        >>> history = StatusHistory(capacity=120)
+        >>> history.append(1000.0, 2.0)
+        >>> history.append(1030.0, 3.0)
+        >>> history.mean(300, now=1030.0), history.peak(300, now=1030.0)
+        (2.5, 3.0)
+    """
+
+    __slots__ = (
+        "capacity",
+        "_timestamps",
+        "_currents",
+        "_temperatures",
+        "_bitmasks",
+        "_next",
+        "_size",
+    )
+
+    def __init__(self, capacity: int = DEFAULT_HISTORY_SIZE):
+        """Initialize an empty history.
+
+        Args:
+            capacity: Samples kept; the oldest is dropped when full
+
+        Raises:
+            ValueError: Capacity is not positive
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._timestamps = array("d", bytes(8 * capacity))
+        self._currents = array("f", bytes(4 * capacity))
+        # NaN without a sensor
+        self._temperatures = array("f", bytes(4 * capacity))
+        self._bitmasks = array("Q", bytes(8 * capacity))
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Number of samples held."""
+        return self._size
+
+    def __iter__(self) -> Iterator[HistorySample]:
+        """Iterate over the samples, oldest first."""
+        start = (self._next - self._size) % self.capacity
+        for offset in range(self._size):
+            yield self._sample((start + offset) % self.capacity)
+
+    def append(
+        self,
+        timestamp: float,
+        current: float,
+        temperature: Optional[float] = None,
+        bitmask: int = 0,
+    ) -> None:
+        """Add a sample, dropping the oldest when full."""
+        position = self._next
+        self._timestamps[position] = timestamp
+        self._currents[position] = current
+        self._temperatures[position] = math.nan if temperature is None else temperature
+        self._bitmasks[position] = bitmask
+        self._next = (position + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def add(
+        self,
+        status: Union[DeviceStatus, CompactStatus],
+        timestamp: Optional[float] = None,
+    ) -> None:
+        """Add a status read at timestamp (default: now)."""
+        self.append(
+            time.time() if timestamp is None else timestamp,
+            status.total_current_amps,
+            parse_temperature(status.temperature),
+            status.bitmask,
+        )
+
+    def clear(self) -> None:
+        """Drop all samples."""
+        self._next = 0
+        self._size = 0
+
+    def latest(self) -> Optional[HistorySample]:
+        """Get the newest sample."""
+        if not self._size:
+            return None
+        return self._sample((self._next - 1) % self.capacity)
+
+    def _sample(self, position: int) -> HistorySample:
+        """Build the sample at a buffer position."""
+        temperature = self._temperatures[position]
+        return HistorySample(
+            self._timestamps[position],
+            # Stored as float32; round off the representation error
+            round(self._currents[position], 4),
+            None if math.isnan(temperature) else round(temperature, 2),
+            self._bitmasks[position],
+        )
+
+    def _positions(self, seconds: float, now: Optional[float]) -> Iterator[int]:
+        """Buffer positions of the samples in the window, newest first."""
+        oldest = (time.time() if now is None else now) - seconds
+        timestamps = self._timestamps
+        position = self._next
+        for _ in range(self._size):
+            position = (position - 1) % self.capacity
+            if timestamps[position] < oldest:
+                return
+            yield position
+
+    def window(
+        self, seconds: float, now: Optional[float] = None
+    ) -> list[HistorySample]:
+        """Get the samples of the last seconds, oldest first."""
+        samples = [self._sample(position) for position in self._positions(seconds, now)]
+        samples.reverse()
+        return samples
+
+    def _values(
+        self, field: str, seconds: float, now: Optional[float]
+    ) -> list[float]:
+        """Values of a field in the window (without missing temperatures)."""
+        if field == "current":
+            values = self._currents
+        elif field == "temperature":
+            values = self._temperatures
+        else:
+            raise ValueError(f"Unknown history field {field!r}; use {HISTORY_FIELDS}")
+        return [
+            values[position]
+            for position in self._positions(seconds, now)
+            if not math.isnan(values[position])
+        ]
+
+    def mean(
+        self, seconds: float, field: str = "current", now: Optional[float] = None
+    ) -> Optional[float]:
+        """Average of a field over the samples of the last seconds.
+
+        Returns:
+            The mean rounded to 0.01, or None without samples in the window
+        """
+        values = self._values(field, seconds, now)
+        if not values:
+            return None
+        return round(math.fsum(values) / len(values), 2)
+
+    def peak(
+        self, seconds: float, field: str = "current", now: Optional[float] = None
+    ) -> Optional[float]:
+        """Highest value of a field in the last seconds (None without samples)."""
+        values = self._values(field, seconds, now)
+        return round(max(values), 2) if values else None
+
+    def minimum(
+        self, seconds: float, field: str = "current", now: Optional[float] = None
+    ) -> Optional[float]:
+        """Lowest value of a field in the last seconds (None without samples)."""
+        values = self._values(field, seconds, now)
+        return round(min(values), 2) if values else None
@@ -1,5 +1,6 @@
 """Data models for netCommander API client."""
 
+import sys
 from typing import Optional
 from pydantic import BaseModel, Field, validator
 
@@ -81,17 +82,59 @@ class DeviceStatus(BaseModel):
 
         return v
 
+    @classmethod
+    def from_bitmask(
+        cls,
+        bitmask: int,
+        num_outlets: int,
+        total_current_amps: float,
+        temperature: Optional[str],
+        raw_response: str,
+    ) -> "DeviceStatus":
+        """Build a status from a parsed outlet bitmask (bit N-1 = outlet N)."""
+        return cls(
+            outlets={
+                outlet: bool(bitmask >> (outlet - 1) & 1)
+                for outlet in range(1, num_outlets + 1)
+            },
+            total_current_amps=total_current_amps,
+            temperature=temperature,
+            raw_response=raw_response,
+        )
+
     @property
     def num_outlets(self) -> int:
         """Get number of outlets on this device."""
         return len(self.outlets)
 
+    @property
+    def bitmask(self) -> int:
+        """Get outlet states as a bitmask (bit N-1 = outlet N)."""
+        mask = 0
+        for outlet, state in self.outlets.items():
+            if state:
+                mask |= 1 << (outlet - 1)
+        return mask
+
     def get_outlet_state(self, outlet_number: int) -> bool:
         """Get state of specific outlet."""
         if outlet_number not in self.outlets:
             raise ValueError(f"Invalid outlet number: {outlet_number}")
         return self.outlets[outlet_number]
 
+    def with_outlet(self, outlet_number: int, state: bool) -> "DeviceStatus":
+        """Return a copy of this status with one outlet set to a new state."""
+        if outlet_number not in self.outlets:
+            raise ValueError(f"Invalid outlet number: {outlet_number}")
+        outlets = dict(self.outlets)
+        outlets[outlet_number] = state
+        return DeviceStatus(
+            outlets=outlets,
+            total_current_amps=self.total_current_amps,
+            temperature=self.temperature,
+            raw_response=self.raw_response,
+        )
+
     @property
     def all_on(self) -> bool:
         """Check if all outlets are ON."""
@@ -114,3 +157,254 @@ class DeviceStatus(BaseModel):
 
     class Config:
         frozen = True  # Immutable
+
+
+class CompactStatus:
+    """Memory-compact device status.
+
+    Stores only the outlet bitmask, outlet count, current and temperature in
+    __slots__ (no per-outlet dict, no raw response, no validation), so long
+    per-poll histories stay small. The dict-style views of DeviceStatus are
+    computed on access, and to_device_status() converts for API
+    compatibility.
+    """
+
+    __slots__ = ("bitmask", "num_outlets", "total_current_amps", "temperature")
+
+    bitmask: int
+    num_outlets: int
+    total_current_amps: float
+    temperature: Optional[str]
+
+    def __init__(
+        self,
+        bitmask: int,
+        num_outlets: int,
+        total_current_amps: float,
+        temperature: Optional[str] = None,
+    ):
+        """Initialize the status.
+
+        Args:
+            bitmask: Outlet states, bit N-1 = outlet N
+            num_outlets: Number of outlets on the device
+            total_current_amps: Total current draw in Amps
+            temperature: Temperature reading (may be 'XX' if unavailable)
+        """
+        # Interning shares one string per distinct reading across a history
+        if temperature is not None:
+            temperature = sys.intern(temperature)
+        setattr_ = object.__setattr__
+        setattr_(self, "bitmask", bitmask)
+        setattr_(self, "num_outlets", num_outlets)
+        setattr_(self, "total_current_amps", total_current_amps)
+        setattr_(self, "temperature", temperature)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompactStatus):
+            return NotImplemented
+        return (
+            self.bitmask == other.bitmask
+            and self.num_outlets == other.num_outlets
+            and self.total_current_amps == other.total_current_amps
+            and self.temperature == other.temperature
+        )
+
+    def __hash__(self) -> int:
+        return hash(
+            (self.bitmask, self.num_outlets, self.total_current_amps, self.temperature)
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactStatus(outlets={self.status_string!r}, "
+            f"total_current_amps={self.total_current_amps!r}, "
+            f"temperature={self.temperature!r})"
+        )
+
+    @classmethod
+    def from_device_status(cls, status: DeviceStatus) -> "CompactStatus":
+        """Build a compact status from a DeviceStatus."""
+        return cls(
+            status.bitmask,
+            status.num_outlets,
+            status.total_current_amps,
+            status.temperature,
+        )
+
+    def to_device_status(self, raw_response: Optional[str] = None) -> DeviceStatus:
+        """Convert to a DeviceStatus.
+
+        Args:
+            raw_response: Original device response (default: rebuilt from the
+                stored values in the device's $A5 format)
+        """
+        if raw_response is None:
+            raw_response = f"$A0,{self.status_string},{self.total_current_amps:.2f}"
+            if self.temperature is not None:
+                raw_response += f",{self.temperature}"
+        return DeviceStatus.from_bitmask(
+            self.bitmask,
+            self.num_outlets,
+            self.total_current_amps,
+            self.temperature,
+            raw_response=raw_response,
+        )
+
+    @property
+    def status_string(self) -> str:
+        """Get outlet states in the device's format (outlet 1 rightmost)."""
+        return format(self.bitmask, f"0{self.num_outlets}b")
+
+    @property
+    def outlets(self) -> dict[int, bool]:
+        """Get outlet states keyed by outlet number (built on each access)."""
+        bitmask = self.bitmask
+        return {
+            outlet: bool(bitmask >> (outlet - 1) & 1)
+            for outlet in range(1, self.num_outlets + 1)
+        }
+
+    def get_outlet_state(self, outlet_number: int) -> bool:
+        """Get state of specific outlet."""
+        if not 1 <= outlet_number <= self.num_outlets:
+            raise ValueError(f"Invalid outlet number: {outlet_number}")
+        return bool(self.bitmask >> (outlet_number - 1) & 1)
+
+    def with_outlet(self, outlet_number: int, state: bool) -> "CompactStatus":
+        """Return a copy of this status with one outlet set to a new state."""
+        if not 1 <= outlet_number <= self.num_outlets:
+            raise ValueError(f"Invalid outlet number: {outlet_number}")
+        bit = 1 << (outlet_number - 1)
+        bitmask = self.bitmask | bit if state else self.bitmask & ~bit
+        return CompactStatus(
+            bitmask, self.num_outlets, self.total_current_amps, self.temperature
+        )
+
+    @property
+    def all_on(self) -> bool:
+        """Check if all outlets are ON."""
+        return self.bitmask == (1 << self.num_outlets) - 1
+
+    @property
+    def all_off(self) -> bool:
+        """Check if all outlets are OFF."""
+        return self.bitmask == 0
+
+    @property
+    def outlets_on(self) -> list[int]:
+        """Get list of outlet numbers that are ON."""
+        return [
+            outlet
+            for outlet in range(1, self.num_outlets + 1)
+            if self.bitmask >> (outlet - 1) & 1
+        ]
+
+    @property
+    def outlets_off(self) -> list[int]:
+        """Get list of outlet numbers that are OFF."""
+        return [
+            outlet
+            for outlet in range(1, self.num_outlets + 1)
+            if not self.bitmask >> (outlet - 1) & 1
+        ]
+
+
+class OutletBatchResult(BaseModel):
+    """Outcome of setting several outlets in one call."""
+
+    results: dict[int, bool] = Field(
+        description="Success keyed by outlet number (True if already in state)"
+    )
+    changed: list[int] = Field(
+        default_factory=list, description="Outlets a command was sent to"
+    )
+    status: Optional[DeviceStatus] = Field(
+        default=None, description="Status read after the commands (None if failed)"
+    )
+
+    @property
+    def all_succeeded(self) -> bool:
+        """Check if every outlet reached its target state."""
+        return all(self.results.values())
+
+    class Config:
+        frozen = True  # Immutable
+
+
+class SchedulerStats(BaseModel):
+    """Snapshot of a device command queue."""
+
+    queue_depth: int = Field(ge=0, description="Requests waiting for a slot")
+    in_flight: int = Field(ge=0, description="Requests running on the device")
+    completed: int = Field(ge=0, description="Requests finished since start")
+    superseded: int = Field(
+        ge=0, description="Polls folded into an already queued identical poll"
+    )
+    last_wait: float = Field(ge=0.0, description="Queue wait of the last request (s)")
+    max_wait: float = Field(ge=0.0, description="Longest queue wait seen (s)")
+    mean_wait: float = Field(ge=0.0, description="Mean queue wait (s)")
+
+    class Config:
+        frozen = True  # Immutable
+
+
+class CommandStats(BaseModel):
+    """Request counters and latency distribution of one command on a device.
+
+    Latencies cover requests the device answered ($A0 or $AF); percentiles
+    are estimated from log-spaced buckets (within about 19%).
+    """
+
+    requests: int = Field(ge=0, description="Requests sent")
+    ok: int = Field(ge=0, description="Requests answered successfully")
+    failed: int = Field(ge=0, description="Requests answered with $AF")
+    timeouts: int = Field(ge=0, description="Requests that timed out")
+    errors: int = Field(
+        ge=0, description="Requests failed otherwise (connection, authentication)"
+    )
+    latency_sum: float = Field(ge=0.0, description="Total latency of answers (s)")
+    latency_min: Optional[float] = Field(default=None, description="Fastest answer (s)")
+    latency_max: Optional[float] = Field(default=None, description="Slowest answer (s)")
+    p50: Optional[float] = Field(default=None, description="Median latency (s)")
+    p90: Optional[float] = Field(default=None, description="90th percentile latency (s)")
+    p99: Optional[float] = Field(default=None, description="99th percentile latency (s)")
+    buckets: list[tuple[float, int]] = Field(
+        default_factory=list,
+        description="(upper bound in s, count) of non-empty latency buckets",
+    )
+
+    @property
+    def answered(self) -> int:
+        """Number of requests the device answered."""
+        return self.ok + self.failed
+
+    @property
+    def latency_mean(self) -> Optional[float]:
+        """Mean latency of answers in seconds."""
+        return self.latency_sum / self.answered if self.answered else None
+
+    class Config:
+        frozen = True  # Immutable
+
+
+class DeviceStats(BaseModel):
+    """Snapshot of a device's request statistics, per command."""
+
+    host: str = Field(description="Device host")
+    port: int = Field(description="Device port")
+    commands: dict[str, CommandStats] = Field(
+        default_factory=dict,
+        description="Statistics keyed by command ($A5, $A3, $A8, rly, GET /)",
+    )
+
+    @property
+    def requests(self) -> int:
+        """Number of requests sent, all commands together."""
+        return sum(stats.requests for stats in self.commands.values())
+
+    class Config:
+        frozen = True  # Immutable
@@ -0,0 +1,318 @@
+"""Staggered status polling for many netCommander devices.
+
+Polling every device on the same interval from the moment it was added
+makes polls line up into bursts. The Poller gives every device a
+deterministic phase within the interval, derived from its name, so polls
+are spread evenly and land on the same schedule after a restart. A small
+random jitter keeps devices with nearby phases from colliding.
+
+Poll times are computed from the schedule, not from when the previous poll
+finished, so slow polls and event loop stalls don't make the schedule
+drift; ticks that pass while a device's previous poll is still running
+are skipped.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+import random
+import time
+import zlib
+from typing import Callable, Iterable, Mapping, NamedTuple, Optional, Union
+
+from .client import NetCommanderClient
+from .models import CompactStatus
+from .exceptions import NetCommanderError
+from .const import DEFAULT_POLL_INTERVAL, DEFAULT_POLL_JITTER
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PollResult(NamedTuple):
+    """Outcome of one poll of one device."""
+
+    device: str
+    status: Optional[CompactStatus]
+    error: Optional[Exception]  # NetCommanderError unless a bug
+    timestamp: float  # wall clock time the poll finished
+    latency: float  # seconds the poll took
+
+    @property
+    def ok(self) -> bool:
+        """Check if the poll succeeded."""
+        return self.error is None
+
+
+def phase_offset(device: str, interval: float) -> float:
+    """Get a device's deterministic phase within the poll interval.
+
+    Example:
+        >>> phase_offset("10.0.0.1:80", 30.0)
+        16.908...
+    """
+    return zlib.crc32(device.encode("utf-8")) / 2**32 * interval
+
+
+def next_tick(phase: float, interval: float, now: float) -> float:
+    """Get the first scheduled time at or after now.
+
+    Ticks are at ``phase + k * interval`` for whole k, on the clock that
+    ``now`` is read from.
+    """
+    return phase + math.ceil((now - phase) / interval) * interval
+
+
+class Poller:
+    """Poll device status on a staggered, drift-free schedule.
+
+    Results are published to subscribers as PollResult. Subscribers are
+    plain callables run on the event loop; exceptions they raise are logged
+    and don't affect polling.
+
+    Example:
+        >>> poller = Poller([client_a, client_b], interval=30)
+        >>> poller.subscribe(lambda result: print(result.device, result.status))
+        >>> async with poller:
+        ...     await asyncio.sleep(3600)
+    """
+
+    def __init__(
+        self,
+        clients: Union[
+            Mapping[str, NetCommanderClient], Iterable[NetCommanderClient], None
+        ] = None,
+        interval: float = DEFAULT_POLL_INTERVAL,
+        jitter: float = DEFAULT_POLL_JITTER,
+        max_age: Optional[float] = None,
+        rng: Optional[random.Random] = None,
+    ):
+        """Initialize the poller.
+
+        Args:
+            clients: Clients to poll, keyed by device name, or a list of
+                clients named ``host:port``
+            interval: Seconds between polls of one device (default: 30)
+            jitter: Fraction of the interval a poll may be moved either way
+                (default: 0.02)
+            max_age: Accept cached statuses up to this many seconds old
+                (default: each client's status_max_age)
+            rng: Random number generator for the jitter
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.interval = interval
+        self.jitter = jitter
+        self.max_age = max_age
+        self.polls = 0
+        self.errors = 0
+        self.missed = 0
+
+        self._random = rng or random.Random()
+        self._clients: dict[str, NetCommanderClient] = {}
+        self._subscribers: list[Callable[[PollResult], None]] = []
+        # (due, seq, device, tick): due includes jitter, tick is the ideal time
+        self._heap: list[tuple[float, int, str, float]] = []
+        self._seq = itertools.count()
+        # Device → seq of its one valid heap entry
+        self._queued: dict[str, int] = {}
+        self._polling: dict[str, asyncio.Task] = {}
+        self._task: Optional[asyncio.Task] = None
+        # Replaced on every start(), as an event belongs to one event loop
+        self._wakeup = asyncio.Event()
+        # Wall clock minus loop clock, so phases follow the wall clock
+        self._clock_offset = 0.0
+
+        if isinstance(clients, Mapping):
+            for name, client in clients.items():
+                self.add(client, name)
+        elif clients:
+            for client in clients:
+                self.add(client)
+
+    @classmethod
+    def from_fleet(cls, fleet, **options) -> "Poller":
+        """Create a poller for every device of an open FleetClient."""
+        clients = {device: fleet.client(device) for device in fleet.devices}
+        return cls(clients, **options)
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.stop()
+
+    @property
+    def devices(self) -> list[str]:
+        """Names of the polled devices."""
+        return list(self._clients)
+
+    @property
+    def running(self) -> bool:
+        """Whether the poller is running."""
+        return self._task is not None and not self._task.done()
+
+    def add(self, client: NetCommanderClient, name: Optional[str] = None) -> str:
+        """Add a device to poll.
+
+        Args:
+            client: Client for the device
+            name: Device name (default: ``host:port``); determines the phase
+
+        Returns:
+            Device name
+        """
+        if name is None:
+            name = f"{client.host}:{client.port}"
+        known = name in self._clients
+        self._clients[name] = client
+        if self.running and not known:
+            self._schedule(name, asyncio.get_running_loop().time())
+            self._wakeup.set()
+        return name
+
+    def remove(self, name: str) -> None:
+        """Stop polling a device."""
+        self._clients.pop(name, None)
+        self._queued.pop(name, None)
+        task = self._polling.pop(name, None)
+        if task is not None:
+            task.cancel()
+
+    def subscribe(self, callback: Callable[[PollResult], None]) -> Callable[[], None]:
+        """Register a callback for poll results.
+
+        Returns:
+            Function that removes the subscription
+        """
+        self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def phase(self, name: str) -> float:
+        """Get a device's phase within the interval in seconds."""
+        return phase_offset(name, self.interval)
+
+    def start(self) -> None:
+        """Start polling (must be called from a running event loop)."""
+        if self.running:
+            return
+        loop = asyncio.get_running_loop()
+        self._clock_offset = time.time() - loop.time()
+        self._wakeup = asyncio.Event()
+        self._heap.clear()
+        self._queued.clear()
+        now = loop.time()
+        for name in self._clients:
+            self._schedule(name, now)
+        self._task = loop.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop polling and cancel polls in progress."""
+        tasks = list(self._polling.values())
+        if self._task is not None:
+            tasks.append(self._task)
+            self._task = None
+        self._polling.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _schedule(self, name: str, now: float) -> None:
+        """Schedule a device's first tick at or after now (loop time)."""
+        tick = (
+            next_tick(self.phase(name), self.interval, now + self._clock_offset)
+            - self._clock_offset
+        )
+        self._push(name, tick)
+
+    def _push(self, name: str, tick: float) -> None:
+        """Queue a tick with jitter applied."""
+        spread = self.jitter * self.interval
+        due = tick + self._random.uniform(-spread, spread) if spread else tick
+        seq = next(self._seq)
+        self._queued[name] = seq
+        heapq.heappush(self._heap, (due, seq, name, tick))
+
+    async def _run(self) -> None:
+        """Start polls as their ticks come due."""
+        loop = asyncio.get_running_loop()
+        while True:
+            if not self._heap:
+                await self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+
+            due, seq, name, tick = self._heap[0]
+            delay = due - loop.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+                continue
+
+            heapq.heappop(self._heap)
+            if self._queued.get(name) != seq:
+                # Device was removed (and maybe added again) since queued
+                continue
+
+            if name in self._polling:
+                # Previous poll still running; skip rather than queue up
+                self.missed += 1
+            else:
+                self._polling[name] = loop.create_task(self._poll(name))
+
+            # Next tick follows the schedule, not this poll's start time. If
+            # the loop stalled past whole intervals, drop the missed ticks.
+            next_due = tick + self.interval
+            now = loop.time()
+            if next_due < now:
+                skipped = math.ceil((now - next_due) / self.interval)
+                self.missed += skipped
+                next_due += skipped * self.interval
+            self._push(name, next_due)
+
+    async def _poll(self, name: str) -> None:
+        """Poll one device and publish the result."""
+        client = self._clients[name]
+        started = time.monotonic()
+        status: Optional[CompactStatus] = None
+        error: Optional[Exception] = None
+        try:
+            status = await client.get_status_compact(max_age=self.max_age)
+        except NetCommanderError as e:
+            error = e
+            self.errors += 1
+            _LOGGER.debug("Poll of %s failed: %s", name, e)
+        except Exception as e:
+            # Still publish it, so subscribers see the device failing
+            error = e
+            self.errors += 1
+            _LOGGER.exception("Poll of %s failed unexpectedly", name)
+        finally:
+            if self._polling.get(name) is asyncio.current_task():
+                del self._polling[name]
+
+        self.polls += 1
+        self._publish(
+            PollResult(name, status, error, time.time(), time.monotonic() - started)
+        )
+
+    def _publish(self, result: PollResult) -> None:
+        """Send a result to every subscriber."""
+        for callback in list(self._subscribers):
+            try:
+                callback(result)
+            except Exception:
+                # A broken subscriber must not stop polling
+                _LOGGER.exception("Poll subscriber %r failed", callback)
@@ -0,0 +1,318 @@
+"""Sans-IO protocol core for netCommander devices.
+
+Encodes requests and decodes responses without touching the network or an
+event loop, so transports, the client, tests and benchmarks share one
+implementation. Commands are encoded in the HTTP syntax ("$A3 1 1");
+line-based transports translate them.
+
+Batch decoders work over many responses at once (e.g. one per PDU in a
+fleet) and return column arrays instead of one object per response.
+"""
+
+import math
+import re
+from array import array
+from typing import Iterable, Optional, Union
+
+from .models import CompactStatus, DeviceInfo, DeviceStatus
+from .parser import parse_status_bytes
+from .exceptions import CommandError, ParseError
+from .const import (
+    CMD_GET_STATUS,
+    CMD_GET_INFO,
+    CMD_SET_OUTLET,
+    CMD_TOGGLE_OUTLET,
+    RESPONSE_SUCCESS,
+    RESPONSE_FAILED,
+    get_rly_index,
+)
+
+Response = Union[bytes, str]
+
+_RESPONSE_SUCCESS = RESPONSE_SUCCESS.encode("ascii")
+_RESPONSE_FAILED = RESPONSE_FAILED.encode("ascii")
+_RESPONSE_CODES = (_RESPONSE_SUCCESS, _RESPONSE_FAILED)
+
+# Bitmask column width: 64 outlets per device
+_MAX_BATCH_OUTLETS = 64
+
+_HW_RE = re.compile(r"HW\s*([0-9.]+)")
+_BL_RE = re.compile(r"BL\s*([0-9.]+)")
+_FW_RE = re.compile(r"BL[0-9.]+\s+(.+)")
+_MAC_RE = re.compile(r"([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})")
+
+
+def _as_bytes(response: Response) -> bytes:
+    """Get a response as bytes."""
+    if isinstance(response, str):
+        return response.encode("latin-1", "replace")
+    return response
+
+
+# Encoders
+
+
+def encode_get_status() -> str:
+    """Encode a status request ($A5)."""
+    return CMD_GET_STATUS
+
+
+def encode_get_info() -> str:
+    """Encode a device information request ($A8)."""
+    return CMD_GET_INFO
+
+
+def encode_set_outlet(outlet_number: int, state: bool) -> str:
+    """Encode an explicit outlet ON/OFF command.
+
+    The HTTP interface needs SPACES between arguments, not commas.
+
+    Example:
+        >>> encode_set_outlet(1, True)
+        '$A3 1 1'
+    """
+    return f"{CMD_SET_OUTLET} {outlet_number} {1 if state else 0}"
+
+
+def encode_toggle_outlet(outlet_number: int) -> str:
+    """Encode an outlet toggle command.
+
+    Example:
+        >>> encode_toggle_outlet(1)
+        'rly=0'
+    """
+    return f"{CMD_TOGGLE_OUTLET}={get_rly_index(outlet_number)}"
+
+
+# Decoders
+
+
+def check_response(command: str, response: bytes) -> bytes:
+    """Check a response for the failure code.
+
+    Args:
+        command: Command the response answers
+        response: Response bytes, stripped of surrounding whitespace
+
+    Returns:
+        The response, unchanged
+
+    Raises:
+        CommandError: Device answered $AF
+    """
+    if response.startswith(_RESPONSE_FAILED):
+        raise CommandError(command, response.decode("latin-1"))
+    return response
+
+
+def extract_response(line: bytes) -> Optional[bytes]:
+    """Find the response in a line read from a Telnet session or console.
+
+    Echo and prompts may surround the response on the same line.
+
+    Args:
+        line: Line as read from the device
+
+    Returns:
+        Response starting at its $A0/$AF code, or None if the line has none
+    """
+    for code in _RESPONSE_CODES:
+        start = line.find(code)
+        if start >= 0:
+            return line[start:].strip()
+    return None
+
+
+def decode_ack(response: Response) -> bool:
+    """Decode a command acknowledgement ($A0 success, anything else failure)."""
+    return _as_bytes(response).lstrip().startswith(_RESPONSE_SUCCESS)
+
+
+def decode_status(response: Response) -> CompactStatus:
+    """Decode a $A5 status response.
+
+    Args:
+        response: Raw response (e.g. b"$A0,10101,2.50,25")
+
+    Returns:
+        CompactStatus
+
+    Raises:
+        ParseError: Cannot parse response
+    """
+    return CompactStatus(*parse_status_bytes(response))
+
+
+def decode_device_status(response: Response) -> DeviceStatus:
+    """Decode a $A5 status response into a DeviceStatus model.
+
+    Raises:
+        ParseError: Cannot parse response
+    """
+    bitmask, num_outlets, current, temperature = parse_status_bytes(response)
+    if isinstance(response, bytes):
+        response = response.decode("latin-1")
+    return DeviceStatus.from_bitmask(
+        bitmask, num_outlets, current, temperature, raw_response=response
+    )
+
+
+def decode_device_info(response: Response) -> DeviceInfo:
+    """Decode a $A8 device information response.
+
+    Format: $A0,MODEL, HWX.X BLX.X firmware
+    Example: $A0,NP0501DU, HW4.3 BL1.6 -7.72-8.5
+
+    The MAC address is not part of the response and is left unset.
+
+    Raises:
+        ParseError: Cannot parse response
+    """
+    if isinstance(response, bytes):
+        response = response.decode("latin-1")
+
+    if not response.startswith(RESPONSE_SUCCESS + ","):
+        raise ParseError(
+            response, f"Expected {RESPONSE_SUCCESS}, got {response[:10]}"
+        )
+
+    # Remove "$A0," prefix
+    parts = response[4:].split(",")
+    model = parts[0].strip()
+    hardware_version = None
+    firmware_version = None
+    bootloader_version = None
+
+    if len(parts) >= 2:
+        details = parts[1].strip()
+
+        hw_match = _HW_RE.search(details)
+        if hw_match:
+            hardware_version = hw_match.group(1)
+
+        bl_match = _BL_RE.search(details)
+        if bl_match:
+            bootloader_version = bl_match.group(1)
+
+        # Firmware version is everything after the bootloader version
+        fw_match = _FW_RE.search(details)
+        if fw_match:
+            firmware_version = fw_match.group(1).strip()
+
+    return DeviceInfo(
+        model=model,
+        hardware_version=hardware_version,
+        firmware_version=firmware_version,
+        bootloader_version=bootloader_version,
+        mac_address=None,
+        raw_response=response,
+    )
+
+
+def decode_mac_address(page: str) -> Optional[str]:
+    """Find the MAC address on the device's root web page.
+
+    Returns:
+        First MAC address on the page (e.g. "0C:73:EB:B0:9E:5C"), or None
+    """
+    match = _MAC_RE.search(page)
+    return match.group(0) if match else None
+
+
+# Batch decoders
+
+
+class StatusBatch:
+    """Column-oriented result of decoding many $A5 responses.
+
+    Entry i holds the i-th response. Responses that failed to decode have
+    bitmask 0, no outlets, NaN current and their ParseError in ``errors``.
+
+    Example:
+        >>> batch = decode_status_batch([b"$A0,10101,2.50,25", b"$AF"])
+        >>> list(batch.currents)
+        [2.5, nan]
+        >>> batch.outlet_states(1)
+        [True, None]
+    """
+
+    __slots__ = ("bitmasks", "num_outlets", "currents", "temperatures", "errors")
+
+    def __init__(self):
+        """Initialize an empty batch."""
+        self.bitmasks = array("Q")
+        self.num_outlets = array("B")
+        self.currents = array("d")
+        self.temperatures: list[Optional[str]] = []
+        self.errors: dict[int, ParseError] = {}
+
+    def __len__(self) -> int:
+        """Number of responses in the batch."""
+        return len(self.bitmasks)
+
+    def status(self, index: int) -> Optional[CompactStatus]:
+        """Get one entry as a CompactStatus (None if it failed to decode)."""
+        if index in self.errors:
+            return None
+        return CompactStatus(
+            self.bitmasks[index],
+            self.num_outlets[index],
+            self.currents[index],
+            self.temperatures[index],
+        )
+
+    def outlet_states(self, outlet_number: int) -> list[Optional[bool]]:
+        """Get one outlet's state across the batch.
+
+        Entries that failed to decode or have no such outlet give None.
+        """
+        shift = outlet_number - 1
+        return [
+            bool(bitmask >> shift & 1) if outlet_number <= count else None
+            for bitmask, count in zip(self.bitmasks, self.num_outlets, strict=True)
+        ]
+
+    def total_current(self) -> float:
+        """Sum of the current of every decoded entry in Amps."""
+        return math.fsum(c for c in self.currents if not math.isnan(c))
+
+
+def decode_status_batch(responses: Iterable[Response]) -> StatusBatch:
+    """Decode many $A5 responses into column arrays.
+
+    Failures don't stop the batch; they are collected in ``errors``.
+
+    Args:
+        responses: Raw responses
+
+    Returns:
+        StatusBatch with one entry per response
+    """
+    batch = StatusBatch()
+    bitmasks = batch.bitmasks
+    num_outlets = batch.num_outlets
+    currents = batch.currents
+    temperatures = batch.temperatures
+
+    for index, response in enumerate(responses):
+        try:
+            bitmask, count, current, temperature = parse_status_bytes(response)
+            if count > _MAX_BATCH_OUTLETS:
+                raise ParseError(
+                    _as_bytes(response).decode("latin-1"),
+                    f"More than {_MAX_BATCH_OUTLETS} outlets",
+                )
+        except ParseError as e:
+            batch.errors[index] = e
+            bitmask, count, current, temperature = 0, 0, math.nan, None
+        bitmasks.append(bitmask)
+        num_outlets.append(count)
+        currents.append(current)
+        temperatures.append(temperature)
+
+    return batch
+
+
+def decode_ack_batch(responses: Iterable[Response]) -> list[bool]:
+    """Decode many command acknowledgements."""
+    return [decode_ack(response) for response in responses]
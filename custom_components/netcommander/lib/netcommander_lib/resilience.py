@@ -0,0 +1,189 @@
+"""Retry and circuit breaker policies for netCommander API client.
+
+Retries cover transient network failures (a dropped packet, a connection
+reset) and apply only to idempotent commands: $A5 and $A8 read state and
+$A3 sets an explicit state, so sending them twice is harmless. rly toggles
+an outlet, so a repeat would undo it; it is never retried.
+
+The circuit breaker is shared by every client of a device. After a run of
+consecutive connection failures it opens and requests fail immediately
+with CircuitOpenError instead of each waiting out the timeout. Once the
+reset timeout has passed a single probe request is let through; success
+closes the circuit, failure keeps it open for another period.
+"""
+
+import logging
+import random
+import time
+import weakref
+from typing import Callable
+
+from .exceptions import CircuitOpenError
+from .const import (
+    CMD_GET_STATUS,
+    CMD_GET_INFO,
+    CMD_SET_OUTLET,
+    DEFAULT_FAILURE_THRESHOLD,
+    DEFAULT_RESET_TIMEOUT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Commands that may be sent again when the outcome of an attempt is unknown
+IDEMPOTENT_COMMANDS = (CMD_GET_STATUS, CMD_GET_INFO, CMD_SET_OUTLET)
+
+# Circuit breaker states
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+def is_idempotent(command: str) -> bool:
+    """Check if a command is safe to retry."""
+    return command.split(" ", 1)[0] in IDEMPOTENT_COMMANDS
+
+
+def backoff_delay(attempt: int, base: float, maximum: float) -> float:
+    """Get a jittered exponential backoff delay ("full jitter").
+
+    Args:
+        attempt: Retry number, starting at 0
+        base: Delay ceiling for the first retry in seconds
+        maximum: Upper bound for the delay ceiling in seconds
+
+    Returns:
+        Random delay between 0 and min(maximum, base * 2**attempt)
+    """
+    return random.uniform(0, min(maximum, base * 2**attempt))
+
+
+class CircuitBreaker:
+    """Per-device circuit breaker.
+
+    Example:
+        >>> breaker = CircuitBreaker("192.168.1.100", failure_threshold=3)
+        >>> breaker.before_request()  # Raises CircuitOpenError while open
+        >>> breaker.record_failure()
+    """
+
+    def __init__(
+        self,
+        host: str,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the breaker.
+
+        Args:
+            host: Device the breaker protects (used in errors)
+            failure_threshold: Consecutive connection failures that open the
+                circuit (0 disables the breaker)
+            reset_timeout: Seconds to stay open before probing the device
+            clock: Monotonic time source
+        """
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+
+        self._state = STATE_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+
+    @property
+    def state(self) -> str:
+        """Current state: closed, open or half_open (probe allowed/running)."""
+        if (
+            self._state == STATE_OPEN
+            and self._clock() - self._opened_at >= self.reset_timeout
+        ):
+            return STATE_HALF_OPEN
+        return self._state
+
+    @property
+    def failures(self) -> int:
+        """Consecutive connection failures seen."""
+        return self._failures
+
+    def before_request(self) -> None:
+        """Check whether a request may go to the device.
+
+        Raises:
+            CircuitOpenError: Device is known to be down
+        """
+        if not self.failure_threshold or self._state == STATE_CLOSED:
+            return
+
+        now = self._clock()
+        retry_after = self._opened_at + self.reset_timeout - now
+        if retry_after > 0:
+            raise CircuitOpenError(self.host, retry_after)
+
+        # Reset timeout elapsed: let one probe through and hold everyone else
+        # off for another period. If the probe never reports back (e.g. it
+        # was cancelled) the next caller after that period probes instead.
+        self._state = STATE_HALF_OPEN
+        self._opened_at = now
+        _LOGGER.debug("Circuit for %s half-open, probing device", self.host)
+
+    def record_success(self) -> None:
+        """Record that the device answered."""
+        if self._state != STATE_CLOSED:
+            _LOGGER.info("Circuit for %s closed, device is reachable", self.host)
+        self._state = STATE_CLOSED
+        self._failures = 0
+
+    def record_failure(self) -> None:
+        """Record a connection failure."""
+        self._failures += 1
+
+        if not self.failure_threshold:
+            return
+        if self._state == STATE_CLOSED:
+            if self._failures < self.failure_threshold:
+                return
+            _LOGGER.warning(
+                "Circuit for %s opened after %d failures, retrying in %.0fs",
+                self.host,
+                self._failures,
+                self.reset_timeout,
+            )
+
+        # Opening, a failed probe, or a late failure while open
+        self._state = STATE_OPEN
+        self._opened_at = self._clock()
+
+
+# One breaker per device, shared by every client in the process
+_BREAKERS: "weakref.WeakValueDictionary[tuple[str, int], CircuitBreaker]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def get_circuit_breaker(
+    host: str,
+    port: int,
+    failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+    reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+) -> CircuitBreaker:
+    """Get the shared circuit breaker for a device, creating it if needed.
+
+    The first caller for a device decides the thresholds; later callers
+    share the existing breaker as is.
+
+    Args:
+        host: Device IP address or hostname
+        port: Device port
+        failure_threshold: Consecutive failures that open the circuit
+        reset_timeout: Seconds to stay open before probing
+
+    Returns:
+        CircuitBreaker shared by all clients of this device
+    """
+    key = (host, port)
+    breaker = _BREAKERS.get(key)
+    if breaker is None:
+        breaker = CircuitBreaker(host, failure_threshold, reset_timeout)
+        _BREAKERS[key] = breaker
+    return breaker
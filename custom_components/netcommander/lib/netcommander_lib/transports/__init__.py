@@ -0,0 +1,35 @@
+"""Transports for reaching netCommander devices.
+
+A transport moves one command to the device and returns the raw response.
+NetCommanderClient accepts a transport instance or a URL:
+
+- ``http://host[:port]``: aiohttp session (default)
+- ``http+stream://host[:port]``: minimal HTTP/1.0 over asyncio streams
+- ``telnet://host[:port]``: persistent Telnet session
+- ``serial:///dev/ttyACM0[?baudrate=9600]``: serial console
+- ``replay://path/to/recording.jsonl``: recorded session
+"""
+
+from .base import (
+    Transport,
+    available_schemes,
+    create_transport,
+    register_transport,
+)
+from .http import AiohttpTransport, StreamHttpTransport
+from .replay import RecordingTransport, ReplayTransport
+from .serial import SerialTransport
+from .telnet import TelnetTransport
+
+__all__ = [
+    "Transport",
+    "available_schemes",
+    "create_transport",
+    "register_transport",
+    "AiohttpTransport",
+    "RecordingTransport",
+    "ReplayTransport",
+    "SerialTransport",
+    "StreamHttpTransport",
+    "TelnetTransport",
+]
@@ -0,0 +1,151 @@
+"""Transport interface and URL scheme registry."""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+from urllib.parse import SplitResult, parse_qs, unquote, urlsplit
+
+from ..rtt import AdaptiveTimeouts
+from ..exceptions import CommandError
+from ..const import DEFAULT_TIMEOUT
+
+
+class Transport(ABC):
+    """Way of reaching a device: a command goes in, response bytes come out.
+
+    NetCommanderClient keeps parsing, validation, caching, scheduling and
+    retries; a transport only moves one command and its response. Transports
+    are selected by URL scheme with create_transport(), and new ones are
+    added with register_transport().
+    """
+
+    #: URL scheme the transport is registered under
+    scheme: str = ""
+
+    @classmethod
+    def from_url(
+        cls,
+        url: SplitResult,
+        username: str,
+        password: str,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> "Transport":
+        """Create a transport from a parsed URL.
+
+        Args:
+            url: Parsed transport URL
+            username: Username (unless given in the URL)
+            password: Password (unless given in the URL)
+            timeout: Request timeout ceiling in seconds
+
+        Raises:
+            NotImplementedError: Transport cannot be created from a URL
+        """
+        raise NotImplementedError(f"{cls.__name__} cannot be created from a URL")
+
+    @abstractmethod
+    async def send_command(
+        self, command: str, timeouts: Optional[AdaptiveTimeouts] = None
+    ) -> bytes:
+        """Send a command and return the raw response.
+
+        Args:
+            command: Command string (e.g., "$A5", "$A3 1 1", "rly=0")
+            timeouts: Adaptive timeouts to use and update (default: the
+                transport's fixed timeout)
+
+        Returns:
+            Response bytes; surrounding whitespace is stripped by the client
+
+        Raises:
+            NetCommanderConnectionError: Cannot reach device
+            AuthenticationError: Invalid credentials
+            CommandError: Command cannot be sent over this transport
+        """
+
+    async def get_page(self, path: str = "/") -> bytes:
+        """Fetch a page from the device's web interface.
+
+        Raises:
+            CommandError: Transport has no web interface (default)
+        """
+        raise CommandError(f"GET {path}", f"Not available over {self.scheme}")
+
+    async def open(self) -> None:
+        """Prepare resources before first use (optional)."""
+        return None
+
+    async def close(self) -> None:
+        """Release resources (optional)."""
+        return None
+
+
+_REGISTRY: dict[str, type[Transport]] = {}
+
+
+def register_transport(transport: type[Transport]) -> type[Transport]:
+    """Register a transport class under its URL scheme.
+
+    Usable as a class decorator.
+    """
+    _REGISTRY[transport.scheme] = transport
+    return transport
+
+
+def create_transport(
+    url: str,
+    username: str = "admin",
+    password: str = "admin",
+    timeout: float = DEFAULT_TIMEOUT,
+) -> Transport:
+    """Create a transport from a URL.
+
+    Example:
+        >>> create_transport("telnet://192.168.1.100", "admin", "admin")
+        >>> create_transport("serial:///dev/ttyACM0?baudrate=9600")
+
+    Args:
+        url: Transport URL; credentials in the URL take precedence
+        username: Username (unless given in the URL)
+        password: Password (unless given in the URL)
+        timeout: Request timeout ceiling in seconds
+
+    Returns:
+        Transport for the URL's scheme
+
+    Raises:
+        ValueError: Unknown scheme
+    """
+    parsed = urlsplit(url)
+    transport = _REGISTRY.get(parsed.scheme.lower())
+    if transport is None:
+        raise ValueError(
+            f"Unknown transport scheme {parsed.scheme!r} "
+            f"(available: {', '.join(sorted(_REGISTRY))})"
+        )
+
+    if parsed.username is not None:
+        username = unquote(parsed.username)
+    if parsed.password is not None:
+        password = unquote(parsed.password)
+    return transport.from_url(parsed, username, password, timeout)
+
+
+def host_from_url(url: SplitResult) -> str:
+    """Get the host of a transport URL.
+
+    Raises:
+        ValueError: URL has no host
+    """
+    if not url.hostname:
+        raise ValueError(f"Transport URL {url.geturl()!r} has no host")
+    return url.hostname
+
+
+def available_schemes() -> list[str]:
+    """Get the registered URL schemes."""
+    return sorted(_REGISTRY)
+
+
+def url_options(url: SplitResult) -> dict[str, str]:
+    """Get the query options of a transport URL (last value wins)."""
+    return {key: values[-1] for key, values in parse_qs(url.query).items()}
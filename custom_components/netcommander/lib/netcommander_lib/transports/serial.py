@@ -0,0 +1,324 @@
+"""Serial console transport for netCommander devices."""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Optional
+from urllib.parse import SplitResult
+
+try:
+    import termios
+
+    HAS_TERMIOS = True
+except ImportError:  # Not available on Windows
+    HAS_TERMIOS = False
+
+from ..rtt import AdaptiveTimeouts
+from ..protocol import decode_ack, extract_response
+from ..exceptions import (
+    AuthenticationError,
+    NetCommanderConnectionError,
+    NetCommanderTimeoutError,
+)
+from ..const import (
+    CMD_LOGIN,
+    DEFAULT_SERIAL_BAUDRATE,
+    DEFAULT_SERIAL_DEVICE,
+    DEFAULT_TIMEOUT,
+)
+from .base import Transport, register_transport, url_options
+from .telnet import translate_command
+
+_LOGGER = logging.getLogger(__name__)
+
+# Longest line we accept from the device before giving up on framing
+MAX_LINE_SIZE = 4096
+
+
+@register_transport
+class SerialTransport(Transport):
+    """Transport over the device's USB/RS-232 serial console.
+
+    The console is the out-of-band path that keeps working when the
+    management network is down. The port is opened in raw mode at
+    9600-8-N-1 without flow control (see doc/ttyACM.md) and driven through
+    the event loop with non-blocking reads and writes, so slow serial I/O
+    never blocks other tasks. Commands use the same syntax as the Telnet
+    interface (``$A3 1 1`` becomes ``$A3,1,1``) and concurrent callers take
+    turns on the port, one command at a time. If the port goes away (e.g.
+    the USB cable is replugged) it is reopened on the next command.
+
+    The rly toggle and web pages are HTTP-only and raise CommandError.
+    Selected with ``serial:///dev/ttyACM0[?baudrate=9600]``.
+
+    Example:
+        >>> transport = SerialTransport("/dev/ttyACM0")
+        >>> async with NetCommanderClient(
+        ...     "192.168.1.100", "admin", "admin", transport=transport
+        ... ) as client:
+        ...     status = await client.get_status()
+    """
+
+    scheme = "serial"
+
+    def __init__(
+        self,
+        device: str = DEFAULT_SERIAL_DEVICE,
+        baudrate: int = DEFAULT_SERIAL_BAUDRATE,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        """Initialize the transport.
+
+        Args:
+            device: Serial device path (default: /dev/ttyACM0)
+            baudrate: Line speed (default: 9600)
+            username: Login username; the console accepts commands without
+                logging in, so by default no $A1 login is sent
+            password: Login password
+            timeout: Command timeout in seconds when no adaptive timeouts
+                are given (default: 10)
+
+        Raises:
+            ValueError: Unsupported baud rate
+            RuntimeError: Platform has no termios support
+        """
+        if not HAS_TERMIOS:
+            raise RuntimeError("Serial transport requires a POSIX platform")
+
+        self.device = device
+        self.baudrate = baudrate
+        self.username = username
+        self.timeout = timeout
+
+        self._speed = getattr(termios, f"B{baudrate}", None)
+        if self._speed is None:
+            raise ValueError(f"Unsupported baud rate: {baudrate}")
+
+        self._login = (
+            f"{CMD_LOGIN},{username},{password}\r\n".encode("latin-1")
+            if username is not None
+            else None
+        )
+        self._fd: Optional[int] = None
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def from_url(
+        cls,
+        url: SplitResult,
+        username: str,
+        password: str,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> "SerialTransport":
+        """Create a transport from ``serial:///dev/ttyACM0[?baudrate=9600]``.
+
+        The console needs no login, so credentials are only sent when they
+        are part of the URL (``serial://admin:admin@/dev/ttyACM0``).
+        """
+        options = url_options(url)
+        return cls(
+            url.path or DEFAULT_SERIAL_DEVICE,
+            int(options.get("baudrate", DEFAULT_SERIAL_BAUDRATE)),
+            url.username,
+            url.password,
+            timeout,
+        )
+
+    @property
+    def connected(self) -> bool:
+        """Whether the port is open."""
+        return self._fd is not None
+
+    async def send_command(
+        self, command: str, timeouts: Optional[AdaptiveTimeouts] = None
+    ) -> bytes:
+        """Send a command and return the device's response line.
+
+        Args:
+            command: Command string (e.g., "$A5", "$A3 1 1")
+            timeouts: Adaptive timeouts, updated with this command's
+                round-trip time (default: fixed transport timeout)
+
+        Returns:
+            Response line bytes (e.g. b"$A0,10101,2.50,25")
+
+        Raises:
+            NetCommanderConnectionError: Port unavailable or no response
+            AuthenticationError: Login rejected
+            CommandError: Command has no serial equivalent
+        """
+        line = translate_command(command)
+
+        async with self._lock:
+            if self._fd is None:
+                await self._open()
+
+            timeout = timeouts.read_timeout() if timeouts else self.timeout
+            started = time.monotonic()
+            try:
+                response = await asyncio.wait_for(self._exchange(line), timeout)
+            except asyncio.TimeoutError:
+                if timeouts:
+                    timeouts.read.backoff()
+                self._close_port()
+                raise NetCommanderTimeoutError(
+                    self.device, f"No response after {timeout:.2f}s"
+                )
+            except (
+                asyncio.IncompleteReadError,
+                asyncio.LimitOverrunError,
+                OSError,
+            ) as e:
+                self._close_port()
+                raise NetCommanderConnectionError(
+                    self.device, f"Serial port error: {e!r}"
+                )
+            except asyncio.CancelledError:
+                # The response may still arrive; don't let it be read as the
+                # answer to the next command
+                self._close_port()
+                raise
+
+            if timeouts:
+                timeouts.read.observe(time.monotonic() - started)
+            return response
+
+    async def close(self) -> None:
+        """Close the port."""
+        self._close_port()
+
+    async def _open(self) -> None:
+        """Open and configure the port, and log in if credentials are set."""
+        try:
+            fd = os.open(self.device, os.O_RDWR | os.O_NOCTTY | os.O_NONBLOCK)
+        except OSError as e:
+            raise NetCommanderConnectionError(
+                self.device, f"Cannot open serial port: {e.strerror}"
+            )
+
+        try:
+            self._configure(fd)
+        except termios.error as e:
+            os.close(fd)
+            raise NetCommanderConnectionError(
+                self.device, f"Cannot configure serial port: {e}"
+            )
+
+        self._fd = fd
+        self._reader = asyncio.StreamReader(limit=MAX_LINE_SIZE)
+        asyncio.get_running_loop().add_reader(
+            fd, self._on_readable, fd, self._reader
+        )
+        _LOGGER.debug("Opened serial port %s at %d baud", self.device, self.baudrate)
+
+        if self._login is None:
+            return
+        try:
+            response = await asyncio.wait_for(
+                self._exchange(self._login), self.timeout
+            )
+        except (
+            asyncio.TimeoutError,
+            asyncio.IncompleteReadError,
+            asyncio.LimitOverrunError,
+            OSError,
+        ) as e:
+            self._close_port()
+            raise NetCommanderConnectionError(
+                self.device, f"Serial login failed: {e!r}"
+            )
+        if not decode_ack(response):
+            self._close_port()
+            raise AuthenticationError(
+                f"Authentication failed for {self.username}@{self.device}"
+            )
+
+    def _configure(self, fd: int) -> None:
+        """Put the port in raw 8-N-1 mode without flow control.
+
+        Equivalent to: stty 9600 cs8 -cstopb -parenb -crtscts -ixon -ixoff
+        """
+        attrs = termios.tcgetattr(fd)
+        attrs[0] = 0  # iflag: no XON/XOFF, no CR/NL translation
+        attrs[1] = 0  # oflag: no output processing
+        attrs[2] = termios.CS8 | termios.CREAD | termios.CLOCAL  # cflag
+        attrs[3] = 0  # lflag: no echo, no canonical mode, no signals
+        attrs[4] = attrs[5] = self._speed
+        attrs[6][termios.VMIN] = 0
+        attrs[6][termios.VTIME] = 0
+        termios.tcsetattr(fd, termios.TCSANOW, attrs)
+        termios.tcflush(fd, termios.TCIOFLUSH)
+
+    def _on_readable(self, fd: int, reader: asyncio.StreamReader) -> None:
+        """Feed available port data to the reader (event loop callback)."""
+        try:
+            data = os.read(fd, MAX_LINE_SIZE)
+        except BlockingIOError:
+            return
+        except OSError as e:
+            # Port went away (e.g. USB unplugged)
+            asyncio.get_running_loop().remove_reader(fd)
+            reader.set_exception(e)
+            return
+        if not data:
+            # End of file (hangup): the fd stays readable, so stop watching
+            # it instead of being called again in a busy loop
+            asyncio.get_running_loop().remove_reader(fd)
+            reader.feed_eof()
+            return
+        reader.feed_data(data)
+
+    def _close_port(self) -> None:
+        """Stop watching and close the port."""
+        if self._fd is None:
+            return
+        asyncio.get_running_loop().remove_reader(self._fd)
+        try:
+            os.close(self._fd)
+        except OSError:
+            pass
+        self._fd = None
+        self._reader = None
+
+    def _port(self) -> tuple[int, asyncio.StreamReader]:
+        """Get the open port's file descriptor and reader.
+
+        Raises:
+            ConnectionError: Port was closed
+        """
+        if self._fd is None or self._reader is None:
+            raise ConnectionError("Serial port closed")
+        return self._fd, self._reader
+
+    async def _exchange(self, line: bytes) -> bytes:
+        """Write a command line and read its response line."""
+        fd, reader = self._port()
+        await self._write(fd, line)
+        while True:
+            data = await reader.readuntil(b"\n")
+            response = extract_response(data)
+            if response is not None:
+                return response
+
+    async def _write(self, fd: int, data: bytes) -> None:
+        """Write all data without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        view = memoryview(data)
+        while view:
+            try:
+                written = os.write(fd, view)
+            except BlockingIOError:
+                written = 0
+            view = view[written:]
+            if view:
+                # Output buffer full at serial speed; wait until writable
+                ready = loop.create_future()
+                loop.add_writer(fd, ready.set_result, None)
+                try:
+                    await ready
+                finally:
+                    loop.remove_writer(fd)
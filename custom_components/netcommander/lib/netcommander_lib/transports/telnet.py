@@ -0,0 +1,345 @@
+"""Telnet transport for netCommander devices."""
+
+import asyncio
+import logging
+import time
+from typing import Optional
+from urllib.parse import SplitResult
+
+from ..rtt import AdaptiveTimeouts
+from ..protocol import decode_ack, extract_response
+from ..exceptions import (
+    AuthenticationError,
+    CommandError,
+    NetCommanderConnectionError,
+    NetCommanderTimeoutError,
+)
+from ..const import (
+    CMD_LOGIN,
+    CMD_LOGOUT,
+    DEFAULT_TELNET_PORT,
+    DEFAULT_TIMEOUT,
+)
+
+from .base import Transport, host_from_url, register_transport
+
+_LOGGER = logging.getLogger(__name__)
+
+# Telnet option negotiation (RFC 854)
+IAC = 255
+DONT = 254
+DO = 253
+WONT = 252
+WILL = 251
+SB = 250
+SE = 240
+
+# Longest line we accept from the device before giving up on framing
+MAX_LINE_SIZE = 4096
+
+
+@register_transport
+class TelnetTransport(Transport):
+    """Transport using one persistent Telnet session.
+
+    Logs in once with ``$A1,user,pass`` and sends commands over the open
+    stream, saving the TCP handshake and authentication check that HTTP pays
+    on every command. Commands are translated to the Telnet syntax
+    (``$A3 1 1`` becomes ``$A3,1,1``) and one command runs at a time on the
+    session. A dropped session is reopened on the next command.
+
+    The rly toggle and web pages are HTTP-only and raise CommandError.
+    Selected with ``telnet://host[:port]``.
+
+    Example:
+        >>> transport = TelnetTransport("192.168.1.100", 23, "admin", "admin")
+        >>> async with NetCommanderClient(
+        ...     "192.168.1.100", "admin", "admin", transport=transport
+        ... ) as client:
+        ...     status = await client.get_status()
+    """
+
+    scheme = "telnet"
+
+    def __init__(
+        self,
+        host: str,
+        port: int = DEFAULT_TELNET_PORT,
+        username: str = "admin",
+        password: str = "admin",
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        """Initialize the transport.
+
+        Args:
+            host: Device IP address or hostname
+            port: Telnet port (default: 23)
+            username: Login username
+            password: Login password
+            timeout: Connect/login and command timeout in seconds when no
+                adaptive timeouts are given (default: 10)
+        """
+        self.host = host
+        self.port = port
+        self.username = username
+        self.timeout = timeout
+
+        self._login = f"{CMD_LOGIN},{username},{password}\r\n".encode("latin-1")
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def from_url(
+        cls,
+        url: SplitResult,
+        username: str,
+        password: str,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> "TelnetTransport":
+        """Create a transport from ``telnet://host[:port]``."""
+        return cls(
+            host_from_url(url),
+            url.port or DEFAULT_TELNET_PORT,
+            username,
+            password,
+            timeout,
+        )
+
+    @property
+    def connected(self) -> bool:
+        """Whether a logged-in session is open."""
+        return (
+            self._reader is not None
+            and self._writer is not None
+            and not self._writer.is_closing()
+            and not self._reader.at_eof()
+        )
+
+    async def send_command(
+        self, command: str, timeouts: Optional[AdaptiveTimeouts] = None
+    ) -> bytes:
+        """Send a command and return the device's response line.
+
+        Args:
+            command: Command string (e.g., "$A5", "$A3 1 1")
+            timeouts: Adaptive connect/read timeouts, updated with this
+                command's timings (default: fixed transport timeout)
+
+        Returns:
+            Response line bytes (e.g. b"$A0,10101,2.50,25")
+
+        Raises:
+            NetCommanderConnectionError: Cannot reach device
+            AuthenticationError: Login rejected
+            CommandError: Command has no Telnet equivalent
+        """
+        line = translate_command(command)
+
+        async with self._lock:
+            reconnected = False
+            while True:
+                fresh = not self.connected
+                if fresh:
+                    await self._connect(timeouts)
+                try:
+                    return await self._exchange(line, timeouts)
+                except (asyncio.IncompleteReadError, ConnectionError) as e:
+                    self._drop()
+                    # A session reused after idling may have been dropped by
+                    # the device; reconnect and resend once. Only $A commands
+                    # get here and they are idempotent.
+                    if fresh or reconnected:
+                        raise NetCommanderConnectionError(
+                            self.host, f"Telnet session lost: {e!r}"
+                        )
+                    _LOGGER.debug(
+                        "Telnet session to %s dropped, reconnecting", self.host
+                    )
+                    reconnected = True
+                except asyncio.TimeoutError:
+                    self._drop()
+                    raise NetCommanderTimeoutError(
+                        self.host, "Telnet command timed out"
+                    )
+                except asyncio.LimitOverrunError:
+                    self._drop()
+                    raise NetCommanderConnectionError(
+                        self.host, "Response too large"
+                    )
+                except OSError as e:
+                    self._drop()
+                    raise NetCommanderConnectionError(
+                        self.host, f"Connection failed: {e}"
+                    )
+                except asyncio.CancelledError:
+                    # The response may still arrive; don't let it be read
+                    # as the answer to the next command
+                    self._drop()
+                    raise
+
+    async def close(self) -> None:
+        """Log out and close the session."""
+        if self._writer is None:
+            return
+        try:
+            self._writer.write(CMD_LOGOUT.encode("ascii") + b"\r\n")
+            self._writer.close()
+            await self._writer.wait_closed()
+        except (OSError, ConnectionError):
+            pass
+        finally:
+            self._reader = None
+            self._writer = None
+
+    def _drop(self) -> None:
+        """Forget a broken session."""
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = None
+        self._writer = None
+
+    async def _connect(self, timeouts: Optional[AdaptiveTimeouts]) -> None:
+        """Open the session and log in."""
+        timeout = timeouts.connect_timeout() if timeouts else self.timeout
+        started = time.monotonic()
+        try:
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port, limit=MAX_LINE_SIZE),
+                timeout,
+            )
+        except asyncio.TimeoutError:
+            if timeouts:
+                timeouts.connect.backoff()
+            raise NetCommanderTimeoutError(
+                self.host, f"Connect timeout after {timeout:.2f}s"
+            )
+        except OSError as e:
+            raise NetCommanderConnectionError(self.host, f"Connection failed: {e}")
+        if timeouts:
+            timeouts.connect.observe(time.monotonic() - started)
+
+        try:
+            response = await self._exchange(self._login, None)
+        except (
+            asyncio.TimeoutError,
+            asyncio.IncompleteReadError,
+            asyncio.LimitOverrunError,
+            OSError,
+        ) as e:
+            self._drop()
+            raise NetCommanderConnectionError(
+                self.host, f"Telnet login failed: {e!r}"
+            )
+        if not decode_ack(response):
+            self._drop()
+            raise AuthenticationError(
+                f"Authentication failed for {self.username}@{self.host}"
+            )
+        _LOGGER.debug("Telnet session to %s:%d logged in", self.host, self.port)
+
+    async def _exchange(
+        self, line: bytes, timeouts: Optional[AdaptiveTimeouts]
+    ) -> bytes:
+        """Write a command line and read its response line."""
+        reader, writer = self._session()
+        writer.write(line)
+        if timeouts is None:
+            return await asyncio.wait_for(
+                self._read_response(reader, writer), self.timeout
+            )
+
+        timeout = timeouts.read_timeout()
+        started = time.monotonic()
+        try:
+            response = await asyncio.wait_for(
+                self._read_response(reader, writer), timeout
+            )
+        except asyncio.TimeoutError:
+            timeouts.read.backoff()
+            raise
+        timeouts.read.observe(time.monotonic() - started)
+        return response
+
+    def _session(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """Get the open session's streams.
+
+        Raises:
+            ConnectionError: Session was dropped
+        """
+        if self._reader is None or self._writer is None:
+            raise ConnectionError("Telnet session closed")
+        return self._reader, self._writer
+
+    async def _read_response(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> bytes:
+        """Read lines until a $A0/$AF response, skipping banners and echo."""
+        while True:
+            data, reply = strip_telnet_options(await reader.readuntil(b"\n"))
+            if reply:
+                writer.write(reply)
+            response = extract_response(data)
+            if response is not None:
+                return response
+
+
+def translate_command(command: str) -> bytes:
+    """Translate an HTTP-style command to a Telnet command line.
+
+    Args:
+        command: Command as sent over HTTP (e.g. "$A3 1 1")
+
+    Returns:
+        Telnet command line (e.g. b"$A3,1,1\\r\\n")
+
+    Raises:
+        CommandError: Command has no Telnet equivalent
+    """
+    if not command.startswith("$A"):
+        raise CommandError(command, "Not available over Telnet")
+    return ",".join(command.split()).encode("ascii") + b"\r\n"
+
+
+def strip_telnet_options(data: bytes) -> tuple[bytes, bytes]:
+    """Remove Telnet option negotiation from received data.
+
+    Every option the device offers or requests is refused, which keeps the
+    session in plain NVT mode.
+
+    Args:
+        data: Bytes received from the device
+
+    Returns:
+        Tuple of (data without negotiation, reply to send back)
+    """
+    if IAC not in data:
+        return data, b""
+
+    out = bytearray()
+    reply = bytearray()
+    i = 0
+    while i < len(data):
+        byte = data[i]
+        if byte != IAC or i + 1 >= len(data):
+            out.append(byte)
+            i += 1
+            continue
+
+        verb = data[i + 1]
+        if verb == IAC:
+            out.append(IAC)
+            i += 2
+        elif verb in (DO, DONT, WILL, WONT) and i + 2 < len(data):
+            option = data[i + 2]
+            if verb == DO:
+                reply += bytes((IAC, WONT, option))
+            elif verb == WILL:
+                reply += bytes((IAC, DONT, option))
+            i += 3
+        elif verb == SB:
+            end = data.find(bytes((IAC, SE)), i + 2)
+            i = len(data) if end < 0 else end + 2
+        else:
+            i += 2
+    return bytes(out), bytes(reply)
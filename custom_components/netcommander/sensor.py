@@ -19,9 +19,9 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .lib.netcommander_lib import DeviceStatus
+from .lib.netcommander_lib import DeviceStatus, StatusHistory
 
-from .const import DOMAIN, MANUFACTURER
+from .const import DOMAIN, HISTORY_DURATION, MANUFACTURER, SHORT_WINDOW
 from .coordinator import NetCommanderCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -32,6 +32,8 @@ class NetCommanderSensorDescription(SensorEntityDescription):
     """Describes NetCommander sensor entity."""
 
     value_fn: Callable[[DeviceStatus], Any] | None = None
+    # Reads the coordinator's in-memory history instead of the latest status
+    history_fn: Callable[[StatusHistory], Any] | None = None
 
 
 SENSORS: tuple[NetCommanderSensorDescription, ...] = (
@@ -58,6 +60,40 @@ SENSORS: tuple[NetCommanderSensorDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda status: len(status.outlets_on),
     ),
+    NetCommanderSensorDescription(
+        key="current_average_5min",
+        name="Average Current (5 min)",
+        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+        history_fn=lambda history: history.mean(SHORT_WINDOW),
+    ),
+    NetCommanderSensorDescription(
+        key="current_peak_5min",
+        name="Peak Current (5 min)",
+        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+        history_fn=lambda history: history.peak(SHORT_WINDOW),
+    ),
+    NetCommanderSensorDescription(
+        key="current_average_1h",
+        name="Average Current (1 h)",
+        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        history_fn=lambda history: history.mean(HISTORY_DURATION),
+    ),
+    NetCommanderSensorDescription(
+        key="current_peak_1h",
+        name="Peak Current (1 h)",
+        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        history_fn=lambda history: history.peak(HISTORY_DURATION),
+    ),
 )
 
 # Diagnostic sensors (static values, don't depend on status updates)
@@ -143,6 +179,8 @@ class NetCommanderSensor(CoordinatorEntity[NetCommanderCoordinator], SensorEntit
     @property
     def native_value(self) -> Any:
         """Return the state of the sensor."""
+        if self.entity_description.history_fn:
+            return self.entity_description.history_fn(self.coordinator.history)
         if self.coordinator.data and self.entity_description.value_fn:
             return self.entity_description.value_fn(self.coordinator.data)
         return None
@@ -0,0 +1,327 @@
+"""Load generator behind ``netcommander bench``.
+
+Drives a workload of status reads, ``$A3`` sets, toggles or a mix of them
+against one or many devices through NetCommanderClient, so the numbers
+include the client's scheduler, transport and parsing, and reports
+throughput and latency percentiles per command type with the errors seen.
+
+Without a rate the load is closed-loop: ``concurrency`` workers each start
+the next command as soon as their previous one finishes. With a rate it is
+open-loop: commands are started on a fixed schedule, at most
+``concurrency`` at once, and latency is measured from the scheduled start,
+so time spent waiting behind a slow device is counted instead of hidden.
+"""
+
+import asyncio
+import itertools
+import math
+import random
+import time
+from array import array
+from collections import Counter
+from typing import Any, Mapping, Optional, Sequence
+
+from netcommander import NetCommanderClient
+from netcommander.exceptions import NetCommanderError
+
+WORKLOADS = ("status", "set", "toggle", "mixed")
+
+# Relative share of each command type in the mixed workload
+MIXED_WEIGHTS = {"status": 8, "set": 1, "toggle": 1}
+
+# Workload run when neither a duration nor a request count is given
+DEFAULT_BENCH_DURATION = 10.0
+
+PERCENTILES = (0.5, 0.95, 0.99)
+
+
+def percentile(ordered: Sequence[float], fraction: float) -> float:
+    """Get a percentile of sorted values (nearest rank).
+
+    Example:
+        >>> percentile([1.0, 2.0, 3.0, 4.0], 0.5)
+        2.0
+    """
+    if not ordered:
+        return math.nan
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+def read_hosts_file(path: str) -> list[str]:
+    """Read device names, one ``HOST[:PORT]`` per line.
+
+    Blank lines and lines starting with "#" are skipped, so the file
+    written by ``netcommander simulate --hosts-file`` can be used as is.
+    """
+    with open(path) as f:
+        return [
+            line.strip()
+            for line in f
+            if line.strip() and not line.lstrip().startswith("#")
+        ]
+
+
+class CommandStats:
+    """Latencies and errors of one command type."""
+
+    __slots__ = ("latencies", "errors")
+
+    def __init__(self):
+        """Initialize empty statistics."""
+        # Seconds per successful command
+        self.latencies = array("d")
+        # Error name → count
+        self.errors: Counter = Counter()
+
+    @property
+    def ok(self) -> int:
+        """Number of successful commands."""
+        return len(self.latencies)
+
+    @property
+    def failed(self) -> int:
+        """Number of failed commands."""
+        return sum(self.errors.values())
+
+    @property
+    def count(self) -> int:
+        """Number of commands run."""
+        return self.ok + self.failed
+
+    def merge(self, other: "CommandStats") -> None:
+        """Add another command type's results to these."""
+        self.latencies.extend(other.latencies)
+        self.errors.update(other.errors)
+
+    def summary(self, duration: float) -> dict:
+        """Summarize the results.
+
+        Args:
+            duration: Seconds the benchmark ran, for throughput
+
+        Returns:
+            Counts, successful commands per second, and latency percentiles
+            and maximum in seconds (None without successful commands)
+        """
+        ordered = sorted(self.latencies)
+        summary: dict[str, Any] = {
+            "requests": self.count,
+            "ok": self.ok,
+            "failed": self.failed,
+            "throughput": self.ok / duration if duration > 0 else 0.0,
+        }
+        for fraction in PERCENTILES:
+            summary[f"p{fraction * 100:g}"] = (
+                percentile(ordered, fraction) if ordered else None
+            )
+        summary["max"] = ordered[-1] if ordered else None
+        summary["errors"] = dict(self.errors.most_common())
+        return summary
+
+
+class BenchReport:
+    """Results of a benchmark run."""
+
+    def __init__(self, stats: Mapping[str, CommandStats], duration: float):
+        """Initialize the report.
+
+        Args:
+            stats: Statistics per command type
+            duration: Seconds from the first command start to the last result
+        """
+        self.stats = dict(stats)
+        self.duration = duration
+
+    @property
+    def total(self) -> CommandStats:
+        """Statistics of all command types together."""
+        total = CommandStats()
+        for stats in self.stats.values():
+            total.merge(stats)
+        return total
+
+    def to_dict(self) -> dict:
+        """Get the report as plain data (latencies in seconds)."""
+        return {
+            "duration": self.duration,
+            "commands": {
+                kind: stats.summary(self.duration)
+                for kind, stats in self.stats.items()
+            },
+            "total": self.total.summary(self.duration),
+        }
+
+
+class _Workload:
+    """Picks the device, command and arguments of each request."""
+
+    def __init__(
+        self,
+        clients: Mapping[str, NetCommanderClient],
+        workload: str,
+        outlets: Sequence[int],
+        rng: random.Random,
+    ):
+        if workload not in WORKLOADS:
+            raise ValueError(f"Unknown workload: {workload!r}")
+        self.clients = list(clients.values())
+        self.workload = workload
+        self.outlets = list(outlets)
+        self._random = rng
+        self._kinds = list(MIXED_WEIGHTS)
+        self._weights = list(itertools.accumulate(MIXED_WEIGHTS.values()))
+        # (client index, outlet) → state the next set command sends
+        self._next_state: dict[tuple[int, int], bool] = {}
+
+    def kind(self) -> str:
+        """Get the command type of the next request."""
+        if self.workload != "mixed":
+            return self.workload
+        return self._random.choices(self._kinds, cum_weights=self._weights)[0]
+
+    async def run(self, index: int, kind: str) -> bool:
+        """Run request number index; returns whether the device accepted it."""
+        device = index % len(self.clients)
+        client = self.clients[device]
+        if kind == "status":
+            await client.get_status_compact(force=True)
+            return True
+
+        outlet = self.outlets[index // len(self.clients) % len(self.outlets)]
+        if kind == "toggle":
+            return bool(await client.toggle_outlet(outlet))
+
+        # Alternate ON and OFF so every set changes the outlet
+        key = (device, outlet)
+        state = self._next_state.get(key, True)
+        self._next_state[key] = not state
+        return bool(await client.set_outlet(outlet, state))
+
+
+class _BenchRun:
+    """Starts the requests of one benchmark run and collects their results."""
+
+    def __init__(
+        self,
+        picker: _Workload,
+        requests: Optional[int],
+        duration: Optional[float],
+    ):
+        self.picker = picker
+        self.requests = requests
+        self.stats: dict[str, CommandStats] = {}
+        self._counter = itertools.count()
+        self.started = time.perf_counter()
+        self.deadline = self.started + duration if duration is not None else math.inf
+
+    def _next_index(self) -> Optional[int]:
+        """Get the next request number, or None once the run is over."""
+        index = next(self._counter)
+        if self.requests is not None and index >= self.requests:
+            return None
+        if time.perf_counter() >= self.deadline:
+            return None
+        return index
+
+    async def run_one(self, index: int, start: float) -> None:
+        """Run one request, timing it from start."""
+        kind = self.picker.kind()
+        kind_stats = self.stats.get(kind)
+        if kind_stats is None:
+            kind_stats = self.stats[kind] = CommandStats()
+        try:
+            accepted = await self.picker.run(index, kind)
+        except NetCommanderError as e:
+            kind_stats.errors[type(e).__name__] += 1
+            return
+        if accepted:
+            kind_stats.latencies.append(time.perf_counter() - start)
+        else:
+            kind_stats.errors["Rejected"] += 1
+
+    async def worker(self) -> None:
+        """Closed loop: start the next request when the previous one ends."""
+        while True:
+            index = self._next_index()
+            if index is None:
+                return
+            await self.run_one(index, time.perf_counter())
+
+    async def dispatch(self, rate: float, concurrency: int) -> None:
+        """Open loop: start requests on a fixed schedule."""
+        slots = asyncio.Semaphore(concurrency)
+        running: set[asyncio.Task] = set()
+
+        def finished(task: asyncio.Task) -> None:
+            running.discard(task)
+            slots.release()
+
+        try:
+            for index in itertools.count():
+                scheduled = self.started + index / rate
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                if (self.requests is not None and index >= self.requests) or (
+                    scheduled >= self.deadline
+                ):
+                    break
+                # Waiting for a slot delays the start past its schedule;
+                # latency is still measured from the schedule
+                await slots.acquire()
+                task = asyncio.ensure_future(self.run_one(index, scheduled))
+                running.add(task)
+                task.add_done_callback(finished)
+            if running:
+                await asyncio.gather(*running)
+        finally:
+            for task in running:
+                task.cancel()
+
+
+async def run_bench(
+    clients: Mapping[str, NetCommanderClient],
+    workload: str = "status",
+    concurrency: int = 1,
+    rate: Optional[float] = None,
+    duration: Optional[float] = None,
+    requests: Optional[int] = None,
+    outlets: Sequence[int] = (1,),
+    rng: Optional[random.Random] = None,
+) -> BenchReport:
+    """Run a workload against devices.
+
+    Requests go to the devices in turn; set and toggle requests cycle
+    through the given outlets, and sets alternate between ON and OFF.
+
+    Args:
+        clients: Open clients of the devices, keyed by device name
+        workload: "status", "set", "toggle" or "mixed" (see MIXED_WEIGHTS)
+        concurrency: Requests in flight at once
+        rate: Requests started per second (default: closed loop, as fast as
+            the concurrency allows)
+        duration: Seconds to keep starting requests
+        requests: Number of requests to run (default: unlimited when a
+            duration is given, otherwise run for DEFAULT_BENCH_DURATION)
+        outlets: Outlets switched by set and toggle requests
+        rng: Random number generator for the mixed workload
+
+    Returns:
+        BenchReport with statistics per command type
+    """
+    if not clients:
+        raise ValueError("No devices to benchmark")
+    if not outlets:
+        raise ValueError("No outlets to switch")
+    if duration is None and requests is None:
+        duration = DEFAULT_BENCH_DURATION
+
+    picker = _Workload(clients, workload, outlets, rng or random.Random())
+    run = _BenchRun(picker, requests, duration)
+    if rate:
+        await run.dispatch(rate, concurrency)
+    else:
+        await asyncio.gather(*(run.worker() for _ in range(max(1, concurrency))))
+
+    return BenchReport(run.stats, time.perf_counter() - run.started)
@@ -16,6 +16,7 @@ import sys
 import os
 import json
 import yaml
+from contextlib import asynccontextmanager
 from typing import Optional
 
 import click
@@ -31,6 +32,21 @@ from netcommander.exceptions import NetCommanderError
 
 console = Console()
 
+# Commands that don't talk to a single configured device
+HOSTLESS_COMMANDS = {"simulate", "bench", "exporter", "record", "analyze"}
+
+
+def device_names(ctx, devices, hosts_file) -> list:
+    """Collect device names from --device, --hosts-file and --host."""
+    from .bench import read_hosts_file
+
+    names = list(devices)
+    if hosts_file:
+        names.extend(read_hosts_file(hosts_file))
+    if not names and ctx.obj["host"] and not ctx.obj["transport"]:
+        names.append(ctx.obj["host"])
+    return names
+
 
 def load_config() -> dict:
     """Load configuration from environment or .env file."""
@@ -48,12 +64,18 @@ def load_config() -> dict:
 @click.option("--host", envvar="NETCOMMANDER_HOST", help="Device IP address")
 @click.option("--username", "-u", envvar="NETCOMMANDER_USER", default="admin", help="Username")
 @click.option("--password", "-p", envvar="NETCOMMANDER_PASSWORD", help="Password")
+@click.option(
+    "--transport",
+    "-t",
+    envvar="NETCOMMANDER_TRANSPORT",
+    help="Transport URL (e.g. telnet://HOST, serial:///dev/ttyACM0; default: HTTP)",
+)
 @click.pass_context
-def cli(ctx, host, username, password):
+def cli(ctx, host, username, password, transport):
     """NetCommander CLI - Control Synaccess netCommander PDUs."""
     ctx.ensure_object(dict)
 
-    if not host:
+    if not host and not transport and ctx.invoked_subcommand not in HOSTLESS_COMMANDS:
         console.print("[red]Error: Host not specified. Use --host or set NETCOMMANDER_HOST[/red]")
         sys.exit(1)
 
@@ -61,9 +83,12 @@ def cli(ctx, host, username, password):
         console.print("[yellow]Warning: Using default password 'admin'[/yellow]")
         password = "admin"
 
-    ctx.obj["host"] = host
+    # The transport URL identifies the device when no host is given
+    # (e.g. serial console only)
+    ctx.obj["host"] = host or transport
     ctx.obj["username"] = username
     ctx.obj["password"] = password
+    ctx.obj["transport"] = transport
 
 
 @cli.command()
@@ -75,7 +100,8 @@ def status(ctx, output):
         async with NetCommanderClient(
             ctx.obj["host"],
             ctx.obj["username"],
-            ctx.obj["password"]
+            ctx.obj["password"],
+            transport=ctx.obj["transport"],
         ) as client:
             try:
                 device_status = await client.get_status()
@@ -134,7 +160,8 @@ def outlet(ctx, outlet_number, action):
         async with NetCommanderClient(
             ctx.obj["host"],
             ctx.obj["username"],
-            ctx.obj["password"]
+            ctx.obj["password"],
+            transport=ctx.obj["transport"],
         ) as client:
             try:
                 if action == "on":
@@ -156,20 +183,26 @@ def outlet(ctx, outlet_number, action):
 
 @cli.command()
 @click.argument("action", type=click.Choice(["on", "off"]))
+@click.option("--concurrency", "-c", default=1, type=click.IntRange(1, 8), help="Commands sent at once")
+@click.option("--stagger", default=0.0, type=click.FloatRange(0), help="Seconds between command starts")
 @click.pass_context
-def all(ctx, action):
+def all(ctx, action, concurrency, stagger):
     """Turn all outlets on or off.
 
     \b
     Examples:
         netcommander all on
         netcommander all off
+        netcommander all on --stagger 2
     """
     async def _all():
         async with NetCommanderClient(
             ctx.obj["host"],
             ctx.obj["username"],
-            ctx.obj["password"]
+            ctx.obj["password"],
+            transport=ctx.obj["transport"],
+            max_concurrency=concurrency,
+            command_stagger=stagger,
         ) as client:
             try:
                 if action == "on":
@@ -205,7 +238,8 @@ def monitor(ctx, interval):
         async with NetCommanderClient(
             ctx.obj["host"],
             ctx.obj["username"],
-            ctx.obj["password"]
+            ctx.obj["password"],
+            transport=ctx.obj["transport"],
         ) as client:
             try:
                 with Live(console=console, refresh_per_second=1) as live:
@@ -266,7 +300,8 @@ def info(ctx):
             async with NetCommanderClient(
                 ctx.obj["host"],
                 ctx.obj["username"],
-                ctx.obj["password"]
+                ctx.obj["password"],
+                transport=ctx.obj["transport"],
             ) as client:
                 # Get device info
                 device_info = await client.get_device_info()
@@ -312,6 +347,486 @@ def info(ctx):
     asyncio.run(_info())
 
 
+@cli.command()
+@click.option("--devices", "-n", default=1, type=click.IntRange(1), help="Number of simulated devices")
+@click.option("--port", default=0, type=click.IntRange(0, 65535), help="Port of the first device (default: any free ports)")
+@click.option("--bind", default="127.0.0.1", help="Address to listen on")
+@click.option("--outlets", default=5, type=click.IntRange(1, 64), help="Outlets per device")
+@click.option("--latency", default=0.0, type=click.FloatRange(0), help="Median response latency in seconds")
+@click.option("--latency-sigma", default=0.0, type=click.FloatRange(0), help="Log-normal spread of the latency (0: constant)")
+@click.option("--error-rate", default=0.0, type=click.FloatRange(0, 1), help="Fraction of commands answered with $AF")
+@click.option("--timeout-rate", default=0.0, type=click.FloatRange(0, 1), help="Fraction of requests that never get a response")
+@click.option("--overlap", default="drop", type=click.Choice(["drop", "queue", "allow"]), help="Handling of overlapping requests (drop: like the firmware)")
+@click.option("--hosts-file", type=click.Path(dir_okay=False, writable=True), help="Write the simulated devices as HOST:PORT lines")
+@click.pass_context
+def simulate(ctx, devices, port, bind, outlets, latency, latency_sigma, error_rate, timeout_rate, overlap, hosts_file):
+    """Serve simulated devices for testing and benchmarks."""
+    from netcommander.simulator import DeviceSimulator, lognormal_latency
+
+    async def _simulate():
+        async with DeviceSimulator(bind) as simulator:
+            simulated = await simulator.add_devices(
+                devices,
+                first_port=port,
+                num_outlets=outlets,
+                username=ctx.obj["username"],
+                password=ctx.obj["password"],
+                latency=(
+                    lognormal_latency(latency, latency_sigma)
+                    if latency and latency_sigma
+                    else latency
+                ),
+                error_rate=error_rate,
+                timeout_rate=timeout_rate,
+                overlap=overlap,
+            )
+            names = [f"{bind}:{device.port}" for device in simulated]
+            if hosts_file:
+                with open(hosts_file, "w") as f:
+                    f.write("\n".join(names) + "\n")
+                console.print(f"[green]Wrote {len(names)} devices to {hosts_file}[/green]")
+            if len(names) <= 10:
+                for name in names:
+                    console.print(f"  {name}")
+            else:
+                console.print(f"  {names[0]} ... {names[-1]}")
+            console.print(f"[bold]Simulating {len(names)} devices[/bold] (Ctrl+C to stop)")
+            await asyncio.Event().wait()
+
+    try:
+        asyncio.run(_simulate())
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Simulator stopped[/yellow]")
+    except OSError as e:
+        console.print(f"[red]Error: Cannot listen: {e}[/red]")
+        sys.exit(1)
+
+
+def bench_targets(ctx, devices, hosts_file) -> tuple:
+    """Get the device names or single transport to benchmark, or exit."""
+    if ctx.obj["transport"] and (devices or hosts_file):
+        console.print("[red]Error: --transport cannot be combined with --device or --hosts-file[/red]")
+        sys.exit(1)
+
+    names = device_names(ctx, devices, hosts_file)
+    transport = ctx.obj["transport"] if not names else None
+    if not names and not transport:
+        console.print("[red]Error: No devices. Use --host, --device or --hosts-file[/red]")
+        sys.exit(1)
+    return names, transport
+
+
+@asynccontextmanager
+async def bench_clients(ctx, names, transport, timeout, concurrency, per_host_concurrency, retries):
+    """Open the clients to benchmark, by device name."""
+    from netcommander import FleetClient
+
+    if transport:
+        async with NetCommanderClient(
+            ctx.obj["host"],
+            ctx.obj["username"],
+            ctx.obj["password"],
+            timeout=timeout,
+            transport=transport,
+            max_concurrency=per_host_concurrency,
+            retries=retries,
+        ) as client:
+            yield {ctx.obj["host"]: client}
+        return
+
+    async with FleetClient(
+        names,
+        ctx.obj["username"],
+        ctx.obj["password"],
+        timeout=timeout,
+        concurrency=concurrency,
+        per_host_concurrency=per_host_concurrency,
+        retries=retries,
+    ) as fleet:
+        yield {name: fleet.client(name) for name in fleet.devices}
+
+
+def print_bench_report(data, title):
+    """Print latency per command and the errors seen."""
+    table = Table(title=title, box=box.ROUNDED)
+    table.add_column("Command", style="cyan")
+    for column in ("Requests", "Errors", "Req/s", "p50 ms", "p95 ms", "p99 ms", "Max ms"):
+        table.add_column(column, justify="right")
+
+    rows = list(data["commands"].items())
+    if len(rows) > 1:
+        rows.append(("total", data["total"]))
+    for kind, summary in rows:
+        table.add_row(
+            kind,
+            str(summary["requests"]),
+            f"[red]{summary['failed']}[/red]" if summary["failed"] else "0",
+            f"{summary['throughput']:.1f}",
+            *(
+                f"{summary[key] * 1000:.1f}" if summary["ok"] else "-"
+                for key in ("p50", "p95", "p99", "max")
+            ),
+        )
+    console.print(table)
+
+    errors = [
+        (kind, error, count)
+        for kind, summary in data["commands"].items()
+        for error, count in summary["errors"].items()
+    ]
+    if errors:
+        error_table = Table(title="Errors", box=box.ROUNDED)
+        error_table.add_column("Command", style="cyan")
+        error_table.add_column("Error")
+        error_table.add_column("Count", justify="right")
+        for kind, error, count in errors:
+            error_table.add_row(kind, error, str(count))
+        console.print(error_table)
+
+
+@cli.command()
+@click.option("--workload", "-w", default="status", type=click.Choice(["status", "set", "toggle", "mixed"]), help="Commands to send (mixed: 80% status, 10% set, 10% toggle)")
+@click.option("--concurrency", "-c", default=1, type=click.IntRange(1), help="Commands in flight at once")
+@click.option("--rate", "-r", type=click.FloatRange(0, min_open=True), help="Commands started per second (default: as fast as the concurrency allows)")
+@click.option("--duration", "-d", type=click.FloatRange(0, min_open=True), help="Seconds to run (default: 10 unless --requests is given)")
+@click.option("--requests", "-n", type=click.IntRange(1), help="Number of commands to send")
+@click.option("--device", "devices", multiple=True, help="Device as HOST[:PORT] (repeatable; default: --host)")
+@click.option("--hosts-file", type=click.Path(exists=True, dir_okay=False), help="File with one HOST[:PORT] per line (e.g. from simulate)")
+@click.option("--outlet", "outlets", multiple=True, type=click.IntRange(1, 64), help="Outlet switched by set and toggle commands (repeatable; default: 1)")
+@click.option("--per-host-concurrency", default=1, type=click.IntRange(1), help="Commands in flight per device")
+@click.option("--timeout", default=10.0, type=click.FloatRange(0, min_open=True), help="Command timeout ceiling in seconds")
+@click.option("--retries", default=0, type=click.IntRange(0), help="Retries per command (default: 0, to time single attempts)")
+@click.option("--yes", "-y", is_flag=True, help="Switch outlets without asking")
+@click.option("--output", "-o", type=click.Choice(["table", "json"]), default="table", help="Output format")
+@click.pass_context
+def bench(ctx, workload, concurrency, rate, duration, requests, devices, hosts_file, outlets, per_host_concurrency, timeout, retries, yes, output):
+    """Measure throughput and latency under load.
+
+    \b
+    Examples:
+        netcommander --host 192.168.1.100 bench -n 100
+        netcommander simulate -n 200 --hosts-file hosts.txt &
+        netcommander bench --hosts-file hosts.txt -c 64 -w mixed -y
+        netcommander bench --hosts-file hosts.txt -c 64 --rate 500 -d 30
+    """
+    from .bench import run_bench
+
+    names, transport = bench_targets(ctx, devices, hosts_file)
+    if workload != "status" and not yes:
+        click.confirm(
+            f"This switches outlet(s) {', '.join(map(str, outlets or (1,)))} "
+            f"on {max(len(names), 1)} device(s) repeatedly. Continue?",
+            abort=True,
+        )
+
+    async def _bench():
+        async with bench_clients(
+            ctx, names, transport, timeout, concurrency, per_host_concurrency, retries
+        ) as clients:
+            return await run_bench(
+                clients,
+                workload=workload,
+                concurrency=concurrency,
+                rate=rate,
+                duration=duration,
+                requests=requests,
+                outlets=outlets or (1,),
+            )
+
+    try:
+        report = asyncio.run(_bench())
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Benchmark stopped[/yellow]")
+        sys.exit(1)
+
+    data = report.to_dict()
+    if output == "json":
+        console.print_json(json.dumps(data))
+        return
+    print_bench_report(
+        data,
+        f"Benchmark: {workload}, {max(len(names), 1)} device(s), {report.duration:.1f}s",
+    )
+
+
+@cli.command()
+@click.option("--device", "devices", multiple=True, help="Device as HOST[:PORT] (repeatable; default: --host)")
+@click.option("--hosts-file", type=click.Path(exists=True, dir_okay=False), help="File with one HOST[:PORT] per line")
+@click.option("--bind", default="0.0.0.0", help="Address to serve metrics on")
+@click.option("--port", default=9475, type=click.IntRange(1, 65535), help="Port to serve metrics on")
+@click.option("--interval", "-i", default=30.0, type=click.FloatRange(1), help="Seconds between polls of each device")
+@click.option("--timeout", default=10.0, type=click.FloatRange(0, min_open=True), help="Command timeout ceiling in seconds")
+@click.option("--concurrency", "-c", default=64, type=click.IntRange(1), help="Devices polled at once")
+@click.pass_context
+def exporter(ctx, devices, hosts_file, bind, port, interval, timeout, concurrency):
+    """Serve device metrics to Prometheus.
+
+    Devices are polled in the background, spread over the interval;
+    scrapes of /metrics are answered from memory.
+
+    \b
+    Examples:
+        netcommander --host 192.168.1.100 exporter
+        netcommander exporter --hosts-file pdus.txt --interval 15
+    """
+    from netcommander import FleetClient
+    from .exporter import Exporter
+
+    names = device_names(ctx, devices, hosts_file)
+    if not names:
+        console.print("[red]Error: No devices. Use --host, --device or --hosts-file[/red]")
+        sys.exit(1)
+
+    async def _exporter():
+        async with FleetClient(
+            names,
+            ctx.obj["username"],
+            ctx.obj["password"],
+            timeout=timeout,
+            concurrency=concurrency,
+        ) as fleet:
+            async with Exporter(fleet, interval=interval) as metrics:
+                await metrics.serve(bind, port)
+                console.print(
+                    f"[bold]Exporting {len(names)} devices[/bold] on "
+                    f"http://{bind}:{port}/metrics (Ctrl+C to stop)"
+                )
+                await asyncio.Event().wait()
+
+    try:
+        asyncio.run(_exporter())
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Exporter stopped[/yellow]")
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
+    except OSError as e:
+        console.print(f"[red]Error: Cannot listen: {e}[/red]")
+        sys.exit(1)
+
+
+@cli.command()
+@click.option("--device", "devices", multiple=True, help="Device as HOST[:PORT] (repeatable; default: --host)")
+@click.option("--hosts-file", type=click.Path(exists=True, dir_okay=False), help="File with one HOST[:PORT] per line")
+@click.option("--output-dir", "-d", default="recordings", type=click.Path(file_okay=False), help="Directory of the series files")
+@click.option("--interval", "-i", default=1.0, type=click.FloatRange(0, min_open=True), help="Seconds between polls of each device")
+@click.option("--heartbeat", default=60.0, type=click.FloatRange(0), help="Seconds between records of an unchanged device")
+@click.option("--deadband", default=0.05, type=click.FloatRange(0), help="Smallest current change in Amps recorded before the heartbeat")
+@click.option("--timeout", default=10.0, type=click.FloatRange(0, min_open=True), help="Command timeout ceiling in seconds")
+@click.option("--concurrency", "-c", default=64, type=click.IntRange(1), help="Devices polled at once")
+@click.pass_context
+def record(ctx, devices, hosts_file, output_dir, interval, heartbeat, deadband, timeout, concurrency):
+    """Record current, temperature and outlet states to disk.
+
+    Each device gets an append-only file of fixed 24-byte records in the
+    output directory. A record is written when the status changes and at
+    least every heartbeat, so steady devices cost little at any interval.
+
+    \b
+    Examples:
+        netcommander --host 192.168.1.100 record
+        netcommander record --hosts-file pdus.txt -d /var/lib/netcommander
+    """
+    from netcommander import FleetClient, Poller
+    from netcommander.recorder import Recorder
+
+    names = device_names(ctx, devices, hosts_file)
+    if not names:
+        console.print("[red]Error: No devices. Use --host, --device or --hosts-file[/red]")
+        sys.exit(1)
+
+    async def _record(recorder):
+        async with FleetClient(
+            names,
+            ctx.obj["username"],
+            ctx.obj["password"],
+            timeout=timeout,
+            concurrency=concurrency,
+        ) as fleet:
+            async with Poller.from_fleet(fleet, interval=interval) as poller:
+                poller.subscribe(recorder)
+                console.print(
+                    f"[bold]Recording {len(names)} devices[/bold] every {interval:g}s "
+                    f"to {output_dir} (Ctrl+C to stop)"
+                )
+                await asyncio.Event().wait()
+
+    try:
+        with Recorder(output_dir, heartbeat=heartbeat, current_deadband=deadband) as recorder:
+            try:
+                asyncio.run(_record(recorder))
+            except KeyboardInterrupt:
+                console.print(
+                    f"\n[yellow]Recording stopped[/yellow] ({recorder.written} records written)"
+                )
+    except (ValueError, OSError) as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
+
+
+def load_histories(paths, start_time, end_time) -> dict:
+    """Load series files and directories of them by device."""
+    from netcommander import analysis
+
+    histories = {}
+    for path in paths or ("recordings",):
+        if os.path.isdir(path):
+            histories.update(analysis.load_directory(path, start_time, end_time))
+        else:
+            history = analysis.load(path, start_time, end_time)
+            histories[history.device] = history
+    return histories
+
+
+def analyze_histories(histories, voltage, rollup_interval, outlets) -> dict:
+    """Summarize each device's history, with rollups and outlet switching."""
+    from netcommander import analysis
+
+    data = {}
+    for device, history in histories.items():
+        result = {"summary": analysis.summary(history, voltage)}
+        if rollup_interval and len(history):
+            result["rollup"] = analysis.to_rows(analysis.rollup(history, rollup_interval))
+        if outlets and len(history):
+            result["outlets"] = analysis.to_rows(analysis.outlet_correlation(history))
+        data[device] = result
+    return data
+
+
+def format_number(value, spec=".2f") -> str:
+    """Format an optional number for a table cell."""
+    return "-" if value is None else format(value, spec)
+
+
+def local_time(timestamp) -> str:
+    """Format a timestamp as local time for a table cell."""
+    import time
+
+    return time.strftime("%Y-%m-%d %H:%M", time.localtime(timestamp))
+
+
+def print_summary_table(data, voltage):
+    """Print one row of statistics per device."""
+    table = Table(title=f"Recorded Series ({voltage:g} V)", box=box.ROUNDED)
+    table.add_column("Device", style="cyan")
+    table.add_column("From")
+    table.add_column("To")
+    for column in ("Samples", "Coverage h", "Mean A", "p95 A", "Peak A", "Ah", "kWh", "Max °C"):
+        table.add_column(column, justify="right")
+    for device, result in data.items():
+        summary = result["summary"]
+        current = summary["current"] or {}
+        temperature = summary["temperature"] or {}
+        table.add_row(
+            device,
+            local_time(summary["start"]) if summary["samples"] else "-",
+            local_time(summary["end"]) if summary["samples"] else "-",
+            str(summary["samples"]),
+            format_number(summary["coverage"] / 3600, ".1f"),
+            format_number(current.get("mean")),
+            format_number(current.get("p95")),
+            format_number(current.get("max")),
+            format_number(summary["amp_hours"], ".1f"),
+            format_number(summary["kwh"], ".2f"),
+            format_number(temperature.get("max"), ".1f"),
+        )
+    console.print(table)
+
+
+def print_rollup_table(device, rows, interval, seconds):
+    """Print a device's statistics per interval."""
+    table = Table(title=f"{device} per {interval}", box=box.ROUNDED)
+    table.add_column("Start", style="cyan")
+    for column in ("Coverage %", "Mean A", "Min A", "p95 A", "Max A", "Ah"):
+        table.add_column(column, justify="right")
+    for row in rows:
+        table.add_row(
+            local_time(row["start"]),
+            format_number(100 * row["coverage"] / seconds, ".0f"),
+            format_number(row["mean"]),
+            format_number(row["min"]),
+            format_number(row["p95"]),
+            format_number(row["max"]),
+            format_number(row["amp_hours"], ".2f"),
+        )
+    console.print(table)
+
+
+def print_outlet_table(device, rows):
+    """Print the current change when each outlet of a device switches."""
+    table = Table(title=f"{device} outlet switching", box=box.ROUNDED)
+    table.add_column("Outlet", style="cyan")
+    for column in ("On", "Off", "Δ A on", "Δ A off", "Est. A", "Correlation"):
+        table.add_column(column, justify="right")
+    for row in rows:
+        table.add_row(
+            str(row["outlet"]),
+            str(row["switched_on"]),
+            str(row["switched_off"]),
+            format_number(row["on_delta"]),
+            format_number(row["off_delta"]),
+            format_number(row["amps"]),
+            format_number(row["correlation"]),
+        )
+    console.print(table)
+
+
+@cli.command()
+@click.argument("paths", nargs=-1, type=click.Path(exists=True))
+@click.option("--voltage", "-V", default=120.0, type=click.FloatRange(0, min_open=True), help="Supply voltage for energy in kWh")
+@click.option("--start", type=click.DateTime(), help="Analyze samples from this local time")
+@click.option("--end", type=click.DateTime(), help="Analyze samples up to this local time")
+@click.option("--last", help="Analyze the last DURATION (e.g. 24h, 7d)")
+@click.option("--interval", "-i", help="Also show rollups per DURATION (e.g. 15m, 1h, 1d)")
+@click.option("--outlets", is_flag=True, help="Also show the current change when each outlet switches")
+@click.option("--output", "-o", type=click.Choice(["table", "json"]), default="table", help="Output format")
+@click.pass_context
+def analyze(ctx, paths, voltage, start, end, last, interval, outlets, output):
+    """Analyze recorded series: energy, current and temperature statistics.
+
+    PATHS are series files or directories of them (default: recordings).
+    Needs NumPy (pip install 'netcommander[analysis]').
+
+    \b
+    Examples:
+        netcommander analyze --last 7d
+        netcommander analyze /var/lib/netcommander -V 208 --interval 1h
+        netcommander analyze recordings/10.0.0.1_80.ncts --outlets -o json
+    """
+    import time
+    from netcommander import analysis
+
+    try:
+        start_time = start.timestamp() if start else None
+        end_time = end.timestamp() if end else None
+        if last:
+            start_time = (end_time or time.time()) - analysis.parse_duration(last)
+        rollup_interval = analysis.parse_duration(interval) if interval else None
+        histories = load_histories(paths, start_time, end_time)
+    except (ValueError, RuntimeError, OSError) as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
+
+    if not histories:
+        console.print("[red]Error: No recorded series found[/red]")
+        sys.exit(1)
+
+    data = analyze_histories(histories, voltage, rollup_interval, outlets)
+    if output == "json":
+        console.print_json(json.dumps(data))
+        return
+
+    print_summary_table(data, voltage)
+    for device, result in data.items():
+        if result.get("rollup"):
+            print_rollup_table(device, result["rollup"], interval, rollup_interval)
+        if result.get("outlets"):
+            print_outlet_table(device, result["outlets"])
+
+
 def main():
     """Main entry point."""
     cli(obj={})
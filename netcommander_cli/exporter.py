@@ -0,0 +1,349 @@
+"""Prometheus exporter behind ``netcommander exporter``.
+
+A Poller keeps every device's latest status in memory and ``/metrics`` is
+rendered from that snapshot and the clients' request statistics, so a
+scrape never waits on a device and scraping more often does not load the
+PDUs. The rendered page is cached until the next poll result arrives.
+
+Memory stays flat however long the exporter runs: one status per device
+and fixed-size latency histograms (see netcommander.stats).
+"""
+
+import logging
+import math
+import time
+from typing import Iterable, Iterator, Optional
+
+from aiohttp import web
+
+from netcommander import FleetClient, Poller, PollResult
+from netcommander.const import DEFAULT_POLL_INTERVAL
+from netcommander.models import CommandStats, CompactStatus
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_EXPORTER_PORT = 9475
+
+# Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Latency histogram bounds in seconds: every doubling from 1.6 ms to 52 s,
+# which are bucket boundaries of the client's histograms
+LATENCY_BUCKETS = tuple(round(1e-4 * 2**power, 6) for power in range(4, 20))
+
+# Poll intervals a device's last good status is exported for after its
+# polls start failing
+DEFAULT_STALE_INTERVALS = 3
+
+
+def escape_label(value: str) -> str:
+    """Escape a label value for the text format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_value(value: float) -> str:
+    """Format a sample value for the text format."""
+    value = float(value)
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+def parse_temperature(temperature: Optional[str]) -> Optional[float]:
+    """Get a temperature reading in °C ("XX" means no sensor)."""
+    try:
+        return float(temperature)
+    except (TypeError, ValueError):
+        return None
+
+
+class Exporter:
+    """Poll a fleet in the background and serve its state to Prometheus.
+
+    Example:
+        >>> async with FleetClient(devices, "admin", "admin") as fleet:
+        ...     async with Exporter(fleet, interval=15) as exporter:
+        ...         await exporter.serve("0.0.0.0", DEFAULT_EXPORTER_PORT)
+    """
+
+    def __init__(
+        self,
+        fleet: FleetClient,
+        interval: float = DEFAULT_POLL_INTERVAL,
+        stale_after: Optional[float] = None,
+        **poller_options,
+    ):
+        """Initialize the exporter.
+
+        Args:
+            fleet: Open fleet of the devices to export
+            interval: Seconds between polls of one device (default: 30)
+            stale_after: Seconds after which a device's last good status is
+                no longer exported (default: three intervals)
+            **poller_options: Further Poller options (e.g. jitter)
+        """
+        self.fleet = fleet
+        self.interval = interval
+        self.stale_after = (
+            stale_after
+            if stale_after is not None
+            else DEFAULT_STALE_INTERVALS * interval
+        )
+        self.poller = Poller.from_fleet(fleet, interval=interval, **poller_options)
+        self.poller.subscribe(self.update)
+        self.scrapes = 0
+
+        # Device → latest poll result and latest good one
+        self._last: dict[str, PollResult] = {}
+        self._last_good: dict[str, PollResult] = {}
+        self._page: Optional[bytes] = None
+        self._runner: Optional[web.AppRunner] = None
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.stop()
+
+    def start(self) -> None:
+        """Start polling (must be called from a running event loop)."""
+        self.poller.start()
+
+    async def stop(self) -> None:
+        """Stop polling and serving."""
+        await self.poller.stop()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def update(self, result: PollResult) -> None:
+        """Take a poll result into the snapshot (Poller subscriber)."""
+        self._last[result.device] = result
+        if result.ok:
+            self._last_good[result.device] = result
+        self._page = None
+
+    def application(self) -> web.Application:
+        """Get an aiohttp application serving ``/metrics``."""
+        app = web.Application()
+        app.router.add_get("/metrics", self.handle_metrics)
+        app.router.add_get("/", self.handle_index)
+        return app
+
+    async def serve(self, host: str, port: int = DEFAULT_EXPORTER_PORT) -> None:
+        """Start serving on host and port (returns once listening)."""
+        self._runner = web.AppRunner(self.application(), access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+        _LOGGER.info("Serving metrics on %s:%d", host, port)
+
+    async def handle_metrics(self, request: web.Request) -> web.Response:
+        """Serve the metrics page."""
+        self.scrapes += 1
+        return web.Response(
+            body=self.render(), headers={"Content-Type": CONTENT_TYPE}
+        )
+
+    async def handle_index(self, request: web.Request) -> web.Response:
+        """Point to the metrics page."""
+        return web.Response(
+            text='<html><body><a href="/metrics">Metrics</a></body></html>',
+            content_type="text/html",
+        )
+
+    def render(self) -> bytes:
+        """Render the metrics page from the snapshot."""
+        # The exporter's polls are its only requests, so the page can only
+        # change when a poll result arrives
+        if self._page is None:
+            self._page = ("\n".join(self._lines()) + "\n").encode("utf-8")
+        return self._page
+
+    def _statuses(self) -> Iterator[tuple[str, CompactStatus]]:
+        """Latest good status of every device that is not stale."""
+        oldest = time.time() - self.stale_after
+        for device in self.fleet.devices:
+            result = self._last_good.get(device)
+            if result is not None and result.timestamp >= oldest:
+                yield device, result.status
+
+    def _lines(self) -> Iterator[str]:
+        """Produce the lines of the metrics page."""
+        devices = self.fleet.devices
+        last = [
+            (_labels(device=device), self._last[device])
+            for device in devices
+            if device in self._last
+        ]
+        last_good = [
+            (_labels(device=device), self._last_good[device])
+            for device in devices
+            if device in self._last_good
+        ]
+        statuses = list(self._statuses())
+
+        yield from _family(
+            "netcommander_up",
+            "gauge",
+            "Whether the last poll of the device succeeded",
+            ((labels, int(result.ok)) for labels, result in last),
+        )
+        yield from _family(
+            "netcommander_last_poll_timestamp_seconds",
+            "gauge",
+            "Time the device's last successful poll finished",
+            ((labels, result.timestamp) for labels, result in last_good),
+        )
+        yield from _family(
+            "netcommander_poll_duration_seconds",
+            "gauge",
+            "Duration of the device's last poll",
+            ((labels, result.latency) for labels, result in last),
+        )
+        yield from _family(
+            "netcommander_outlet_on",
+            "gauge",
+            "Whether the outlet is on",
+            (
+                (
+                    _labels(device=device, outlet=str(outlet)),
+                    status.bitmask >> (outlet - 1) & 1,
+                )
+                for device, status in statuses
+                for outlet in range(1, status.num_outlets + 1)
+            ),
+        )
+        yield from _family(
+            "netcommander_current_amps",
+            "gauge",
+            "Total current draw of the device",
+            (
+                (_labels(device=device), status.total_current_amps)
+                for device, status in statuses
+            ),
+        )
+        temperatures = [
+            (device, parse_temperature(status.temperature))
+            for device, status in statuses
+        ]
+        yield from _family(
+            "netcommander_temperature_celsius",
+            "gauge",
+            "Device temperature (devices with a sensor)",
+            (
+                (_labels(device=device), temperature)
+                for device, temperature in temperatures
+                if temperature is not None
+            ),
+        )
+
+        stats = self.fleet.stats()
+        commands = [
+            (device, command, command_stats)
+            for device, device_stats in stats.items()
+            for command, command_stats in device_stats.commands.items()
+        ]
+        yield from _family(
+            "netcommander_requests_total",
+            "counter",
+            "Requests sent to the device by command and outcome",
+            (
+                (_labels(device=device, command=command, outcome=outcome), count)
+                for device, command, command_stats in commands
+                for outcome, count in (
+                    ("ok", command_stats.ok),
+                    ("failed", command_stats.failed),
+                    ("timeout", command_stats.timeouts),
+                    ("error", command_stats.errors),
+                )
+            ),
+        )
+        yield from _histogram(
+            "netcommander_request_duration_seconds",
+            "Latency of requests the device answered",
+            commands,
+        )
+
+        yield from _family(
+            "netcommander_exporter_polls_total",
+            "counter",
+            "Polls finished by the exporter",
+            [("", self.poller.polls)],
+        )
+        yield from _family(
+            "netcommander_exporter_poll_errors_total",
+            "counter",
+            "Polls that failed",
+            [("", self.poller.errors)],
+        )
+        yield from _family(
+            "netcommander_exporter_missed_polls_total",
+            "counter",
+            "Scheduled polls skipped because the previous one was running",
+            [("", self.poller.missed)],
+        )
+        yield from _family(
+            "netcommander_exporter_devices",
+            "gauge",
+            "Devices polled by the exporter",
+            [("", len(devices))],
+        )
+
+
+def _labels(**labels: str) -> str:
+    """Format a label set."""
+    return (
+        "{"
+        + ",".join(f'{name}="{escape_label(value)}"' for name, value in labels.items())
+        + "}"
+    )
+
+
+def _family(
+    name: str, kind: str, help_text: str, samples: Iterable[tuple[str, float]]
+) -> Iterator[str]:
+    """Produce a metric family: HELP and TYPE, then one line per sample."""
+    yield f"# HELP {name} {help_text}"
+    yield f"# TYPE {name} {kind}"
+    for labels, value in samples:
+        yield f"{name}{labels} {format_value(value)}"
+
+
+def _histogram(
+    name: str,
+    help_text: str,
+    commands: Iterable[tuple[str, str, CommandStats]],
+) -> Iterator[str]:
+    """Produce a histogram family from client latency statistics.
+
+    The client's finer buckets are summed into LATENCY_BUCKETS, which are
+    a subset of their boundaries.
+    """
+    yield f"# HELP {name} {help_text}"
+    yield f"# TYPE {name} histogram"
+    for device, command, stats in commands:
+        device_label = escape_label(device)
+        command_label = escape_label(command)
+        prefix = f'{name}_bucket{{device="{device_label}",command="{command_label}",le="'
+        buckets = stats.buckets
+        position = 0
+        cumulative = 0
+        for bound in LATENCY_BUCKETS:
+            # Small tolerance: bounds are computed independently
+            while position < len(buckets) and buckets[position][0] <= bound * (
+                1 + 1e-9
+            ):
+                cumulative += buckets[position][1]
+                position += 1
+            yield f'{prefix}{format_value(bound)}"}} {cumulative}'
+        yield f'{prefix}+Inf"}} {stats.answered}'
+        labels = f'{{device="{device_label}",command="{command_label}"}}'
+        yield f"{name}_sum{labels} {format_value(stats.latency_sum)}"
+        yield f"{name}_count{labels} {stats.answered}"
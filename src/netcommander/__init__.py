@@ -5,11 +5,27 @@ A Python library for controlling Synaccess netCommander/netBooter PDUs.
 """
 
 from .client import NetCommanderClient
-from .models import DeviceStatus, OutletState, OutletConfig, DeviceInfo
+from .models import (
+    CompactStatus,
+    DeviceStatus,
+    OutletState,
+    OutletConfig,
+    DeviceInfo,
+    OutletBatchResult,
+    SchedulerStats,
+    CommandStats,
+    DeviceStats,
+)
+from .scheduler import CommandScheduler
+from .fleet import FleetClient, FleetResult
+from .poller import Poller, PollResult
+from .history import StatusHistory, HistorySample
 from .exceptions import (
     NetCommanderError,
     AuthenticationError,
     NetCommanderConnectionError,
+    NetCommanderTimeoutError,
+    CircuitOpenError,
     CommandError,
 )
 
@@ -20,11 +36,25 @@ __email__ = "code@sigler.io"
 __all__ = [
     "NetCommanderClient",
     "DeviceStatus",
+    "CompactStatus",
     "OutletState",
     "OutletConfig",
     "DeviceInfo",
+    "OutletBatchResult",
+    "SchedulerStats",
+    "CommandStats",
+    "DeviceStats",
+    "CommandScheduler",
+    "FleetClient",
+    "FleetResult",
+    "Poller",
+    "PollResult",
+    "StatusHistory",
+    "HistorySample",
     "NetCommanderError",
     "AuthenticationError",
     "NetCommanderConnectionError",
+    "NetCommanderTimeoutError",
+    "CircuitOpenError",
     "CommandError",
 ]
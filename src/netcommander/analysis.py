@@ -0,0 +1,418 @@
+"""Vectorized analysis of recorded status history (requires NumPy).
+
+Loads the series files written by ``netcommander.recorder`` into NumPy
+arrays and computes energy, per-interval statistics and the current step
+each outlet causes when it switches, without Python loops over samples.
+
+Recorded series only hold changes and heartbeats, so a sample stands for
+its value until the next sample. Statistics are therefore weighted by how
+long each value held, capped at ``max_gap`` (the recorder was stopped or
+lost samples beyond that); samples of failed polls hold no value.
+
+Example:
+    >>> history = load("recordings/10.0.0.1_80.ncts", start=time.time() - 86400)
+    >>> kwh = summary(history, voltage=208)["kwh"]
+    >>> hourly = rollup(history, 3600)
+    >>> peaks = hourly["max"]
+"""
+
+import glob
+import math
+import os
+import re
+from typing import Any, Iterable, Optional
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:  # Optional: pip install netcommander[analysis]
+    HAS_NUMPY = False
+
+from .recorder import (
+    DEFAULT_HEARTBEAT,
+    FILE_SUFFIX,
+    FLAG_ERROR,
+    FLAG_START,
+    HEADER,
+    RECORD_DTYPE,
+    TEMPERATURE_NONE,
+    SeriesReader,
+)
+
+DEFAULT_VOLTAGE = 120.0  # Volts, for energy in kWh
+# Longest time a sample is taken to hold its value: the recorder writes at
+# least every heartbeat while it runs
+DEFAULT_MAX_GAP = 2 * DEFAULT_HEARTBEAT
+DEFAULT_PERCENTILES = (0.5, 0.95, 0.99)
+
+_DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+def parse_duration(text: str) -> float:
+    """Parse a duration such as "90", "15m", "1h" or "7d" into seconds.
+
+    Raises:
+        ValueError: Not a positive duration
+    """
+    match = re.fullmatch(r"\s*(\d+(?:\.\d*)?)\s*([smhdw]?)\s*", text.lower())
+    if not match:
+        raise ValueError(f"Invalid duration: {text!r}")
+    seconds = float(match.group(1)) * _DURATION_UNITS.get(match.group(2), 1)
+    if seconds <= 0:
+        raise ValueError(f"Duration must be positive: {text!r}")
+    return seconds
+
+
+def _require_numpy() -> None:
+    """Fail clearly when NumPy is missing."""
+    if not HAS_NUMPY:
+        raise RuntimeError(
+            "netcommander.analysis requires NumPy (pip install 'netcommander[analysis]')"
+        )
+
+
+class History:
+    """Recorded samples of one device as NumPy arrays.
+
+    Attributes:
+        device: Device name from the file header
+        timestamp: Sample times (float64 seconds)
+        bitmask: Outlet states (uint64, bit 0 is outlet 1)
+        current: Total current in Amps (float32)
+        temperature: Temperature in °C (float64, NaN without a sensor)
+        flags: Record flags (netcommander.recorder.FLAG_*)
+        num_outlets: Outlet count (uint8)
+        end: Time the last sample holds until
+    """
+
+    def __init__(self, device: str, records, end: Optional[float] = None):
+        """Wrap a structured array of records (RECORD_DTYPE)."""
+        self.device = device
+        self.timestamp = records["timestamp"]
+        self.bitmask = records["bitmask"]
+        self.current = records["current"]
+        temperature = records["temperature"]
+        self.temperature = np.where(
+            temperature == TEMPERATURE_NONE, np.nan, temperature / 10
+        )
+        self.flags = records["flags"]
+        self.num_outlets = records["num_outlets"]
+        if end is None:
+            end = float(self.timestamp[-1]) if len(self.timestamp) else 0.0
+        self.end = end
+
+    def __len__(self) -> int:
+        """Number of samples."""
+        return len(self.timestamp)
+
+    @property
+    def valid(self):
+        """Mask of samples from successful polls."""
+        return (self.flags & FLAG_ERROR) == 0
+
+    def holds(self, max_gap: float = DEFAULT_MAX_GAP):
+        """Seconds each sample's value holds (0 for failed polls)."""
+        if not len(self.timestamp):
+            return np.empty(0)
+        following = np.append(self.timestamp[1:], max(self.end, self.timestamp[-1]))
+        holds = np.minimum(following - self.timestamp, max_gap)
+        holds[~self.valid] = 0.0
+        return holds
+
+
+def load(
+    path: str, start: Optional[float] = None, end: Optional[float] = None
+) -> History:
+    """Load a device's samples from start (inclusive) to end (exclusive).
+
+    The file is memory-mapped and only the selected range is copied.
+
+    Raises:
+        RuntimeError: NumPy is not installed
+        ValueError: File is not a series file
+    """
+    _require_numpy()
+    dtype = np.dtype(RECORD_DTYPE)
+    with SeriesReader(path) as series:
+        device = series.device
+        count = len(series)
+    if not count:
+        return History(device, np.empty(0, dtype), end)
+
+    records = np.memmap(path, dtype=dtype, mode="r", offset=HEADER.size, shape=(count,))
+    timestamps = records["timestamp"]
+    first = int(np.searchsorted(timestamps, start)) if start is not None else 0
+    last = int(np.searchsorted(timestamps, end)) if end is not None else count
+    # Copy the range so the map can be released
+    return History(device, np.array(records[first : max(first, last)]), end)
+
+
+def load_directory(
+    directory: str, start: Optional[float] = None, end: Optional[float] = None
+) -> dict[str, History]:
+    """Load every series file of a directory, keyed by device name."""
+    histories = {}
+    for path in sorted(glob.glob(os.path.join(directory, "*" + FILE_SUFFIX))):
+        history = load(path, start, end)
+        histories[history.device] = history
+    return histories
+
+
+def _weighted_stats(
+    groups, weights, values, percentiles: Iterable[float]
+) -> dict:
+    """Time-weighted statistics of values per group.
+
+    Args:
+        groups: Non-decreasing group id of every value
+        weights: Seconds every value held (all positive)
+        values: Values
+        percentiles: Fractions to compute percentiles for
+
+    Returns:
+        Arrays per group: group, coverage (seconds), sum (value × seconds),
+        mean, min, max and p<percent> per percentile
+    """
+    if not len(values):
+        empty = np.empty(0)
+        stats = {name: empty for name in ("coverage", "sum", "mean", "min", "max")}
+        stats["group"] = np.empty(0, dtype=np.int64)
+        stats.update({_percentile_name(q): empty for q in percentiles})
+        return stats
+
+    starts = np.flatnonzero(np.diff(groups, prepend=groups[0] - 1))
+    coverage = np.add.reduceat(weights, starts)
+    total = np.add.reduceat(weights * values, starts)
+    stats = {
+        "group": groups[starts],
+        "coverage": coverage,
+        "sum": total,
+        "mean": total / coverage,
+        "min": np.minimum.reduceat(values, starts),
+        "max": np.maximum.reduceat(values, starts),
+    }
+
+    # Sort values within each group; a percentile is the smallest value
+    # that holds for at least that fraction of the group's time
+    # by one argsort of group rank × span + value, ~10x faster than lexsort;
+    # rounding of the key only reorders values within far less than 1e-6
+    rank = np.repeat(np.arange(len(starts)), np.diff(starts, append=len(values)))
+    low = values.min()
+    span = values.max() - low + 1
+    order = np.argsort(rank * span + (values - low))
+    sorted_values = values[order]
+    cumulative = np.cumsum(weights[order])
+    ends = np.append(starts[1:], len(values)) - 1
+    before = np.where(starts > 0, cumulative[starts - 1], 0.0)
+    for fraction in percentiles:
+        targets = before + fraction * (cumulative[ends] - before)
+        positions = np.clip(np.searchsorted(cumulative, targets), starts, ends)
+        stats[_percentile_name(fraction)] = sorted_values[positions]
+    return stats
+
+
+def _percentile_name(fraction: float) -> str:
+    """Name a percentile column (0.95 → "p95", 0.999 → "p99.9")."""
+    return f"p{fraction * 100:g}"
+
+
+def _field(history: History, field: str):
+    """Get a sample field as float64 for statistics."""
+    if field not in ("current", "temperature"):
+        raise ValueError(f"Cannot analyze {field!r}; use current or temperature")
+    return getattr(history, field).astype(np.float64)
+
+
+def rollup(
+    history: History,
+    interval: float,
+    field: str = "current",
+    percentiles: Iterable[float] = DEFAULT_PERCENTILES,
+    max_gap: float = DEFAULT_MAX_GAP,
+) -> dict:
+    """Downsample a history into fixed intervals.
+
+    Intervals are aligned to multiples of ``interval`` since the epoch.
+    Samples that hold across an interval boundary count in both intervals.
+
+    Args:
+        history: Samples of a device
+        interval: Interval length in seconds
+        field: "current" or "temperature"
+        percentiles: Fractions to compute time-weighted percentiles for
+        max_gap: Longest time a sample holds its value
+
+    Returns:
+        Arrays with one entry per interval that has data: start, coverage
+        (seconds with data), mean, min, max, p50/p95/..., and amp_hours for
+        current
+    """
+    _require_numpy()
+    percentiles = tuple(percentiles)
+    values = _field(history, field)
+    holds = history.holds(max_gap)
+    keep = (holds > 0) & ~np.isnan(values)
+    times, holds, values = history.timestamp[keep], holds[keep], values[keep]
+
+    # Split every hold at interval boundaries into pieces
+    ends = times + holds
+    first = np.floor(times / interval).astype(np.int64)
+    last = np.maximum(np.ceil(ends / interval).astype(np.int64) - 1, first)
+    pieces = last - first + 1
+    sample = np.repeat(np.arange(len(times)), pieces)
+    offsets = np.arange(len(sample)) - np.repeat(np.cumsum(pieces) - pieces, pieces)
+    bucket = first[sample] + offsets
+    weights = np.minimum(ends[sample], (bucket + 1) * interval) - np.maximum(
+        times[sample], bucket * interval
+    )
+    positive = weights > 0
+    stats = _weighted_stats(
+        bucket[positive], weights[positive], values[sample][positive], percentiles
+    )
+
+    stats["start"] = stats.pop("group") * interval
+    total = stats.pop("sum")
+    if field == "current":
+        stats["amp_hours"] = total / 3600
+    return stats
+
+
+def summary(
+    history: History,
+    voltage: float = DEFAULT_VOLTAGE,
+    percentiles: Iterable[float] = DEFAULT_PERCENTILES,
+    max_gap: float = DEFAULT_MAX_GAP,
+) -> dict:
+    """Summarize a history: energy, current and temperature statistics.
+
+    Energy is apparent: Amp-hours times the given voltage (power factor 1).
+
+    Returns:
+        device, start, end, samples, coverage (seconds with data),
+        amp_hours, kwh, current (mean, min, max, percentiles) and
+        temperature (same, or None without a sensor)
+    """
+    _require_numpy()
+    percentiles = tuple(percentiles)
+    holds = history.holds(max_gap)
+    result: dict[str, Any] = {
+        "device": history.device,
+        "start": float(history.timestamp[0]) if len(history) else None,
+        "end": history.end if len(history) else None,
+        "samples": len(history),
+    }
+    for field in ("current", "temperature"):
+        values = _field(history, field)
+        keep = (holds > 0) & ~np.isnan(values)
+        stats = _weighted_stats(
+            np.zeros(int(keep.sum()), dtype=np.int64),
+            holds[keep],
+            values[keep],
+            percentiles,
+        )
+        if not len(stats["group"]):
+            result[field] = None
+            if field == "current":
+                result.update(coverage=0.0, amp_hours=0.0, kwh=0.0)
+            continue
+        if field == "current":
+            amp_hours = float(stats["sum"][0]) / 3600
+            result["coverage"] = float(stats["coverage"][0])
+            result["amp_hours"] = amp_hours
+            result["kwh"] = amp_hours * voltage / 1000
+        result[field] = {
+            name: float(column[0])
+            for name, column in stats.items()
+            if name not in ("group", "coverage", "sum")
+        }
+    return result
+
+
+def energy(
+    history: History,
+    voltage: float = DEFAULT_VOLTAGE,
+    max_gap: float = DEFAULT_MAX_GAP,
+) -> tuple[float, float]:
+    """Get the energy drawn as (Amp-hours, kWh at the given voltage)."""
+    _require_numpy()
+    amp_hours = float(np.dot(history.holds(max_gap), history.current)) / 3600
+    return amp_hours, amp_hours * voltage / 1000
+
+
+def outlet_correlation(history: History) -> dict:
+    """Relate outlet switching to the change in total current.
+
+    Every pair of consecutive successful samples whose outlet states differ
+    is a switching event; the current delta across it is attributed to the
+    outlets that switched.
+
+    Returns:
+        Arrays per outlet: outlet (number), switched_on, switched_off
+        (event counts), on_delta and off_delta (mean current change in Amps
+        when the outlet switched on or off, NaN without events), amps
+        (least-squares estimate of the outlet's draw, which separates
+        outlets switched together) and correlation (Pearson coefficient of
+        switch direction and current delta over all events)
+    """
+    _require_numpy()
+    valid = history.valid
+    # Pairs that cross a failed poll or a recorder restart are not events
+    start = (history.flags & FLAG_START) != 0
+    bitmask = history.bitmask
+    events = np.flatnonzero(
+        (bitmask[1:] != bitmask[:-1]) & valid[:-1] & valid[1:] & ~start[1:]
+    )
+    num_outlets = int(history.num_outlets.max()) if len(history) else 0
+    shifts = np.arange(num_outlets, dtype=np.uint64)
+    before = (bitmask[events, None] >> shifts) & 1
+    after = (bitmask[events + 1, None] >> shifts) & 1
+    # +1 switched on, -1 switched off, 0 unchanged; one row per event
+    direction = after.astype(np.float64) - before
+    current = history.current.astype(np.float64)
+    delta = current[events + 1] - current[events]
+
+    # Everything below comes from sums over events, taken as matrix products
+    gram = direction.T @ direction
+    switched = np.diag(gram)  # on + off
+    net = direction.sum(axis=0)  # on - off
+    switched_on = ((switched + net) / 2).astype(np.int64)
+    switched_off = ((switched - net) / 2).astype(np.int64)
+    delta_sum = direction.T @ delta  # on deltas - off deltas
+    delta_abs_sum = (direction * direction).T @ delta  # on deltas + off deltas
+    count = len(delta)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        on_delta = (delta_abs_sum + delta_sum) / 2 / switched_on
+        off_delta = (delta_abs_sum - delta_sum) / 2 / switched_off
+        covariance = delta_sum / count - net / count * delta.sum() / count
+        variance = switched / count - (net / count) ** 2
+        delta_variance = (delta @ delta) / count - (delta.sum() / count) ** 2
+        correlation = covariance / np.sqrt(variance * delta_variance)
+    # Least squares over the normal equations (num_outlets × num_outlets)
+    amps = np.linalg.lstsq(gram, delta_sum, rcond=None)[0]
+    # Outlets that never switched are not determined
+    amps[switched == 0] = np.nan
+
+    return {
+        "outlet": np.arange(1, num_outlets + 1),
+        "switched_on": switched_on,
+        "switched_off": switched_off,
+        "on_delta": on_delta,
+        "off_delta": off_delta,
+        "amps": amps,
+        "correlation": correlation,
+    }
+
+
+def to_rows(columns: dict) -> list[dict]:
+    """Turn column arrays into JSON-ready rows (NaN becomes None)."""
+    names = list(columns)
+    rows = []
+    for values in zip(*(columns[name].tolist() for name in names), strict=True):
+        rows.append(
+            {
+                name: None if isinstance(value, float) and math.isnan(value) else value
+                for name, value in zip(names, values, strict=True)
+            }
+        )
+    return rows
@@ -1,8 +1,25 @@
 """Constants for netCommander API client."""
 
 # Default connection settings
-DEFAULT_TIMEOUT = 10  # seconds
+DEFAULT_TIMEOUT = 10  # seconds; ceiling for adaptive timeouts
+DEFAULT_MIN_TIMEOUT = 0.5  # seconds; floor for adaptive timeouts
+DEFAULT_INITIAL_TIMEOUT = 3.0  # seconds; used until a device has RTT samples
 DEFAULT_PORT = 80
+DEFAULT_TELNET_PORT = 23
+DEFAULT_SERIAL_DEVICE = "/dev/ttyACM0"
+DEFAULT_SERIAL_BAUDRATE = 9600  # 8-N-1, no flow control
+DEFAULT_STATUS_MAX_AGE = 0.0  # seconds; 0 disables serving status from cache
+DEFAULT_MAX_CONCURRENCY = 1  # requests in flight per device (firmware is serial)
+DEFAULT_COMMAND_STAGGER = 0.0  # seconds between command starts in bulk operations
+DEFAULT_RETRIES = 2  # extra attempts for idempotent commands ($A5, $A8, $A3)
+DEFAULT_RETRY_BACKOFF = 0.25  # seconds; first retry waits up to this long
+DEFAULT_RETRY_MAX_BACKOFF = 2.0  # seconds; cap on the backoff ceiling
+DEFAULT_FAILURE_THRESHOLD = 3  # consecutive failures that open the circuit (0 disables)
+DEFAULT_RESET_TIMEOUT = 30.0  # seconds the circuit stays open before probing
+DEFAULT_FLEET_CONCURRENCY = 64  # devices handled at once by FleetClient
+DEFAULT_DNS_CACHE_TTL = 300  # seconds; FleetClient's shared DNS cache
+DEFAULT_POLL_INTERVAL = 30.0  # seconds between polls of one device
+DEFAULT_POLL_JITTER = 0.02  # fraction of the interval a poll may move either way
 
 # Command endpoints
 CMD_ENDPOINT = "/cmd.cgi"
@@ -12,6 +29,8 @@ CMD_GET_STATUS = "$A5"
 CMD_GET_INFO = "$A8"  # Get device information
 CMD_SET_OUTLET = "$A3"  # Format: "$A3 {port} {value}" (SPACES!)
 CMD_TOGGLE_OUTLET = "rly"  # Format: "rly={index}"
+CMD_LOGIN = "$A1"  # Telnet only. Format: "$A1,{user},{password}"
+CMD_LOGOUT = "$A2"  # Telnet only
 
 # Response codes
 RESPONSE_SUCCESS = "$A0"
@@ -24,6 +24,22 @@ class NetCommanderConnectionError(NetCommanderError):
         super().__init__(self.message)
 
 
+class NetCommanderTimeoutError(NetCommanderConnectionError):
+    """Raised when the device does not answer within the timeout."""
+
+    pass
+
+
+class CircuitOpenError(NetCommanderConnectionError):
+    """Raised when a device is known to be down and requests fail fast."""
+
+    def __init__(self, host: str, retry_after: float = 0.0):
+        self.retry_after = max(retry_after, 0.0)
+        super().__init__(
+            host, f"Device unavailable, retrying in {self.retry_after:.0f}s"
+        )
+
+
 class CommandError(NetCommanderError):
     """Raised when a command fails."""
 
@@ -0,0 +1,412 @@
+"""Manage many netCommander devices through shared resources.
+
+A deployment with hundreds of PDUs should not open hundreds of aiohttp
+sessions. FleetClient keeps one session, connector and DNS cache for every
+device, bounds how many devices are worked on at once and how many sockets
+are open, and streams per-device results as they complete.
+"""
+
+import asyncio
+import itertools
+import logging
+from functools import partial
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Mapping,
+    NamedTuple,
+    Optional,
+)
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from .client import NetCommanderClient
+from .models import DeviceStats, OutletBatchResult
+from .exceptions import NetCommanderError
+from .const import (
+    DEFAULT_DNS_CACHE_TTL,
+    DEFAULT_FLEET_CONCURRENCY,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_PORT,
+    DEFAULT_TIMEOUT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class FleetResult(NamedTuple):
+    """Outcome of one operation on one device."""
+
+    device: str
+    value: Any = None
+    error: Optional[NetCommanderError] = None
+
+    @property
+    def ok(self) -> bool:
+        """Check if the operation succeeded."""
+        return self.error is None
+
+
+class FleetClient:
+    """Async client for a fleet of netCommander devices.
+
+    Devices are named ``host`` or ``host:port``. Every device gets its own
+    NetCommanderClient (with its scheduler, circuit breaker and adaptive
+    timeouts) but all of them share one aiohttp session, so connections and
+    DNS lookups are pooled across the fleet.
+
+    At most ``concurrency`` devices are worked on at once and the connector
+    never opens more than that many sockets; each device additionally gets
+    at most ``per_host_concurrency`` requests in flight. Clients are created
+    the first time a device is used.
+
+    Example:
+        >>> devices = ["10.0.0.1", "10.0.0.2:8080"]
+        >>> async with FleetClient(devices, "admin", "admin") as fleet:
+        ...     for device, result in (await fleet.status_all()).items():
+        ...         print(device, result.value if result.ok else result.error)
+        ...     async for result in fleet.as_completed(
+        ...         lambda client: client.get_device_info()
+        ...     ):
+        ...         print(result.device, result.value)
+    """
+
+    def __init__(
+        self,
+        devices: Iterable[str],
+        username: str,
+        password: str,
+        timeout: float = DEFAULT_TIMEOUT,
+        concurrency: int = DEFAULT_FLEET_CONCURRENCY,
+        per_host_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        dns_cache_ttl: Optional[int] = DEFAULT_DNS_CACHE_TTL,
+        credentials: Optional[Mapping[str, tuple[str, str]]] = None,
+        **client_options: Any,
+    ):
+        """Initialize the fleet.
+
+        Args:
+            devices: Device names, ``host`` or ``host:port``
+            username: Default authentication username
+            password: Default authentication password
+            timeout: Request timeout ceiling in seconds (default: 10)
+            concurrency: Devices worked on at once, which is also the limit
+                on open sockets (default: 64)
+            per_host_concurrency: Requests in flight per device (default: 1)
+            dns_cache_ttl: Seconds to cache DNS lookups; None caches forever
+                (default: 300)
+            credentials: (username, password) for devices that don't use the
+                defaults, keyed by device name
+            **client_options: Further NetCommanderClient options (e.g.
+                retries, status_max_age) applied to every device
+
+        Raises:
+            ValueError: Device name cannot be parsed
+        """
+        self.username = username
+        self.password = password
+        self.timeout = timeout
+        self.concurrency = max(1, concurrency)
+        self.per_host_concurrency = per_host_concurrency
+        self.dns_cache_ttl = dns_cache_ttl
+        self.credentials = dict(credentials or {})
+        self.client_options = client_options
+
+        # Device name → (host, port), in the order given
+        self._devices: dict[str, tuple[str, int]] = {
+            device: parse_device(device) for device in devices
+        }
+        self._clients: dict[str, NetCommanderClient] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
+    @property
+    def devices(self) -> list[str]:
+        """Device names in the fleet."""
+        return list(self._devices)
+
+    def __len__(self) -> int:
+        """Number of devices in the fleet."""
+        return len(self._devices)
+
+    async def open(self) -> None:
+        """Create the shared session and connector."""
+        if self._session is not None:
+            return
+        connector = aiohttp.TCPConnector(
+            limit=self.concurrency,
+            limit_per_host=self.per_host_concurrency,
+            use_dns_cache=True,
+            ttl_dns_cache=self.dns_cache_ttl,
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            headers={"User-Agent": "NetCommander-Python/2025.10.15"},
+        )
+        _LOGGER.debug("Opened fleet session for %d devices", len(self._devices))
+
+    async def close(self) -> None:
+        """Close every device client and the shared session."""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        await asyncio.gather(
+            *(client.close() for client in clients), return_exceptions=True
+        )
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def add_device(self, device: str) -> None:
+        """Add a device to the fleet.
+
+        Raises:
+            ValueError: Device name cannot be parsed
+        """
+        if device not in self._devices:
+            self._devices[device] = parse_device(device)
+
+    async def remove_device(self, device: str) -> None:
+        """Remove a device from the fleet and close its client."""
+        self._devices.pop(device, None)
+        client = self._clients.pop(device, None)
+        if client is not None:
+            await client.close()
+
+    def client(self, device: str) -> NetCommanderClient:
+        """Get the client for a device, creating it on first use.
+
+        Raises:
+            KeyError: Device is not in the fleet
+            RuntimeError: Fleet is not open
+        """
+        client = self._clients.get(device)
+        if client is not None:
+            return client
+
+        host, port = self._devices[device]
+        if self._session is None:
+            raise RuntimeError("FleetClient is not open; use 'async with'")
+        username, password = self.credentials.get(
+            device, (self.username, self.password)
+        )
+        options: dict[str, Any] = {"max_concurrency": self.per_host_concurrency}
+        options.update(self.client_options)
+        client = NetCommanderClient(
+            host,
+            username,
+            password,
+            port=port,
+            timeout=self.timeout,
+            session=self._session,
+            **options,
+        )
+        self._clients[device] = client
+        return client
+
+    def stats(self) -> dict[str, DeviceStats]:
+        """Get request statistics of every device used so far.
+
+        Returns:
+            DeviceStats keyed by device name, in fleet order
+        """
+        return {
+            device: self._clients[device].stats()
+            for device in self._devices
+            if device in self._clients
+        }
+
+    async def as_completed(
+        self,
+        operation: Callable[[NetCommanderClient], Awaitable[Any]],
+        devices: Optional[Iterable[str]] = None,
+    ) -> AsyncIterator[FleetResult]:
+        """Run an operation on many devices, yielding results as they finish.
+
+        No more than ``concurrency`` operations run at once and a new one is
+        started only when another completes, so memory stays bounded however
+        large the fleet is. Device errors are returned in the result instead
+        of stopping the sweep.
+
+        Args:
+            operation: Coroutine function taking a device's client
+            devices: Devices to run on (default: the whole fleet)
+
+        Yields:
+            FleetResult per device, in completion order
+
+        Raises:
+            KeyError: Device is not in the fleet
+        """
+        devices = self._select(devices)
+        calls = (
+            (device, partial(self._call, operation, device)) for device in devices
+        )
+        async for result in self._run(calls):
+            yield result
+
+    async def status_all(
+        self,
+        max_age: Optional[float] = None,
+        devices: Optional[Iterable[str]] = None,
+    ) -> dict[str, FleetResult]:
+        """Read the status of every device.
+
+        Args:
+            max_age: Accept cached statuses up to this many seconds old
+                (default: each client's status_max_age)
+            devices: Devices to read (default: the whole fleet)
+
+        Returns:
+            FleetResult with a CompactStatus value per device, in fleet order
+        """
+        devices = self._select(devices)
+        results = {
+            result.device: result
+            async for result in self.as_completed(
+                lambda client: client.get_status_compact(max_age=max_age), devices
+            )
+        }
+        return {device: results[device] for device in devices}
+
+    async def iter_status(
+        self,
+        max_age: Optional[float] = None,
+        devices: Optional[Iterable[str]] = None,
+    ) -> AsyncIterator[FleetResult]:
+        """Stream device statuses as they arrive.
+
+        Yields:
+            FleetResult with a CompactStatus value, in completion order
+        """
+        async for result in self.as_completed(
+            lambda client: client.get_status_compact(max_age=max_age), devices
+        ):
+            yield result
+
+    async def set_outlets_many(
+        self,
+        targets: Mapping[str, Mapping[int, bool]],
+        max_age: Optional[float] = None,
+    ) -> dict[str, FleetResult]:
+        """Set outlets on many devices, skipping outlets already in state.
+
+        Runs NetCommanderClient.set_outlets() on each device.
+
+        Args:
+            targets: Device name → (outlet_number → target state)
+            max_age: Accept a cached status up to this many seconds old for
+                each device's initial read
+
+        Returns:
+            FleetResult with an OutletBatchResult value per device, in the
+            order of targets
+
+        Raises:
+            KeyError: Device is not in the fleet
+        """
+        devices = self._select(targets)
+        calls = (
+            (
+                device,
+                partial(
+                    self._call,
+                    partial(_set_outlets, outlets=targets[device], max_age=max_age),
+                    device,
+                ),
+            )
+            for device in devices
+        )
+        results = {result.device: result async for result in self._run(calls)}
+        return {device: results[device] for device in devices}
+
+    def _select(self, devices: Optional[Iterable[str]]) -> list[str]:
+        """Resolve a device selection, checking every device is known."""
+        if devices is None:
+            return list(self._devices)
+        devices = list(devices)
+        for device in devices:
+            if device not in self._devices:
+                raise KeyError(device)
+        return devices
+
+    async def _call(
+        self,
+        operation: Callable[[NetCommanderClient], Awaitable[Any]],
+        device: str,
+    ) -> Any:
+        """Run an operation on one device's client."""
+        return await operation(self.client(device))
+
+    async def _run(self, calls: Iterable[tuple[str, Callable[[], Awaitable[Any]]]]):
+        """Run calls with a sliding window of ``concurrency`` tasks."""
+        await self.open()
+        calls = iter(calls)
+        pending: dict[asyncio.Task, str] = {}
+
+        def start_next(count: int) -> None:
+            for device, call in itertools.islice(calls, count):
+                pending[asyncio.ensure_future(call())] = device
+
+        try:
+            start_next(self.concurrency)
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                start_next(len(done))
+                for task in done:
+                    device = pending.pop(task)
+                    try:
+                        result = FleetResult(device, task.result())
+                    except NetCommanderError as e:
+                        _LOGGER.debug("Fleet operation on %s failed: %s", device, e)
+                        result = FleetResult(device, error=e)
+                    yield result
+        finally:
+            # Consumer stopped early or was cancelled
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def _set_outlets(
+    client: NetCommanderClient,
+    outlets: Mapping[int, bool],
+    max_age: Optional[float],
+) -> OutletBatchResult:
+    """Set a device's outlets (fleet operation)."""
+    return await client.set_outlets(outlets, max_age=max_age)
+
+
+def parse_device(device: str) -> tuple[str, int]:
+    """Split a device name into host and port.
+
+    Example:
+        >>> parse_device("10.0.0.1:8080")
+        ('10.0.0.1', 8080)
+
+    Raises:
+        ValueError: Device name cannot be parsed
+    """
+    try:
+        parsed = urlsplit(f"//{device}")
+        host, port = parsed.hostname, parsed.port
+    except ValueError as e:
+        raise ValueError(f"Invalid device {device!r}: {e}") from e
+    if not host:
+        raise ValueError(f"Invalid device {device!r}")
+    return host, port or DEFAULT_PORT
@@ -0,0 +1,66 @@
+"""Fast byte-level parsers for netCommander responses.
+
+These work directly on the raw response bytes with a single compiled regex
+match and return plain values (integer outlet bitmask, float current), so
+the hot polling path never splits strings or builds per-outlet containers.
+Bit N-1 of the bitmask is outlet N, which matches the device's status
+string read as a binary number (rightmost character = outlet 1).
+"""
+
+import re
+from typing import Optional, Union
+
+from .exceptions import ParseError
+from .const import RESPONSE_SUCCESS
+
+# $A0,<outlet bits>,<current>[,<temperature>[,...]]; anchored at the end so
+# garbage after the current (e.g. "2.50abc") is rejected, not truncated
+_STATUS_RE = re.compile(
+    rb"\$A0,([01]+),(\d+(?:\.\d*)?)(?:,([^,\r\n]*)(?:,[^\r\n]*)?)?\s*\Z"
+)
+
+
+def parse_status_bytes(
+    data: Union[bytes, str],
+) -> tuple[int, int, float, Optional[str]]:
+    """Parse a $A5 status response.
+
+    Args:
+        data: Raw response (e.g. b"$A0,10101,2.50,25\\r\\n")
+
+    Returns:
+        Tuple of (outlet bitmask, outlet count, current in Amps, temperature)
+
+    Raises:
+        ParseError: Cannot parse response
+    """
+    if isinstance(data, str):
+        data = data.encode("latin-1", "replace")
+
+    match = _STATUS_RE.match(data.lstrip())
+    if match is None:
+        response = data.decode("latin-1").strip()
+        if not response.startswith(RESPONSE_SUCCESS):
+            raise ParseError(response, f"Expected {RESPONSE_SUCCESS}")
+        raise ParseError(response, "Expected $A0,<outlets>,<current>[,<temp>]")
+
+    bits, current, temperature = match.groups()
+    return (
+        int(bits, 2),
+        len(bits),
+        float(current),
+        temperature.decode("latin-1").strip() if temperature is not None else None,
+    )
+
+
+def outlets_from_bitmask(bitmask: int, num_outlets: int) -> dict[int, bool]:
+    """Expand an outlet bitmask into a dict of outlet_number → state."""
+    return {
+        outlet: bool(bitmask >> (outlet - 1) & 1)
+        for outlet in range(1, num_outlets + 1)
+    }
+
+
+def bitmask_to_status_string(bitmask: int, num_outlets: int) -> str:
+    """Format a bitmask as the device's status string (outlet 1 rightmost)."""
+    return format(bitmask, f"0{num_outlets}b")
@@ -0,0 +1,581 @@
+"""Compact on-disk time series of device status.
+
+Each device gets one append-only file: a 64-byte header followed by
+fixed-width 24-byte records (little endian)::
+
+    timestamp    f8  wall clock seconds
+    bitmask      u8  outlet states, bit 0 is outlet 1
+    current      f4  total current in Amps
+    temperature  i2  tenths of °C, TEMPERATURE_NONE without a sensor
+    flags        u1  FLAG_* bits
+    num_outlets  u1
+
+Records are written when the status changes (outlets, temperature, or
+current by more than a deadband) and at least every heartbeat interval, so
+a steady PDU costs about 1 MB per month at any poll rate. Timestamps never
+decrease within a file.
+
+Every ``block_records``-th record (record 0, N, 2N, ...) starts a block and
+is flagged FLAG_BLOCK; reading the timestamps of those records alone gives
+an index to seek by time without scanning the file. Since every record has
+the same width, the file can be memory-mapped, e.g. with numpy::
+
+    numpy.memmap(path, dtype=numpy.dtype(RECORD_DTYPE), mode="r",
+                 offset=HEADER.size)
+
+Example:
+    >>> async with FleetClient(devices, "admin", "admin") as fleet:
+    ...     with Recorder("recordings") as recorder:
+    ...         async with Poller.from_fleet(fleet, interval=1) as poller:
+    ...             poller.subscribe(recorder)
+    ...             await asyncio.sleep(3600)
+"""
+
+import bisect
+import logging
+import mmap
+import os
+import re
+import struct
+import time
+from array import array
+from typing import Iterator, NamedTuple, Optional, Union
+
+from .models import CompactStatus
+
+_LOGGER = logging.getLogger(__name__)
+
+MAGIC = b"NCTS"
+VERSION = 1
+
+# magic, version, record size, block records, created (epoch s), device name
+HEADER = struct.Struct("<4sHHId44s")
+_DEVICE_NAME_SIZE = 44
+RECORD = struct.Struct("<dQfhBB")
+
+# numpy dtype of a record, as a list of (name, format)
+RECORD_DTYPE = [
+    ("timestamp", "<f8"),
+    ("bitmask", "<u8"),
+    ("current", "<f4"),
+    ("temperature", "<i2"),
+    ("flags", "u1"),
+    ("num_outlets", "u1"),
+]
+
+FILE_SUFFIX = ".ncts"
+
+# Record flags
+FLAG_BLOCK = 0x01  # First record of a block
+FLAG_START = 0x02  # First record after the recorder (re)started; gap before
+FLAG_HEARTBEAT = 0x04  # Written because the heartbeat interval passed
+FLAG_ERROR = 0x08  # Poll failed; values are the last known status
+
+TEMPERATURE_NONE = -32768
+
+DEFAULT_BLOCK_RECORDS = 4096
+DEFAULT_HEARTBEAT = 60.0  # seconds
+DEFAULT_CURRENT_DEADBAND = 0.05  # Amps
+DEFAULT_FLUSH_INTERVAL = 10.0  # seconds
+
+
+class Sample(NamedTuple):
+    """One recorded status."""
+
+    timestamp: float
+    bitmask: int
+    current: float
+    temperature: Optional[float]  # °C, None without a sensor
+    flags: int
+    num_outlets: int
+
+    @property
+    def error(self) -> bool:
+        """Whether the poll failed (values are the last known status)."""
+        return bool(self.flags & FLAG_ERROR)
+
+    def get_outlet_state(self, outlet_number: int) -> bool:
+        """Get state of an outlet."""
+        return bool(self.bitmask >> (outlet_number - 1) & 1)
+
+
+def encode_temperature(temperature: Optional[Union[float, str]]) -> int:
+    """Encode a temperature reading ("XX" means no sensor) in tenths of °C."""
+    if temperature is None:
+        return TEMPERATURE_NONE
+    try:
+        value = round(float(temperature) * 10)
+    except ValueError:
+        return TEMPERATURE_NONE
+    return max(-32767, min(32767, value))
+
+
+def decode_temperature(value: int) -> Optional[float]:
+    """Decode a stored temperature to °C."""
+    return None if value == TEMPERATURE_NONE else value / 10
+
+
+def series_path(directory: str, device: str) -> str:
+    """Get the file of a device's series ("10.0.0.1:80" → 10.0.0.1_80.ncts)."""
+    name = re.sub(r"[^A-Za-z0-9.-]", "_", device)
+    return os.path.join(directory, name + FILE_SUFFIX)
+
+
+def _read_header(data: bytes, path: str) -> tuple[int, float, str]:
+    """Check a file header; returns block records, created and device."""
+    if len(data) < HEADER.size:
+        raise ValueError(f"{path}: Truncated header")
+    magic, version, record_size, block_records, created, device = (
+        HEADER.unpack_from(data)
+    )
+    if magic != MAGIC:
+        raise ValueError(f"{path}: Not a netCommander series file")
+    if version != VERSION or record_size != RECORD.size:
+        raise ValueError(f"{path}: Unsupported format version {version}")
+    if block_records < 1:
+        raise ValueError(f"{path}: Invalid block size {block_records}")
+    return block_records, created, device.rstrip(b"\0").decode("utf-8", "replace")
+
+
+class SeriesWriter:
+    """Append a device's statuses to its series file.
+
+    Appending to an existing file continues it; a partial record left by a
+    crash is cut off first.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        device: str,
+        heartbeat: float = DEFAULT_HEARTBEAT,
+        current_deadband: float = DEFAULT_CURRENT_DEADBAND,
+        block_records: int = DEFAULT_BLOCK_RECORDS,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ):
+        """Open or create the file.
+
+        Args:
+            path: File path
+            device: Device name stored in a new file's header
+            heartbeat: Write a record at least this often in seconds, even
+                if nothing changed (default: 60)
+            current_deadband: Smallest current change in Amps that is
+                recorded before the heartbeat (default: 0.05)
+            block_records: Records per index block of a new file; existing
+                files keep theirs (default: 4096)
+            flush_interval: Seconds of records buffered before writing them
+                to disk, checked on every append (default: 10)
+
+        Raises:
+            ValueError: File exists but is not a series file
+        """
+        self.path = path
+        self.device = device
+        self.heartbeat = heartbeat
+        self.current_deadband = current_deadband
+        self.flush_interval = flush_interval
+
+        self._file = open(path, "a+b")
+        self._file.seek(0)
+        header = self._file.read(HEADER.size)
+        self._last: Optional[Sample]
+        if header:
+            self.block_records, _, _ = _read_header(header, path)
+            size = os.fstat(self._file.fileno()).st_size
+            self.records = (size - HEADER.size) // RECORD.size
+            end = HEADER.size + self.records * RECORD.size
+            if end != size:
+                _LOGGER.warning("Cutting partial record off %s", path)
+                self._file.truncate(end)
+            self._last = self._read_last()
+        else:
+            self.block_records = block_records
+            self.records = 0
+            self._last = None
+            self._file.write(
+                HEADER.pack(
+                    MAGIC,
+                    VERSION,
+                    RECORD.size,
+                    block_records,
+                    time.time(),
+                    device.encode("utf-8")[:_DEVICE_NAME_SIZE],
+                )
+            )
+        self._buffer = bytearray()
+        self._buffered_since: Optional[float] = None
+        self._started = False
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+    def _read_last(self) -> Optional[Sample]:
+        """Read the last record of the file."""
+        if not self.records:
+            return None
+        self._file.seek(HEADER.size + (self.records - 1) * RECORD.size)
+        return _sample(RECORD.unpack(self._file.read(RECORD.size)))
+
+    def append(
+        self, timestamp: float, status: Optional[CompactStatus]
+    ) -> bool:
+        """Record a poll result if it changes the series.
+
+        Args:
+            timestamp: Wall clock time of the poll
+            status: Status read, or None if the poll failed
+
+        Returns:
+            True if a record was written
+        """
+        written = self._append(timestamp, status)
+        # Also on polls that change nothing, so a steady series is still
+        # on disk within the flush interval
+        if (
+            self._buffered_since is not None
+            and timestamp - self._buffered_since >= self.flush_interval
+        ):
+            self.flush()
+        return written
+
+    def _append(self, timestamp: float, status: Optional[CompactStatus]) -> bool:
+        """Buffer a record for a poll result if it changes the series."""
+        last = self._last
+        if last is not None:
+            # Keep timestamps ordered even if the wall clock stepped back
+            timestamp = max(timestamp, last.timestamp)
+
+        flags = self._flags(timestamp, status, last)
+        if flags is None:
+            return False
+
+        if status is None:
+            if last is None:
+                # Nothing known yet to carry forward
+                return False
+            bitmask, num_outlets = last.bitmask, last.num_outlets
+            current = last.current
+            temperature = encode_temperature(last.temperature)
+            flags |= FLAG_ERROR
+        else:
+            bitmask, num_outlets = status.bitmask, status.num_outlets
+            current = status.total_current_amps
+            temperature = encode_temperature(status.temperature)
+        if self.records % self.block_records == 0:
+            flags |= FLAG_BLOCK
+
+        record = (
+            timestamp,
+            bitmask,
+            current,
+            temperature,
+            flags,
+            min(num_outlets, 255),
+        )
+        self._buffer += RECORD.pack(*record)
+        self._last = _sample(record)
+        self._started = True
+        self.records += 1
+        if self._buffered_since is None:
+            self._buffered_since = timestamp
+        return True
+
+    def _flags(
+        self, timestamp: float, status: Optional[CompactStatus], last: Optional[Sample]
+    ) -> Optional[int]:
+        """Get the flags of a poll result's record, or None to skip it."""
+        if not self._started or last is None:
+            return FLAG_START
+        if status is None and not last.error:
+            # Record the first failed poll, then only heartbeats
+            return 0
+        if status is not None and self._changed(status, last):
+            return 0
+        if not self._heartbeat_due(timestamp, last):
+            return None
+        return FLAG_HEARTBEAT
+
+    def _changed(self, status: CompactStatus, last: Sample) -> bool:
+        """Check if a status differs from the last record."""
+        return (
+            last.error
+            or status.bitmask != last.bitmask
+            or status.num_outlets != last.num_outlets
+            or encode_temperature(status.temperature)
+            != encode_temperature(last.temperature)
+            or abs(status.total_current_amps - last.current)
+            >= self.current_deadband
+        )
+
+    def _heartbeat_due(self, timestamp: float, last: Sample) -> bool:
+        """Check if the heartbeat interval passed since the last record."""
+        return timestamp - last.timestamp >= self.heartbeat
+
+    def flush(self) -> None:
+        """Write buffered records to disk."""
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._file.flush()
+            self._buffer.clear()
+        self._buffered_since = None
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+
+def _sample(record: tuple) -> Sample:
+    """Build a Sample from an unpacked record."""
+    timestamp, bitmask, current, temperature, flags, num_outlets = record
+    # Stored as float32; round off the representation error
+    return Sample(
+        timestamp,
+        bitmask,
+        round(current, 4),
+        decode_temperature(temperature),
+        flags,
+        num_outlets,
+    )
+
+
+class SeriesReader:
+    """Read a device's series file through a memory map.
+
+    Opening is instant regardless of size; records are decoded on access.
+
+    Example:
+        >>> with SeriesReader("recordings/10.0.0.1_80.ncts") as series:
+        ...     for sample in series.samples(start=time.time() - 3600):
+        ...         print(sample.timestamp, sample.current)
+    """
+
+    def __init__(self, path: str):
+        """Open the file.
+
+        Raises:
+            ValueError: File is not a series file
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            self.block_records, self.created, self.device = _read_header(
+                f.read(HEADER.size), path
+            )
+            self._map = (
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                if size > HEADER.size
+                else None
+            )
+        # Records are read from here; empty without records or once closed
+        self._data: Union[mmap.mmap, bytes] = (
+            self._map if self._map is not None else b""
+        )
+        # Records written after opening are not seen; a trailing partial
+        # record is ignored
+        self._records = (size - HEADER.size) // RECORD.size
+        self._index: Optional[array] = None
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Number of records."""
+        return self._records
+
+    def __getitem__(self, position: int) -> Sample:
+        """Get a record."""
+        if position < 0:
+            position += self._records
+        if not 0 <= position < self._records:
+            raise IndexError(position)
+        return _sample(
+            RECORD.unpack_from(self._data, HEADER.size + position * RECORD.size)
+        )
+
+    def close(self) -> None:
+        """Release the memory map."""
+        self._data = b""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def _timestamp(self, position: int) -> float:
+        """Read the timestamp of a record."""
+        timestamp: float = struct.unpack_from(
+            "<d", self._data, HEADER.size + position * RECORD.size
+        )[0]
+        return timestamp
+
+    def index(self) -> array:
+        """Start timestamps of the blocks (read once, from block records)."""
+        if self._index is None:
+            self._index = array(
+                "d",
+                (
+                    self._timestamp(position)
+                    for position in range(0, self._records, self.block_records)
+                ),
+            )
+        return self._index
+
+    def find(self, timestamp: float) -> int:
+        """Get the position of the first record at or after a time."""
+        # The index narrows the search to the last block starting before the
+        # time; with equal timestamps across a block boundary, the first
+        # match can be at the end of that block
+        block = bisect.bisect_left(self.index(), timestamp) - 1
+        if block < 0:
+            return 0
+        low = block * self.block_records
+        high = min(low + self.block_records, self._records)
+        while low < high:
+            middle = (low + high) // 2
+            if self._timestamp(middle) < timestamp:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _range(self, start: Optional[float], end: Optional[float]) -> range:
+        """Positions of the records from start (inclusive) to end (exclusive)."""
+        first = self.find(start) if start is not None else 0
+        last = self.find(end) if end is not None else self._records
+        return range(first, max(first, last))
+
+    def samples(
+        self, start: Optional[float] = None, end: Optional[float] = None
+    ) -> Iterator[Sample]:
+        """Iterate over the records from start (inclusive) to end (exclusive)."""
+        positions = self._range(start, end)
+        if not positions:
+            return
+        offset = HEADER.size + positions.start * RECORD.size
+        data = self._data[offset : offset + len(positions) * RECORD.size]
+        for record in RECORD.iter_unpack(data):
+            yield _sample(record)
+
+    def columns(
+        self, start: Optional[float] = None, end: Optional[float] = None
+    ) -> dict[str, array]:
+        """Read the records from start to end as column arrays.
+
+        Returns:
+            Arrays keyed by RECORD_DTYPE field name; temperature is in
+            tenths of °C with TEMPERATURE_NONE for no sensor
+        """
+        columns: dict[str, array] = {
+            "timestamp": array("d"),
+            "bitmask": array("Q"),
+            "current": array("f"),
+            "temperature": array("h"),
+            "flags": array("B"),
+            "num_outlets": array("B"),
+        }
+        positions = self._range(start, end)
+        if not positions:
+            return columns
+        offset = HEADER.size + positions.start * RECORD.size
+        data = self._data[offset : offset + len(positions) * RECORD.size]
+        appends = [column.append for column in columns.values()]
+        for record in RECORD.iter_unpack(data):
+            for append, value in zip(appends, record, strict=True):
+                append(value)
+        return columns
+
+
+class Recorder:
+    """Record poll results of many devices, one series file each.
+
+    Subscribe it to a Poller; files are opened on a device's first result
+    and appended to across restarts. Every flush interval all files are
+    flushed, also those of devices whose polls stopped.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        heartbeat: float = DEFAULT_HEARTBEAT,
+        current_deadband: float = DEFAULT_CURRENT_DEADBAND,
+        block_records: int = DEFAULT_BLOCK_RECORDS,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ):
+        """Initialize the recorder.
+
+        Args:
+            directory: Directory of the series files (created if missing)
+            heartbeat: Write a record at least this often in seconds
+            current_deadband: Smallest current change in Amps recorded
+                before the heartbeat
+            block_records: Records per index block of new files
+            flush_interval: Seconds of records buffered before writing them
+        """
+        self.directory = directory
+        self.heartbeat = heartbeat
+        self.current_deadband = current_deadband
+        self.block_records = block_records
+        self.flush_interval = flush_interval
+        self.written = 0
+        self._writers: dict[str, SeriesWriter] = {}
+        self._flushed_at = time.monotonic()
+        os.makedirs(directory, exist_ok=True)
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+    def __call__(self, result) -> None:
+        """Record a PollResult (Poller subscriber)."""
+        if self.append(result.device, result.timestamp, result.status):
+            self.written += 1
+        if time.monotonic() - self._flushed_at >= self.flush_interval:
+            self.flush()
+
+    def writer(self, device: str) -> SeriesWriter:
+        """Get the writer of a device, opening its file on first use."""
+        writer = self._writers.get(device)
+        if writer is None:
+            writer = SeriesWriter(
+                series_path(self.directory, device),
+                device,
+                heartbeat=self.heartbeat,
+                current_deadband=self.current_deadband,
+                block_records=self.block_records,
+                flush_interval=self.flush_interval,
+            )
+            self._writers[device] = writer
+        return writer
+
+    def append(
+        self, device: str, timestamp: float, status: Optional[CompactStatus]
+    ) -> bool:
+        """Record a device's status (None if the poll failed)."""
+        return self.writer(device).append(timestamp, status)
+
+    def flush(self) -> None:
+        """Write every device's buffered records to disk."""
+        for writer in self._writers.values():
+            writer.flush()
+        self._flushed_at = time.monotonic()
+
+    def close(self) -> None:
+        """Flush and close every file."""
+        for writer in self._writers.values():
+            writer.close()
+        self._writers.clear()
@@ -0,0 +1,160 @@
+"""Adaptive request timeouts for netCommander API client.
+
+Timeouts follow TCP's retransmission timer (RFC 6298): each device keeps a
+smoothed round-trip time (SRTT) and its mean deviation (RTTVAR), and the
+timeout is SRTT + 4 * RTTVAR, clamped between a floor and a ceiling. A
+healthy PDU answering in 30 ms is declared unreachable after the floor
+instead of the full ceiling; a device on a slow link earns a longer
+timeout from its own samples. A timeout doubles the estimate (exponential
+backoff) until the next good sample.
+
+Estimates belong to the device and are shared by all of its clients; the
+floor and ceiling belong to each client. Connect and read phases are
+estimated separately. Transports that cannot time the connect phase on its
+own only feed the read estimator, and the connect timeout falls back to it.
+"""
+
+import weakref
+from typing import Optional
+
+from .const import DEFAULT_INITIAL_TIMEOUT, DEFAULT_MIN_TIMEOUT, DEFAULT_TIMEOUT
+
+# RFC 6298 gains and variance multiplier
+_ALPHA = 1 / 8
+_BETA = 1 / 4
+_K = 4
+
+# Backoff never grows the timeout past this multiple of the estimate
+_MAX_BACKOFF = 64
+
+
+class RttEstimator:
+    """Smoothed round-trip time estimator.
+
+    Example:
+        >>> rtt = RttEstimator()
+        >>> rtt.observe(0.030)
+        >>> rtt.rto
+        0.09
+    """
+
+    __slots__ = ("srtt", "rttvar", "samples", "_backoff", "__weakref__")
+
+    def __init__(self):
+        """Initialize an estimator without samples."""
+        self.srtt: Optional[float] = None
+        self.rttvar = 0.0
+        self.samples = 0
+        self._backoff = 1
+
+    @property
+    def rto(self) -> Optional[float]:
+        """Retransmission-style timeout in seconds (None without samples)."""
+        if self.srtt is None:
+            return None
+        return (self.srtt + _K * self.rttvar) * self._backoff
+
+    def observe(self, rtt: float) -> None:
+        """Add a round-trip time sample in seconds."""
+        if self.srtt is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar = (1 - _BETA) * self.rttvar + _BETA * abs(self.srtt - rtt)
+            self.srtt = (1 - _ALPHA) * self.srtt + _ALPHA * rtt
+        self.samples += 1
+        self._backoff = 1
+
+    def backoff(self) -> None:
+        """Double the timeout after a request timed out."""
+        self._backoff = min(self._backoff * 2, _MAX_BACKOFF)
+
+
+class AdaptiveTimeouts:
+    """Connect and read timeouts for one client of a device.
+
+    Example:
+        >>> timeouts = AdaptiveTimeouts(min_timeout=0.5, max_timeout=10)
+        >>> timeouts.read.observe(0.030)
+        >>> timeouts.read_timeout()
+        0.5
+    """
+
+    def __init__(
+        self,
+        min_timeout: float = DEFAULT_MIN_TIMEOUT,
+        max_timeout: float = DEFAULT_TIMEOUT,
+        connect: Optional[RttEstimator] = None,
+        read: Optional[RttEstimator] = None,
+    ):
+        """Initialize the timeouts.
+
+        Args:
+            min_timeout: Floor for derived timeouts in seconds
+            max_timeout: Ceiling for derived timeouts in seconds
+            connect: Connect phase estimator (default: a new one)
+            read: Request/response phase estimator (default: a new one)
+        """
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.connect = connect if connect is not None else RttEstimator()
+        self.read = read if read is not None else RttEstimator()
+
+    def connect_timeout(self) -> float:
+        """Timeout for establishing a connection."""
+        rto = self.connect.rto
+        if rto is None:
+            rto = self.read.rto
+        return self._clamp(rto)
+
+    def read_timeout(self) -> float:
+        """Timeout for sending a request and reading its response."""
+        return self._clamp(self.read.rto)
+
+    def _clamp(self, rto: Optional[float]) -> float:
+        """Clamp an estimate to the floor and ceiling."""
+        if rto is None:
+            rto = DEFAULT_INITIAL_TIMEOUT
+        return min(max(rto, self.min_timeout), self.max_timeout)
+
+
+# Estimators per device and phase, shared by every client in the process
+_ESTIMATORS: "weakref.WeakValueDictionary[tuple[str, int, str], RttEstimator]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _get_estimator(host: str, port: int, phase: str) -> RttEstimator:
+    """Get the shared estimator for one phase of a device."""
+    key = (host, port, phase)
+    estimator = _ESTIMATORS.get(key)
+    if estimator is None:
+        estimator = RttEstimator()
+        _ESTIMATORS[key] = estimator
+    return estimator
+
+
+def get_adaptive_timeouts(
+    host: str,
+    port: int,
+    min_timeout: float = DEFAULT_MIN_TIMEOUT,
+    max_timeout: float = DEFAULT_TIMEOUT,
+) -> AdaptiveTimeouts:
+    """Get timeouts for a device backed by its shared RTT estimates.
+
+    Args:
+        host: Device IP address or hostname
+        port: Device port
+        min_timeout: Floor for derived timeouts in seconds
+        max_timeout: Ceiling for derived timeouts in seconds
+
+    Returns:
+        AdaptiveTimeouts using the estimators shared by all clients of
+        this device
+    """
+    return AdaptiveTimeouts(
+        min_timeout,
+        max_timeout,
+        connect=_get_estimator(host, port, "connect"),
+        read=_get_estimator(host, port, "read"),
+    )
@@ -0,0 +1,247 @@
+"""Per-device command scheduling for netCommander API client.
+
+The netBooter firmware serves one HTTP request at a time and drops
+connections when requests overlap. Every request to a device therefore goes
+through a CommandScheduler that serializes them, runs user commands ($A3,
+rly) ahead of background polls ($A5, $A8) and folds repeated polls that are
+still waiting in the queue into a single request. Polls are only folded
+between callers with the same fold key (credentials and transport), so no
+client is handed a response fetched with another client's credentials.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+import weakref
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+from .models import SchedulerStats
+from .const import CMD_SET_OUTLET, CMD_TOGGLE_OUTLET
+
+_LOGGER = logging.getLogger(__name__)
+
+# Lower value runs first
+PRIORITY_COMMAND = 0  # User commands that change outlet state
+PRIORITY_POLL = 1  # Background reads ($A5, $A8, web page)
+
+
+def command_priority(command: str) -> int:
+    """Get scheduling priority for a command string."""
+    if command.startswith((CMD_SET_OUTLET, CMD_TOGGLE_OUTLET)):
+        return PRIORITY_COMMAND
+    return PRIORITY_POLL
+
+
+class _QueuedRequest:
+    """A request waiting for (or holding) a slot on the device."""
+
+    __slots__ = ("command", "key", "request", "future", "enqueued_at", "waiters")
+
+    def __init__(
+        self,
+        command: str,
+        key: Hashable,
+        request: Callable[[], Awaitable[Any]],
+        future: asyncio.Future,
+    ):
+        self.command = command
+        self.key = key
+        self.request = request
+        self.future = future
+        self.enqueued_at = time.monotonic()
+        self.waiters = 0
+
+
+class CommandScheduler:
+    """Serialize requests to one device, running user commands first.
+
+    Requests are queued by priority, then arrival order. A poll submitted
+    while an identical poll with the same fold key is still queued is
+    superseded: both callers share the single request that runs when the
+    slot frees up.
+
+    Example:
+        >>> scheduler = get_scheduler("192.168.1.100", 80)
+        >>> response = await scheduler.submit("$A5", fetch_status)
+        >>> scheduler.stats().queue_depth
+        0
+    """
+
+    def __init__(self, max_concurrency: int = 1):
+        """Initialize the scheduler.
+
+        Args:
+            max_concurrency: Requests allowed on the device at once (default: 1)
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+        self.max_concurrency = max_concurrency
+
+        self._queue: list[tuple[int, int, _QueuedRequest]] = []
+        self._queued_polls: dict[tuple[Hashable, str], _QueuedRequest] = {}
+        self._sequence = itertools.count()
+        self._in_flight = 0
+        self._tasks: set[asyncio.Task] = set()
+
+        self._completed = 0
+        self._superseded = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._last_wait = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of requests waiting for a slot."""
+        return len(self._queue)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently running against the device."""
+        return self._in_flight
+
+    def stats(self) -> SchedulerStats:
+        """Get a snapshot of queue depth and wait time statistics."""
+        started = self._completed + self._in_flight
+        return SchedulerStats(
+            queue_depth=self.queue_depth,
+            in_flight=self._in_flight,
+            completed=self._completed,
+            superseded=self._superseded,
+            last_wait=self._last_wait,
+            max_wait=self._max_wait,
+            mean_wait=self._total_wait / started if started else 0.0,
+        )
+
+    async def submit(
+        self,
+        command: str,
+        request: Callable[[], Awaitable[Any]],
+        priority: Optional[int] = None,
+        key: Hashable = None,
+    ) -> Any:
+        """Queue a request and wait for its result.
+
+        Args:
+            command: Command string, used for priority and poll supersession
+            request: Coroutine function performing the actual request
+            priority: Override priority (default: derived from command)
+            key: Fold key; polls are only superseded by polls with an equal
+                key (e.g. a client's credentials and transport)
+
+        Returns:
+            Whatever the request coroutine returns
+        """
+        if priority is None:
+            priority = command_priority(command)
+
+        poll_key = (key, command)
+        entry = self._queued_polls.get(poll_key) if priority >= PRIORITY_POLL else None
+        if entry is not None:
+            self._superseded += 1
+            _LOGGER.debug("Poll %s superseded by newer request", command)
+        else:
+            future = asyncio.get_running_loop().create_future()
+            # Mark the exception as retrieved in case every waiter went away
+            future.add_done_callback(_retrieve_exception)
+            entry = _QueuedRequest(command, key, request, future)
+            heapq.heappush(self._queue, (priority, next(self._sequence), entry))
+            if priority >= PRIORITY_POLL:
+                self._queued_polls[poll_key] = entry
+
+        entry.waiters += 1
+        self._dispatch()
+        try:
+            # Shield so one cancelled waiter does not cancel a shared request
+            return await asyncio.shield(entry.future)
+        finally:
+            entry.waiters -= 1
+
+    def _dispatch(self) -> None:
+        """Start queued requests while slots are free."""
+        while self._queue and self._in_flight < self.max_concurrency:
+            _, _, entry = heapq.heappop(self._queue)
+            poll_key = (entry.key, entry.command)
+            if self._queued_polls.get(poll_key) is entry:
+                del self._queued_polls[poll_key]
+
+            if not entry.waiters:
+                # Every caller was cancelled while queued
+                entry.future.cancel()
+                continue
+
+            wait = time.monotonic() - entry.enqueued_at
+            self._last_wait = wait
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+
+            self._in_flight += 1
+            task = asyncio.get_running_loop().create_task(self._run(entry))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, entry: _QueuedRequest) -> None:
+        """Run one request and publish its outcome."""
+        try:
+            result = await entry.request()
+        except asyncio.CancelledError:
+            entry.future.cancel()
+            raise
+        except Exception as err:
+            entry.future.set_exception(err)
+        else:
+            entry.future.set_result(result)
+        finally:
+            self._in_flight -= 1
+            self._completed += 1
+            self._dispatch()
+
+
+def _retrieve_exception(future: asyncio.Future) -> None:
+    """Mark a future's exception as retrieved."""
+    if not future.cancelled():
+        future.exception()
+
+
+# One scheduler per device, shared by every client in the process
+_SCHEDULERS: "weakref.WeakValueDictionary[tuple[str, int], CommandScheduler]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def get_scheduler(host: str, port: int, max_concurrency: int = 1) -> CommandScheduler:
+    """Get the shared scheduler for a device, creating it if needed.
+
+    Every client of a device shares its scheduler, since the device serves
+    requests one at a time whoever sends them. The strictest limit wins: a
+    client asking for a lower max_concurrency than the scheduler has lowers
+    it for all clients, a higher one is capped at the current limit.
+
+    Args:
+        host: Device IP address or hostname
+        port: Device port
+        max_concurrency: Requests allowed on the device at once (default: 1)
+
+    Returns:
+        CommandScheduler shared by all clients of this device
+    """
+    key = (host, port)
+    scheduler = _SCHEDULERS.get(key)
+    if scheduler is None:
+        scheduler = CommandScheduler(max_concurrency)
+        _SCHEDULERS[key] = scheduler
+    elif max_concurrency != scheduler.max_concurrency:
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+        if max_concurrency < scheduler.max_concurrency:
+            scheduler.max_concurrency = max_concurrency
+        else:
+            _LOGGER.debug(
+                "max_concurrency %d for %s:%d capped at %d set by another client",
+                max_concurrency,
+                host,
+                port,
+                scheduler.max_concurrency,
+            )
+    return scheduler
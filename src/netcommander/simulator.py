@@ -0,0 +1,389 @@
+"""Simulated netCommander devices for load testing and benchmarks.
+
+Implements the device's HTTP interface (``/cmd.cgi`` with $A5, $A3, rly
+and $A8, Basic auth and the root page with the MAC address) on aiohttp's
+web server. One DeviceSimulator serves any number of virtual devices, each
+on its own port, from a single process and event loop.
+
+Each device can be given a response latency distribution, injected $AF
+errors and hung requests, and the firmware's habit of serving one request
+at a time: by default a request that arrives while another is being
+served gets its connection dropped, as the real device does.
+
+Example:
+    >>> async with DeviceSimulator() as simulator:
+    ...     devices = await simulator.add_devices(
+    ...         100, latency=uniform_latency(0.01, 0.05)
+    ...     )
+    ...     async with NetCommanderClient(
+    ...         "127.0.0.1", "admin", "admin", port=devices[0].port
+    ...     ) as client:
+    ...         status = await client.get_status()
+
+Thousands of devices need as many listening sockets; raise the open file
+limit (``ulimit -n``) accordingly.
+"""
+
+import asyncio
+import base64
+import logging
+import math
+import random
+import socket
+from collections import Counter
+from typing import Callable, Optional, Union
+from urllib.parse import unquote_plus
+
+from aiohttp import web
+
+from .const import (
+    CMD_ENDPOINT,
+    CMD_GET_INFO,
+    CMD_GET_STATUS,
+    CMD_SET_OUTLET,
+    CMD_TOGGLE_OUTLET,
+    RESPONSE_FAILED,
+    RESPONSE_SUCCESS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# What a device does with a request that arrives while it is busy
+OVERLAP_DROP = "drop"  # Close the connection (firmware behaviour)
+OVERLAP_QUEUE = "queue"  # Serve requests one after another
+OVERLAP_ALLOW = "allow"  # Serve requests concurrently
+
+# Seconds a hung request is held before the connection is closed
+DEFAULT_HANG_TIME = 3600.0
+
+_FAILED = f"{RESPONSE_FAILED}\r\n\r\n".encode("ascii")
+_SUCCESS = f"{RESPONSE_SUCCESS}\r\n\r\n".encode("ascii")
+
+Latency = Union[float, Callable[[], float]]
+
+
+def uniform_latency(
+    low: float, high: float, rng: Optional[random.Random] = None
+) -> Callable[[], float]:
+    """Latency drawn uniformly between low and high seconds."""
+    rng = rng or random.Random()
+    return lambda: rng.uniform(low, high)
+
+
+def lognormal_latency(
+    median: float, sigma: float = 0.5, rng: Optional[random.Random] = None
+) -> Callable[[], float]:
+    """Long-tailed latency with the given median in seconds.
+
+    sigma is the standard deviation of the underlying normal distribution;
+    0.5 puts p99 at about 3.2 times the median.
+    """
+    rng = rng or random.Random()
+    mu = math.log(median)
+    return lambda: rng.lognormvariate(mu, sigma)
+
+
+class SimulatedDevice:
+    """State and behaviour of one virtual netCommander device.
+
+    Outlet state is kept as a bitmask (bit 0 is outlet 1), like the status
+    response. ``counts`` tallies requests by outcome: "ok", "failed",
+    "hung", "dropped" and "unauthorized".
+    """
+
+    def __init__(
+        self,
+        num_outlets: int = 5,
+        username: str = "admin",
+        password: str = "admin",
+        latency: Latency = 0.0,
+        error_rate: float = 0.0,
+        timeout_rate: float = 0.0,
+        overlap: str = OVERLAP_DROP,
+        model: str = "NP0501DU",
+        mac_address: Optional[str] = None,
+        temperature: str = "XX",
+        outlets: int = 0,
+        rng: Optional[random.Random] = None,
+    ):
+        """Initialize the device.
+
+        Args:
+            num_outlets: Number of outlets (default: 5)
+            username: Accepted username
+            password: Accepted password
+            latency: Seconds before each response, or a function returning
+                them (see uniform_latency, lognormal_latency)
+            error_rate: Fraction of commands answered with $AF
+            timeout_rate: Fraction of requests that hang without a response
+            overlap: What to do with a request that arrives while another is
+                served: OVERLAP_DROP (default), OVERLAP_QUEUE or OVERLAP_ALLOW
+            model: Model reported by $A8
+            mac_address: MAC address on the root page (default: random)
+            temperature: Temperature reported by $A5 ("XX" if no sensor)
+            outlets: Initial outlet bitmask (default: all off)
+            rng: Random number generator for the injected faults
+        """
+        if overlap not in (OVERLAP_DROP, OVERLAP_QUEUE, OVERLAP_ALLOW):
+            raise ValueError(f"Unknown overlap behaviour: {overlap!r}")
+
+        self.num_outlets = num_outlets
+        self.latency = latency
+        self.error_rate = error_rate
+        self.timeout_rate = timeout_rate
+        self.overlap = overlap
+        self.model = model
+        self.temperature = temperature
+        self.outlets = outlets
+        self.port: Optional[int] = None
+        self.counts: Counter = Counter()
+
+        self._random = rng or random.Random()
+        self.mac_address = mac_address or "0C:73:EB:" + ":".join(
+            f"{self._random.randrange(256):02X}" for _ in range(3)
+        )
+        self._auth = "Basic " + base64.b64encode(
+            f"{username}:{password}".encode("latin-1")
+        ).decode("ascii")
+        self._busy = False
+        self._lock = asyncio.Lock()
+
+    @property
+    def current(self) -> float:
+        """Simulated current draw in Amps (0.06 A idle, 0.2 A per outlet on)."""
+        return 0.06 + 0.2 * bin(self.outlets).count("1")
+
+    def get_outlet_state(self, outlet_number: int) -> bool:
+        """Get state of an outlet."""
+        return bool(self.outlets >> (outlet_number - 1) & 1)
+
+    def execute(self, command: str) -> bytes:
+        """Run a command and return the response body.
+
+        Args:
+            command: Decoded command (e.g. "$A5", "$A3 1 1", "rly=0")
+
+        Returns:
+            Response body as the device sends it
+        """
+        if command == CMD_GET_STATUS:
+            bits = format(self.outlets, f"0{self.num_outlets}b")
+            return (
+                f"{RESPONSE_SUCCESS},{bits},{self.current:.2f},"
+                f"{self.temperature}\r\n\r\n\r\n"
+            ).encode("ascii")
+
+        if command == CMD_GET_INFO:
+            return (
+                f"{RESPONSE_SUCCESS},{self.model}, HW4.3 BL1.6 -7.72-8.5\r\n"
+            ).encode("ascii")
+
+        if command.startswith(CMD_SET_OUTLET + " "):
+            try:
+                _, outlet_text, value = command.split()
+                outlet = int(outlet_text)
+            except ValueError:
+                return _FAILED
+            if not 1 <= outlet <= self.num_outlets or value not in ("0", "1"):
+                return _FAILED
+            if value == "1":
+                self.outlets |= 1 << (outlet - 1)
+            else:
+                self.outlets &= ~(1 << (outlet - 1))
+            return _SUCCESS
+
+        if command.startswith(CMD_TOGGLE_OUTLET + "="):
+            try:
+                index = int(command[len(CMD_TOGGLE_OUTLET) + 1 :])
+            except ValueError:
+                return _FAILED
+            if not 0 <= index < self.num_outlets:
+                return _FAILED
+            self.outlets ^= 1 << index
+            return _SUCCESS
+
+        return _FAILED
+
+    def page(self) -> bytes:
+        """Root page of the web interface."""
+        return (
+            "<html><head><title>netBooter</title></head><body>"
+            f"<p>Model: {self.model}</p><p>MAC Address: {self.mac_address}</p>"
+            "</body></html>"
+        ).encode("latin-1")
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        """Serve one HTTP request."""
+        if request.headers.get("Authorization") != self._auth:
+            self.counts["unauthorized"] += 1
+            return web.Response(
+                status=401,
+                headers={"WWW-Authenticate": 'Basic realm="netBooter"'},
+            )
+
+        if self.overlap == OVERLAP_QUEUE:
+            async with self._lock:
+                return await self._serve(request)
+        if self.overlap == OVERLAP_DROP and self._busy:
+            self.counts["dropped"] += 1
+            _drop_connection(request)
+            return web.Response(status=503)
+
+        self._busy = True
+        try:
+            return await self._serve(request)
+        finally:
+            self._busy = False
+
+    async def _serve(self, request: web.Request) -> web.Response:
+        """Apply latency and fault injection, then run the request."""
+        latency = self.latency() if callable(self.latency) else self.latency
+        if latency > 0:
+            await asyncio.sleep(latency)
+
+        if self.timeout_rate and self._random.random() < self.timeout_rate:
+            self.counts["hung"] += 1
+            await asyncio.sleep(DEFAULT_HANG_TIME)
+            _drop_connection(request)
+            return web.Response(status=504)
+
+        if request.path == "/":
+            body = self.page()
+        elif self.error_rate and self._random.random() < self.error_rate:
+            self.counts["failed"] += 1
+            return web.Response(body=_FAILED, content_type="text/html")
+        else:
+            body = self.execute(unquote_plus(request.query_string))
+
+        self.counts["ok" if not body.startswith(_FAILED) else "failed"] += 1
+        return web.Response(body=body, content_type="text/html")
+
+
+class DeviceSimulator:
+    """Serve many simulated devices from one aiohttp server.
+
+    Every device listens on its own port; all ports share one application
+    and event loop.
+    """
+
+    def __init__(self, host: str = "127.0.0.1"):
+        """Initialize the simulator.
+
+        Args:
+            host: Address to listen on (default: loopback only)
+        """
+        self.host = host
+        self.devices: dict[int, SimulatedDevice] = {}
+        self._runner: Optional[web.AppRunner] = None
+        self._sites: dict[int, web.SockSite] = {}
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.stop()
+
+    async def start(self) -> None:
+        """Start the server (devices can be added before or after)."""
+        await self._start()
+
+    async def _start(self) -> web.AppRunner:
+        """Start the server if needed and return its runner."""
+        if self._runner is not None:
+            return self._runner
+        app = web.Application()
+        app.router.add_get("/", self._handle)
+        app.router.add_get(CMD_ENDPOINT, self._handle)
+        runner = web.AppRunner(app, access_log=None, handle_signals=False)
+        await runner.setup()
+        self._runner = runner
+        return runner
+
+    async def stop(self) -> None:
+        """Stop serving every device."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+        self._sites.clear()
+
+    async def add_device(
+        self,
+        device: Optional[SimulatedDevice] = None,
+        port: int = 0,
+        **options,
+    ) -> SimulatedDevice:
+        """Start serving a device.
+
+        Args:
+            device: Device to serve (default: a new SimulatedDevice)
+            port: Port to listen on (default: any free port)
+            **options: SimulatedDevice options when no device is given
+
+        Returns:
+            The device, with its port set
+        """
+        runner = await self._start()
+        if device is None:
+            device = SimulatedDevice(**options)
+
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            sock.bind((self.host, port))
+        except OSError:
+            sock.close()
+            raise
+        device.port = sock.getsockname()[1]
+
+        site = web.SockSite(runner, sock, backlog=128)
+        await site.start()
+        self.devices[device.port] = device
+        self._sites[device.port] = site
+        _LOGGER.debug("Simulating %s on %s:%d", device.model, self.host, device.port)
+        return device
+
+    async def add_devices(
+        self, count: int, first_port: int = 0, **options
+    ) -> list[SimulatedDevice]:
+        """Start serving several identically configured devices.
+
+        Args:
+            count: Number of devices
+            first_port: Port of the first device, the others follow it
+                (default: any free ports)
+            **options: SimulatedDevice options
+
+        Returns:
+            The devices, with their ports set
+        """
+        return [
+            await self.add_device(port=first_port + i if first_port else 0, **options)
+            for i in range(count)
+        ]
+
+    async def remove_device(self, port: int) -> None:
+        """Stop serving a device, as if it went offline."""
+        site = self._sites.pop(port, None)
+        self.devices.pop(port, None)
+        if site is not None:
+            await site.stop()
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        """Route a request to the device that owns the port."""
+        if request.transport is None:
+            # Client already went away
+            raise web.HTTPNotFound()
+        port = request.transport.get_extra_info("sockname")[1]
+        device = self.devices.get(port)
+        if device is None:
+            raise web.HTTPNotFound()
+        return await device.handle(request)
+
+
+def _drop_connection(request: web.Request) -> None:
+    """Close a request's connection without a response, as the device does."""
+    if request.transport is not None:
+        request.transport.close()
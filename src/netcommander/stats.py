@@ -0,0 +1,272 @@
+"""Per-device command statistics for netCommander API client.
+
+Every request sent to a device is counted per command ($A5, $A3, $A8, rly,
+GET /) and by outcome: answered, answered with $AF, timed out, or failed
+otherwise. Latencies of answered requests go into histograms with
+logarithmic buckets, four per doubling from 100 µs, so any percentile is
+known within about 19% whatever the scale, memory is fixed per command and
+recording costs a logarithm and a few increments.
+
+Statistics belong to the device and are shared by all of its clients, like
+the RTT estimates; ``NetCommanderClient.stats()`` takes a snapshot.
+"""
+
+import math
+import weakref
+from array import array
+from typing import NamedTuple, Optional
+
+from .models import CommandStats, DeviceStats
+from .exceptions import CommandError, NetCommanderError, NetCommanderTimeoutError
+
+# Request outcomes
+OUTCOME_OK = "ok"
+OUTCOME_FAILED = "failed"  # Device answered $AF
+OUTCOME_TIMEOUT = "timeout"
+OUTCOME_ERROR = "error"  # Connection refused, authentication, ...
+
+# Histogram layout: bucket i holds latencies up to
+# _MIN_LATENCY * 2 ** ((i + 1) / _BUCKETS_PER_DOUBLING); the last bucket
+# (from about 100 s) is unbounded
+_MIN_LATENCY = 1e-4
+_BUCKETS_PER_DOUBLING = 4
+_NUM_BUCKETS = 80
+# bucket = log2(seconds) * _BUCKETS_PER_DOUBLING + _BUCKET_OFFSET
+_BUCKET_OFFSET = -math.log2(_MIN_LATENCY) * _BUCKETS_PER_DOUBLING
+
+
+class CommandEvent(NamedTuple):
+    """One request to a device, as passed to a client's on_command hook."""
+
+    host: str
+    port: int
+    command: str  # e.g. "$A3 1 1"
+    kind: str  # e.g. "$A3"
+    outcome: str  # OUTCOME_OK, OUTCOME_FAILED, OUTCOME_TIMEOUT or OUTCOME_ERROR
+    latency: float  # seconds
+    error: Optional[NetCommanderError]
+
+
+def command_kind(command: str) -> str:
+    """Get the command a request string belongs to.
+
+    Example:
+        >>> command_kind("$A3 1 1"), command_kind("rly=0")
+        ('$A3', 'rly')
+    """
+    if command.startswith("GET "):
+        return command
+    return command.split(" ", 1)[0].split("=", 1)[0]
+
+
+def classify(error: Optional[NetCommanderError]) -> str:
+    """Get the outcome of a request from the error it raised."""
+    if error is None:
+        return OUTCOME_OK
+    if isinstance(error, CommandError):
+        return OUTCOME_FAILED
+    if isinstance(error, NetCommanderTimeoutError):
+        return OUTCOME_TIMEOUT
+    return OUTCOME_ERROR
+
+
+def bucket_index(seconds: float) -> int:
+    """Get the histogram bucket of a latency."""
+    if seconds <= _MIN_LATENCY:
+        return 0
+    index = int(math.log2(seconds) * _BUCKETS_PER_DOUBLING + _BUCKET_OFFSET)
+    return min(index, _NUM_BUCKETS - 1)
+
+
+def bucket_upper_bound(index: int) -> float:
+    """Get the largest latency in seconds held by a histogram bucket."""
+    if index >= _NUM_BUCKETS - 1:
+        return math.inf
+    return _MIN_LATENCY * 2 ** ((index + 1) / _BUCKETS_PER_DOUBLING)
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram.
+
+    Example:
+        >>> histogram = LatencyHistogram()
+        >>> for latency in (0.020, 0.025, 0.030, 0.200):
+        ...     histogram.record(latency)
+        >>> round(histogram.percentile(0.5), 4)
+        0.0256
+    """
+
+    __slots__ = ("counts", "count", "sum", "min", "max")
+
+    def __init__(self):
+        """Initialize an empty histogram."""
+        self.counts = array("Q", bytes(8 * _NUM_BUCKETS))
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Add a latency in seconds."""
+        self.counts[bucket_index(seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram's samples to this one."""
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] += count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Estimate a percentile in seconds (None without samples).
+
+        Returns the upper bound of the bucket holding the percentile,
+        limited to the range of recorded latencies.
+        """
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(fraction * self.count))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(max(bucket_upper_bound(index), self.min), self.max)
+        return self.max
+
+    def buckets(self) -> list[tuple[float, int]]:
+        """Get (upper bound in seconds, count) of every non-empty bucket."""
+        return [
+            (bucket_upper_bound(index), count)
+            for index, count in enumerate(self.counts)
+            if count
+        ]
+
+
+class CommandCounters:
+    """Counters and latency histogram of one command on one device."""
+
+    __slots__ = ("latency", "requests", "ok", "failed", "timeouts", "errors")
+
+    def __init__(self):
+        """Initialize zeroed counters."""
+        self.latency = LatencyHistogram()
+        self.requests = 0
+        self.ok = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.errors = 0
+
+    def record(self, outcome: str, latency: float) -> None:
+        """Count a request; the latency is kept if the device answered."""
+        self.requests += 1
+        if outcome == OUTCOME_OK:
+            self.ok += 1
+        elif outcome == OUTCOME_FAILED:
+            self.failed += 1
+        elif outcome == OUTCOME_TIMEOUT:
+            self.timeouts += 1
+            return
+        else:
+            self.errors += 1
+            return
+        self.latency.record(latency)
+
+    def snapshot(self) -> CommandStats:
+        """Get the counters as a CommandStats model."""
+        latency = self.latency
+        return CommandStats(
+            requests=self.requests,
+            ok=self.ok,
+            failed=self.failed,
+            timeouts=self.timeouts,
+            errors=self.errors,
+            latency_sum=latency.sum,
+            latency_min=latency.min if latency.count else None,
+            latency_max=latency.max if latency.count else None,
+            p50=latency.percentile(0.50),
+            p90=latency.percentile(0.90),
+            p99=latency.percentile(0.99),
+            buckets=latency.buckets(),
+        )
+
+
+class StatsRecorder:
+    """Command statistics of one device.
+
+    Example:
+        >>> recorder = StatsRecorder("10.0.0.1", 80)
+        >>> recorder.record("$A5", OUTCOME_OK, 0.030)
+        >>> recorder.snapshot().commands["$A5"].ok
+        1
+    """
+
+    __slots__ = ("host", "port", "commands", "_by_request", "__weakref__")
+
+    def __init__(self, host: str, port: int):
+        """Initialize statistics for a device."""
+        self.host = host
+        self.port = port
+        # Command kind → counters
+        self.commands: dict[str, CommandCounters] = {}
+        # Request string → counters of its kind, so recording skips parsing
+        # the command (a device only takes a few distinct request strings)
+        self._by_request: dict[str, CommandCounters] = {}
+
+    def record(self, command: str, outcome: str, latency: float) -> None:
+        """Count a request.
+
+        Args:
+            command: Request string (e.g. "$A3 1 1") or command kind
+            outcome: OUTCOME_OK, OUTCOME_FAILED, OUTCOME_TIMEOUT or
+                OUTCOME_ERROR
+            latency: Seconds from sending the request to the outcome
+        """
+        counters = self._by_request.get(command)
+        if counters is None:
+            kind = command_kind(command)
+            counters = self.commands.get(kind)
+            if counters is None:
+                counters = self.commands[kind] = CommandCounters()
+            self._by_request[command] = counters
+        counters.record(outcome, latency)
+
+    def reset(self) -> None:
+        """Clear all statistics."""
+        self.commands.clear()
+        self._by_request.clear()
+
+    def snapshot(self) -> DeviceStats:
+        """Get the statistics as a DeviceStats model."""
+        return DeviceStats(
+            host=self.host,
+            port=self.port,
+            commands={
+                kind: counters.snapshot()
+                for kind, counters in self.commands.items()
+            },
+        )
+
+
+# Recorders per device, shared by every client in the process
+_RECORDERS: "weakref.WeakValueDictionary[tuple[str, int], StatsRecorder]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def get_stats_recorder(host: str, port: int) -> StatsRecorder:
+    """Get the statistics recorder shared by all clients of a device."""
+    key = (host, port)
+    recorder = _RECORDERS.get(key)
+    if recorder is None:
+        recorder = StatsRecorder(host, port)
+        _RECORDERS[key] = recorder
+    return recorder
@@ -0,0 +1,450 @@
+"""HTTP transports for the netCommander /cmd.cgi endpoint."""
+
+import asyncio
+import base64
+import logging
+import time
+from typing import Optional
+from urllib.parse import SplitResult, quote
+
+import aiohttp
+
+from ..exceptions import (
+    AuthenticationError,
+    NetCommanderConnectionError,
+    NetCommanderTimeoutError,
+)
+from ..rtt import AdaptiveTimeouts
+from ..const import CMD_ENDPOINT, DEFAULT_PORT, DEFAULT_TIMEOUT
+from .base import Transport, host_from_url, register_transport
+
+_LOGGER = logging.getLogger(__name__)
+
+# Responses are a few dozen bytes; the root page is a few KB
+MAX_RESPONSE_SIZE = 64 * 1024
+
+
+@register_transport
+class AiohttpTransport(Transport):
+    """HTTP transport using an aiohttp session (the default transport).
+
+    Selected with ``http://host[:port]``. Credentials are sent with every
+    request, so a shared session passed in from outside (e.g. Home
+    Assistant's) works without being configured for the device.
+
+    Example:
+        >>> transport = AiohttpTransport("192.168.1.100", 80, "admin", "admin")
+        >>> async with NetCommanderClient(
+        ...     "192.168.1.100", "admin", "admin", transport=transport
+        ... ) as client:
+        ...     status = await client.get_status()
+    """
+
+    scheme = "http"
+
+    def __init__(
+        self,
+        host: str,
+        port: int = DEFAULT_PORT,
+        username: str = "admin",
+        password: str = "admin",
+        timeout: float = DEFAULT_TIMEOUT,
+        session: Optional[aiohttp.ClientSession] = None,
+    ):
+        """Initialize the transport.
+
+        Args:
+            host: Device IP address or hostname
+            port: HTTP port (default: 80)
+            username: Authentication username
+            password: Authentication password
+            timeout: Request timeout ceiling in seconds (default: 10)
+            session: Optional existing aiohttp session (for connection
+                pooling); not closed by the transport
+        """
+        self.host = host
+        self.port = port
+        self.username = username
+        self.timeout = timeout
+        self.base_url = f"http://{host}:{port}"
+
+        self.session = session
+        self._external_session = session is not None
+        self._auth = aiohttp.BasicAuth(username, password)
+
+    @classmethod
+    def from_url(
+        cls,
+        url: SplitResult,
+        username: str,
+        password: str,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> "AiohttpTransport":
+        """Create a transport from ``http://host[:port]``."""
+        return cls(
+            host_from_url(url), url.port or DEFAULT_PORT, username, password, timeout
+        )
+
+    async def open(self) -> None:
+        """Create the session if none was given."""
+        self._get_session()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the session, creating it if none was given."""
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={"User-Agent": "NetCommander-Python/2025.10.15"},
+            )
+            _LOGGER.debug("Created new aiohttp session")
+        return self.session
+
+    async def close(self) -> None:
+        """Close the session if we own it."""
+        if self.session and not self._external_session:
+            await self.session.close()
+            self.session = None
+            _LOGGER.debug("Closed aiohttp session")
+
+    async def send_command(
+        self, command: str, timeouts: Optional[AdaptiveTimeouts] = None
+    ) -> bytes:
+        """Send a command and return the response body.
+
+        Args:
+            command: Command string (e.g., "$A5", "$A3 1 1", "rly=0")
+            timeouts: Adaptive timeouts, updated with this request's time;
+                aiohttp does not expose connect timing, so the whole request
+                feeds the read estimate and only timeouts after connecting
+                back it off (default: fixed transport timeout)
+
+        Returns:
+            Response body bytes
+
+        Raises:
+            NetCommanderConnectionError: Cannot reach device
+            AuthenticationError: Invalid credentials
+        """
+        session = self._get_session()
+
+        url = f"{self.base_url}{CMD_ENDPOINT}?{command}"
+        if timeouts is None:
+            connect_timeout = read_timeout = self.timeout
+            request_timeout = aiohttp.ClientTimeout(total=self.timeout)
+        else:
+            connect_timeout = timeouts.connect_timeout()
+            read_timeout = timeouts.read_timeout()
+            request_timeout = aiohttp.ClientTimeout(
+                total=self.timeout,
+                sock_connect=connect_timeout,
+                sock_read=read_timeout,
+            )
+        started = time.monotonic()
+
+        try:
+            async with session.get(
+                url, auth=self._auth, timeout=request_timeout
+            ) as resp:
+                self._check_status(resp)
+                # Responses are plain ASCII; naming the encoding skips
+                # charset detection
+                text = await resp.text(encoding="latin-1")
+        except asyncio.TimeoutError as err:
+            if _is_connect_timeout(err):
+                raise NetCommanderTimeoutError(
+                    self.host, f"Connect timeout after {connect_timeout:.2f}s"
+                ) from err
+            if timeouts is not None:
+                timeouts.read.backoff()
+            raise NetCommanderTimeoutError(
+                self.host, f"Connection timeout after {read_timeout:.2f}s"
+            ) from err
+        except aiohttp.ClientConnectorError as e:
+            raise NetCommanderConnectionError(self.host, f"Connection failed: {e}")
+        except aiohttp.ClientError as e:
+            raise NetCommanderConnectionError(self.host, f"Request error: {e}")
+
+        if timeouts is not None:
+            timeouts.read.observe(time.monotonic() - started)
+        return text.encode("latin-1")
+
+    async def get_page(self, path: str = "/") -> bytes:
+        """Fetch a page from the device's web interface.
+
+        Args:
+            path: Request path (default: root page)
+
+        Returns:
+            Response body bytes
+        """
+        session = self._get_session()
+        try:
+            async with session.get(
+                f"{self.base_url}{path}", auth=self._auth
+            ) as resp:
+                self._check_status(resp)
+                return (await resp.text(encoding="latin-1")).encode("latin-1")
+        except asyncio.TimeoutError:
+            raise NetCommanderTimeoutError(
+                self.host, f"Connection timeout after {self.timeout}s"
+            )
+        except aiohttp.ClientError as e:
+            raise NetCommanderConnectionError(self.host, f"Request error: {e}")
+
+    def _check_status(self, resp: aiohttp.ClientResponse) -> None:
+        """Raise for a response that is not 200 OK."""
+        if resp.status == 401:
+            raise AuthenticationError(
+                f"Authentication failed for {self.username}@{self.host}"
+            )
+        if resp.status != 200:
+            raise NetCommanderConnectionError(
+                self.host, f"HTTP {resp.status}: {resp.reason}"
+            )
+
+
+@register_transport
+class StreamHttpTransport(Transport):
+    """Lightweight HTTP transport built on asyncio streams.
+
+    Speaks just enough HTTP/1.0 for the netBooter firmware: one GET per
+    connection, a precomputed request template with the Basic auth header
+    and byte-level response handling. Skips the URL building, header
+    processing and charset detection of a full HTTP client, which dominate
+    the cost of a ~20 byte response.
+
+    Selected with ``http+stream://host[:port]``.
+
+    Example:
+        >>> transport = StreamHttpTransport("192.168.1.100", 80, "admin", "admin")
+        >>> async with NetCommanderClient(
+        ...     "192.168.1.100", "admin", "admin", transport=transport
+        ... ) as client:
+        ...     status = await client.get_status()
+    """
+
+    scheme = "http+stream"
+
+    def __init__(
+        self,
+        host: str,
+        port: int = DEFAULT_PORT,
+        username: str = "admin",
+        password: str = "admin",
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        """Initialize the transport.
+
+        Args:
+            host: Device IP address or hostname
+            port: HTTP port (default: 80)
+            username: Authentication username
+            password: Authentication password
+            timeout: Request timeout in seconds (default: 10)
+        """
+        self.host = host
+        self.port = port
+        self.username = username
+        self.timeout = timeout
+
+        credentials = base64.b64encode(f"{username}:{password}".encode("latin-1"))
+        # IPv6 literals are bracketed; the port is left out only when default
+        authority = f"[{host}]" if ":" in host else host
+        if port != DEFAULT_PORT:
+            authority = f"{authority}:{port}"
+        self._headers = (
+            b" HTTP/1.0\r\nHost: "
+            + authority.encode("idna")
+            + b"\r\nAuthorization: Basic "
+            + credentials
+            + b"\r\nConnection: close\r\n\r\n"
+        )
+        self._command_prefix = b"GET " + CMD_ENDPOINT.encode("ascii") + b"?"
+
+    @classmethod
+    def from_url(
+        cls,
+        url: SplitResult,
+        username: str,
+        password: str,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> "StreamHttpTransport":
+        """Create a transport from ``http+stream://host[:port]``."""
+        return cls(
+            host_from_url(url), url.port or DEFAULT_PORT, username, password, timeout
+        )
+
+    async def send_command(
+        self, command: str, timeouts: Optional[AdaptiveTimeouts] = None
+    ) -> bytes:
+        """Send a command and return the raw response body.
+
+        Args:
+            command: Command string (e.g., "$A5", "$A3 1 1", "rly=0")
+            timeouts: Adaptive connect/read timeouts, updated with this
+                request's timings (default: fixed transport timeout)
+
+        Returns:
+            Response body bytes (e.g. b"$A0,10101,2.50,25\\r\\n\\r\\n")
+
+        Raises:
+            NetCommanderConnectionError: Cannot reach device
+            AuthenticationError: Invalid credentials
+        """
+        target = quote(command, safe="$=,").encode("ascii")
+        return await self._get(
+            self._command_prefix + target + self._headers, timeouts
+        )
+
+    async def get_page(self, path: str = "/") -> bytes:
+        """Fetch a page from the device's web interface.
+
+        Args:
+            path: Request path (default: root page)
+
+        Returns:
+            Response body bytes
+        """
+        return await self._get(b"GET " + path.encode("ascii") + self._headers)
+
+    async def close(self) -> None:
+        """Release resources (connections are per request, nothing to do)."""
+
+    async def _get(
+        self, request: bytes, timeouts: Optional[AdaptiveTimeouts] = None
+    ) -> bytes:
+        """Send a prepared request and return the body of a 200 response."""
+        if timeouts is None:
+            try:
+                return await asyncio.wait_for(self._exchange(request), self.timeout)
+            except asyncio.TimeoutError:
+                raise NetCommanderTimeoutError(
+                    self.host, f"Connection timeout after {self.timeout}s"
+                )
+            except OSError as e:
+                raise NetCommanderConnectionError(
+                    self.host, f"Connection failed: {e}"
+                )
+
+        # Connect and read phases get their own timeouts and samples
+        connect_timeout = timeouts.connect_timeout()
+        started = time.monotonic()
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), connect_timeout
+            )
+        except asyncio.TimeoutError:
+            timeouts.connect.backoff()
+            raise NetCommanderTimeoutError(
+                self.host, f"Connect timeout after {connect_timeout:.2f}s"
+            )
+        except OSError as e:
+            raise NetCommanderConnectionError(self.host, f"Connection failed: {e}")
+        connected = time.monotonic()
+        timeouts.connect.observe(connected - started)
+
+        read_timeout = timeouts.read_timeout()
+        try:
+            data = await asyncio.wait_for(
+                self._read_response(reader, writer, request), read_timeout
+            )
+        except asyncio.TimeoutError:
+            timeouts.read.backoff()
+            raise NetCommanderTimeoutError(
+                self.host, f"Read timeout after {read_timeout:.2f}s"
+            )
+        except OSError as e:
+            raise NetCommanderConnectionError(self.host, f"Connection failed: {e}")
+        timeouts.read.observe(time.monotonic() - connected)
+
+        return self._parse_response(data)
+
+    async def _exchange(self, request: bytes) -> bytes:
+        """Perform one request/response exchange on a fresh connection."""
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        return self._parse_response(
+            await self._read_response(reader, writer, request)
+        )
+
+    async def _read_response(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        request: bytes,
+    ) -> bytes:
+        """Write a request on an open connection and read the raw response."""
+        try:
+            writer.write(request)
+            data = b""
+            expected = -1
+            while True:
+                chunk = await reader.read(MAX_RESPONSE_SIZE)
+                if not chunk:
+                    break
+                data += chunk
+                if len(data) > MAX_RESPONSE_SIZE:
+                    raise NetCommanderConnectionError(
+                        self.host, "Response too large"
+                    )
+                # Stop at Content-Length instead of waiting for the close
+                if expected < 0:
+                    header_end = data.find(b"\r\n\r\n")
+                    if header_end >= 0:
+                        length = _content_length(data[:header_end])
+                        if length is not None:
+                            expected = header_end + 4 + length
+                if 0 <= expected <= len(data):
+                    break
+        finally:
+            writer.close()
+
+        return data
+
+    def _parse_response(self, data: bytes) -> bytes:
+        """Check the status line and return the response body."""
+        line_end = data.find(b"\r\n")
+        status_line = data[:line_end] if line_end >= 0 else data
+        if not status_line.startswith(b"HTTP/1."):
+            raise NetCommanderConnectionError(
+                self.host, f"Invalid HTTP response: {status_line[:40]!r}"
+            )
+
+        # "HTTP/1.x NNN Reason"
+        status = status_line[9:12]
+        if status == b"401":
+            raise AuthenticationError(
+                f"Authentication failed for {self.username}@{self.host}"
+            )
+        if status != b"200":
+            raise NetCommanderConnectionError(
+                self.host, f"HTTP {status_line[9:].decode('latin-1')}"
+            )
+
+        body_start = data.find(b"\r\n\r\n")
+        if body_start < 0:
+            return b""
+        return data[body_start + 4 :]
+
+
+def _is_connect_timeout(err: BaseException) -> bool:
+    """Whether an aiohttp timeout happened before the connection was made."""
+    # aiohttp >= 3.10 has its own type; older versions only the message
+    connect_error = getattr(aiohttp, "ConnectionTimeoutError", None)
+    if connect_error is not None and isinstance(err, connect_error):
+        return True
+    return isinstance(err, aiohttp.ServerTimeoutError) and str(err).startswith(
+        "Connection timeout"
+    )
+
+
+def _content_length(headers: bytes) -> Optional[int]:
+    """Get the Content-Length from a raw header block, if present."""
+    start = headers.lower().find(b"\r\ncontent-length:")
+    if start < 0:
+        return None
+    start += 17
+    end = headers.find(b"\r\n", start)
+    try:
+        return int(headers[start : end if end >= 0 else None])
+    except ValueError:
+        return None
@@ -0,0 +1,157 @@
+"""Record and replay device exchanges."""
+
+import json
+import logging
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Optional, TextIO, Union
+from urllib.parse import SplitResult
+
+from ..rtt import AdaptiveTimeouts
+from ..exceptions import NetCommanderConnectionError
+from ..const import DEFAULT_TIMEOUT, RESPONSE_FAILED
+from .base import Transport, register_transport
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@register_transport
+class ReplayTransport(Transport):
+    """Transport that answers from a recorded session instead of a device.
+
+    The recording is a JSON Lines file with one exchange per line::
+
+        {"command": "$A5", "response": "$A0,10101,2.50,25"}
+
+    Each command gets its recorded responses in order; once they run out
+    the last one keeps being returned, so pollers can run indefinitely.
+    Unrecorded commands get $AF. Selected with ``replay://path/to/file``.
+
+    Example:
+        >>> async with NetCommanderClient(
+        ...     "192.168.1.100", "admin", "admin", transport="replay://pdu.jsonl"
+        ... ) as client:
+        ...     status = await client.get_status()
+    """
+
+    scheme = "replay"
+
+    def __init__(self, path: Union[str, Path]):
+        """Initialize the transport.
+
+        Args:
+            path: Recording to replay (see RecordingTransport)
+        """
+        self.path = Path(path)
+        self._responses: Optional[dict[str, deque[bytes]]] = None
+
+    @classmethod
+    def from_url(
+        cls,
+        url: SplitResult,
+        username: str,
+        password: str,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> "ReplayTransport":
+        """Create a transport from ``replay://path`` or ``replay:///abs/path``."""
+        return cls(url.netloc + url.path)
+
+    async def send_command(
+        self, command: str, timeouts: Optional[AdaptiveTimeouts] = None
+    ) -> bytes:
+        """Return the next recorded response for a command."""
+        if self._responses is None:
+            self._responses = self._load()
+
+        responses = self._responses.get(command)
+        if not responses:
+            return RESPONSE_FAILED.encode("ascii")
+        if len(responses) > 1:
+            return responses.popleft()
+        return responses[0]
+
+    async def get_page(self, path: str = "/") -> bytes:
+        """Return the recorded page, if any."""
+        return await self.send_command(f"GET {path}")
+
+    def _load(self) -> dict[str, deque[bytes]]:
+        """Read the recording into responses by command."""
+        responses: dict[str, deque[bytes]] = defaultdict(deque)
+        line_number = 0
+        try:
+            with self.path.open(encoding="utf-8") as recording:
+                for line_number, line in enumerate(recording, 1):
+                    if line.strip():
+                        exchange = json.loads(line)
+                        responses[exchange["command"]].append(
+                            exchange["response"].encode("latin-1")
+                        )
+        except OSError as e:
+            raise NetCommanderConnectionError(
+                str(self.path), f"Cannot read recording: {e.strerror}"
+            ) from e
+        except (ValueError, KeyError, TypeError) as e:
+            raise NetCommanderConnectionError(
+                str(self.path), f"Bad recording at line {line_number}: {e!r}"
+            ) from e
+        _LOGGER.debug(
+            "Loaded %d recorded commands from %s", len(responses), self.path
+        )
+        return dict(responses)
+
+
+class RecordingTransport(Transport):
+    """Transport wrapper that records every exchange for later replay.
+
+    Example:
+        >>> transport = RecordingTransport(
+        ...     StreamHttpTransport("192.168.1.100"), "pdu.jsonl"
+        ... )
+    """
+
+    def __init__(self, transport: Transport, path: Union[str, Path]):
+        """Initialize the recorder.
+
+        Args:
+            transport: Transport that reaches the device
+            path: JSON Lines file to append exchanges to
+        """
+        self.transport = transport
+        self.path = Path(path)
+        self._file: Optional[TextIO] = None
+
+    async def send_command(
+        self, command: str, timeouts: Optional[AdaptiveTimeouts] = None
+    ) -> bytes:
+        """Send a command through the wrapped transport and record it."""
+        response = await self.transport.send_command(command, timeouts)
+        self._record(command, response)
+        return response
+
+    async def get_page(self, path: str = "/") -> bytes:
+        """Fetch a page through the wrapped transport and record it."""
+        page = await self.transport.get_page(path)
+        self._record(f"GET {path}", page)
+        return page
+
+    async def open(self) -> None:
+        """Open the wrapped transport."""
+        await self.transport.open()
+
+    async def close(self) -> None:
+        """Close the wrapped transport and the recording."""
+        await self.transport.close()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _record(self, command: str, response: bytes) -> None:
+        """Append one exchange to the recording."""
+        if self._file is None:
+            self._file = self.path.open("a", encoding="utf-8")
+        exchange = {
+            "command": command,
+            "response": response.decode("latin-1").strip(),
+        }
+        self._file.write(json.dumps(exchange) + "\n")
+        self._file.flush()
@@ -9,6 +9,26 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 from netcommander import NetCommanderClient, DeviceStatus, DeviceInfo
+from netcommander import resilience, rtt
+from netcommander.simulator import DeviceSimulator
+
+
+# Circuit breakers and RTT estimates are shared per device; don't let one
+# test's connection failures or timings leak into the next test
+@pytest.fixture(autouse=True)
+def reset_device_state():
+    """Start every test with closed circuits and no RTT samples."""
+    yield
+    resilience._BREAKERS.clear()
+    rtt._ESTIMATORS.clear()
+
+
+# Simulated device fixture
+@pytest.fixture
+async def simulator():
+    """Run a device simulator; add devices with simulator.add_device()."""
+    async with DeviceSimulator() as simulator:
+        yield simulator
 
 
 # Device info fixture
@@ -80,6 +100,47 @@ def mock_session(mock_response):
     return session
 
 
+# Mock session answering like a device
+@pytest.fixture
+def device_session(mock_session):
+    """Make mock_session answer like a device.
+
+    Call the returned function with the initial outlet states (outlet 1
+    last, as in a status response); it returns the list of commands sent.
+    """
+
+    def answer(outlets="10101"):
+        state = {"outlets": outlets}
+        commands = []
+
+        def get(url, **kwargs):
+            command = url.split("?", 1)[1]
+            commands.append(command)
+            if command == "$A5":
+                text = f"$A0,{state['outlets']},2.50,25"
+            else:
+                _, outlet, value = command.split(" ")
+                chars = list(state["outlets"])
+                if 1 <= int(outlet) <= len(chars):
+                    chars[len(chars) - int(outlet)] = value
+                    state["outlets"] = "".join(chars)
+                    text = "$A0"
+                else:
+                    text = "$AF"
+
+            response = MagicMock()
+            response.status = 200
+            response.text = AsyncMock(return_value=text)
+            response.__aenter__ = AsyncMock(return_value=response)
+            response.__aexit__ = AsyncMock(return_value=None)
+            return response
+
+        mock_session.get = MagicMock(side_effect=get)
+        return commands
+
+    return answer
+
+
 # Connection parameters
 @pytest.fixture
 def connection_params():
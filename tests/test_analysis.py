@@ -0,0 +1,241 @@
+"""Tests for vectorized analysis of recorded series."""
+import json
+import math
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from click.testing import CliRunner
+
+from netcommander.analysis import (
+    energy,
+    load,
+    load_directory,
+    outlet_correlation,
+    parse_duration,
+    rollup,
+    summary,
+    to_rows,
+)
+from netcommander.models import CompactStatus
+from netcommander.recorder import SeriesWriter, series_path
+
+from netcommander_cli.cli import cli
+
+np = pytest.importorskip("numpy")
+
+
+def write_series(path, samples, device="pdu", **options):
+    """Write (timestamp, bitmask, current, temperature or None) samples."""
+    options.setdefault("heartbeat", 0)
+    options.setdefault("current_deadband", 0)
+    with SeriesWriter(path, device, **options) as writer:
+        for timestamp, bitmask, current, temperature in samples:
+            status = (
+                CompactStatus(bitmask, 4, current, temperature)
+                if current is not None
+                else None
+            )
+            writer.append(timestamp, status)
+
+
+@pytest.fixture
+def path(tmp_path):
+    """Path of a series file."""
+    return str(tmp_path / "pdu.ncts")
+
+
+class TestParseDuration:
+    """Test duration parsing for the CLI."""
+
+    def test_units(self):
+        """Test plain seconds and unit suffixes."""
+        assert parse_duration("90") == 90
+        assert parse_duration("15m") == 900
+        assert parse_duration("1.5h") == 5400
+        assert parse_duration("7d") == 604800
+
+    def test_invalid(self):
+        """Test malformed and zero durations are rejected."""
+        for text in ("", "h", "5y", "0"):
+            with pytest.raises(ValueError):
+                parse_duration(text)
+
+
+class TestLoad:
+    """Test loading series files."""
+
+    def test_range(self, path):
+        """Test start and end select samples."""
+        write_series(path, [(t, 1, 1.0, "20") for t in range(100)])
+        history = load(path, start=10, end=20)
+        assert history.timestamp.tolist() == list(range(10, 20))
+        assert history.end == 20
+        assert history.temperature[0] == 20.0
+
+    def test_directory(self, tmp_path):
+        """Test every file of a directory is loaded by device."""
+        for name in ("10.0.0.1:80", "10.0.0.2:80"):
+            write_series(series_path(str(tmp_path), name), [(0, 1, 1.0, None)], name)
+        histories = load_directory(str(tmp_path))
+        assert list(histories) == ["10.0.0.1:80", "10.0.0.2:80"]
+        assert math.isnan(histories["10.0.0.1:80"].temperature[0])
+
+    def test_empty(self, path):
+        """Test an empty file gives an empty history."""
+        SeriesWriter(path, "pdu").close()
+        history = load(path)
+        assert len(history) == 0
+        assert summary(history)["current"] is None
+        assert len(rollup(history, 60)["start"]) == 0
+
+
+class TestStatistics:
+    """Test time-weighted statistics."""
+
+    def test_holds(self, path):
+        """Test samples hold until the next, capped, and failures hold nothing."""
+        write_series(
+            path,
+            [(0, 1, 1.0, None), (10, 1, 2.0, None), (500, 1, None, None), (510, 1, 3.0, None)],
+        )
+        history = load(path, end=520)
+        assert history.holds(max_gap=120).tolist() == [10, 120, 0, 10]
+
+    def test_energy(self, path):
+        """Test Amp-hours integrate the step function."""
+        # 2 A for an hour, then 4 A for half an hour
+        write_series(path, [(0, 1, 2.0, None), (3600, 1, 4.0, None)])
+        history = load(path, end=5400)
+        amp_hours, kwh = energy(history, voltage=200, max_gap=3600)
+        assert amp_hours == pytest.approx(4.0)
+        assert kwh == pytest.approx(0.8)
+
+    def test_summary(self, path):
+        """Test means and percentiles are weighted by time."""
+        # 1 A for 90 s, 10 A for 10 s
+        write_series(path, [(0, 1, 1.0, "20"), (90, 1, 10.0, "30")])
+        result = summary(load(path, end=100), voltage=100)
+        assert result["coverage"] == 100
+        assert result["current"]["mean"] == pytest.approx(1.9)
+        assert result["current"]["p50"] == 1.0
+        assert result["current"]["p95"] == 10.0
+        assert result["current"]["max"] == 10.0
+        assert result["temperature"]["mean"] == pytest.approx(21.0)
+        assert result["amp_hours"] == pytest.approx(190 / 3600)
+
+    def test_rollup_splits_holds(self, path):
+        """Test a sample held across interval boundaries counts in each."""
+        write_series(path, [(30, 1, 2.0, None), (150, 1, 6.0, None)])
+        result = rollup(load(path, end=180), 60, max_gap=1000)
+
+        assert result["start"].tolist() == [0, 60, 120]
+        assert result["coverage"].tolist() == [30, 60, 60]
+        assert result["mean"].tolist() == [2.0, 2.0, 4.0]
+        assert result["min"].tolist() == [2.0, 2.0, 2.0]
+        assert result["max"].tolist() == [2.0, 2.0, 6.0]
+        assert result["p50"].tolist() == [2.0, 2.0, 2.0]
+        assert result["p99"].tolist() == [2.0, 2.0, 6.0]
+        assert result["amp_hours"].sum() == pytest.approx((240 + 180) / 3600)
+
+    def test_rollup_matches_direct_calculation(self, path):
+        """Test random data against a per-second reference."""
+        rng = np.random.default_rng(1)
+        times = np.cumsum(rng.integers(1, 30, size=500))
+        currents = rng.uniform(0, 10, size=500).round(2)
+        write_series(path, [(int(t), 1, float(c), None) for t, c in zip(times, currents, strict=True)])
+
+        result = rollup(load(path, end=int(times[-1])), 300, max_gap=1000)
+
+        # Expand to one value per second
+        seconds = np.repeat(currents[:-1].astype(np.float32), np.diff(times))
+        start = int(times[0])
+        for bucket_start, mean, peak in zip(
+            result["start"], result["mean"], result["max"], strict=True
+        ):
+            lo = max(int(bucket_start), start) - start
+            hi = int(bucket_start) + 300 - start
+            assert mean == pytest.approx(seconds[lo:hi].mean(), rel=1e-6)
+            assert peak == seconds[lo:hi].max()
+
+    def test_temperature_field(self, path):
+        """Test temperature rollups skip samples without a sensor."""
+        write_series(path, [(0, 1, 1.0, "XX"), (60, 1, 1.0, "25")])
+        result = rollup(load(path, end=120), 3600, field="temperature")
+        assert result["mean"].tolist() == [25.0]
+        assert "amp_hours" not in result
+        with pytest.raises(ValueError):
+            rollup(load(path), 60, field="bitmask")
+
+
+class TestOutletCorrelation:
+    """Test attributing current changes to outlets."""
+
+    def test_outlet_draw(self, path):
+        """Test each outlet's draw is recovered, also when switched together."""
+        # Outlet 1 draws 1 A, outlet 2 draws 3 A
+        draw = {0b00: 0.5, 0b01: 1.5, 0b10: 3.5, 0b11: 4.5}
+        sequence = [0b00, 0b01, 0b11, 0b10, 0b00, 0b11, 0b01, 0b00]
+        write_series(
+            path, [(i * 10, mask, draw[mask], None) for i, mask in enumerate(sequence)]
+        )
+        result = outlet_correlation(load(path))
+
+        assert result["outlet"].tolist() == [1, 2, 3, 4]
+        assert result["switched_on"].tolist() == [2, 2, 0, 0]
+        assert result["switched_off"].tolist() == [2, 2, 0, 0]
+        assert result["amps"][:2] == pytest.approx([1.0, 3.0])
+        assert result["on_delta"][1] == pytest.approx(3.5)
+        assert result["correlation"][1] > 0.9
+        assert math.isnan(result["amps"][2])
+
+    def test_failed_polls_break_events(self, path):
+        """Test changes across a failed poll are not attributed."""
+        write_series(path, [(0, 0b0, 1.0, None), (10, 0b0, None, None), (20, 0b1, 2.0, None)])
+        result = outlet_correlation(load(path))
+        assert result["switched_on"].tolist() == [0, 0, 0, 0]
+
+    def test_to_rows(self, path):
+        """Test rows are JSON-ready."""
+        write_series(path, [(0, 0b0, 1.0, None), (10, 0b1, 2.0, None)])
+        rows = to_rows(outlet_correlation(load(path)))
+        assert rows[0]["amps"] == pytest.approx(1.0)
+        assert rows[1]["amps"] is None
+        json.dumps(rows)
+
+
+class TestAnalyzeCommand:
+    """Test the analyze CLI command."""
+
+    def test_json(self, tmp_path):
+        """Test a directory is summarized with rollups and outlets."""
+        write_series(
+            series_path(str(tmp_path), "10.0.0.1:80"),
+            [(0, 0b0, 1.0, "21"), (1800, 0b1, 3.0, "22")],
+            "10.0.0.1:80",
+        )
+        result = CliRunner().invoke(
+            cli,
+            ["analyze", str(tmp_path), "-V", "230", "-i", "1h", "--outlets", "-o", "json"],
+            obj={},
+        )
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output[result.output.index("{"):])["10.0.0.1:80"]
+        assert data["summary"]["samples"] == 2
+        assert data["rollup"][0]["start"] == 0
+        assert data["outlets"][0]["switched_on"] == 1
+
+    def test_table(self, path):
+        """Test the table output."""
+        write_series(path, [(0, 0b0, 1.0, None), (60, 0b1, 3.0, None)])
+        result = CliRunner().invoke(cli, ["analyze", path, "-i", "1m"], obj={})
+        assert result.exit_code == 0, result.output
+        assert "pdu" in result.output
+
+    def test_no_series(self, tmp_path):
+        """Test an empty directory fails."""
+        result = CliRunner().invoke(cli, ["analyze", str(tmp_path)], obj={})
+        assert result.exit_code == 1
+        assert "No recorded series" in result.output
@@ -0,0 +1,240 @@
+"""Tests for the netcommander bench load generator."""
+import asyncio
+import json
+import random
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from click.testing import CliRunner
+
+from netcommander import NetCommanderClient
+from netcommander.simulator import OVERLAP_ALLOW, OVERLAP_QUEUE
+
+from netcommander_cli.bench import (
+    MIXED_WEIGHTS,
+    BenchReport,
+    CommandStats,
+    percentile,
+    read_hosts_file,
+    run_bench,
+)
+from netcommander_cli.cli import cli
+
+
+def make_clients(devices, **options):
+    """Create clients for simulated devices without retries."""
+    options.setdefault("retries", 0)
+    return {
+        f"127.0.0.1:{device.port}": NetCommanderClient(
+            "127.0.0.1", "admin", "admin", port=device.port, **options
+        )
+        for device in devices
+    }
+
+
+async def close_all(clients):
+    """Close every client."""
+    await asyncio.gather(*(client.close() for client in clients.values()))
+
+
+class TestStatistics:
+    """Test percentile and report calculations."""
+
+    def test_percentile(self):
+        """Test nearest-rank percentiles."""
+        values = [float(i) for i in range(1, 101)]
+        assert percentile(values, 0.5) == 50.0
+        assert percentile(values, 0.99) == 99.0
+        assert percentile(values, 1.0) == 100.0
+        assert percentile([3.0], 0.95) == 3.0
+
+    def test_summary(self):
+        """Test counts, throughput and latency percentiles."""
+        stats = CommandStats()
+        stats.latencies.extend([0.01, 0.02, 0.03, 0.04])
+        stats.errors["CommandError"] += 1
+
+        summary = stats.summary(duration=2.0)
+
+        assert summary["requests"] == 5
+        assert summary["failed"] == 1
+        assert summary["throughput"] == 2.0
+        assert summary["p50"] == 0.02
+        assert summary["max"] == 0.04
+        assert summary["errors"] == {"CommandError": 1}
+
+    def test_summary_without_successes(self):
+        """Test latencies are None when every command failed."""
+        stats = CommandStats()
+        stats.errors["Rejected"] += 2
+        summary = stats.summary(duration=1.0)
+        assert summary["p99"] is None
+        assert summary["max"] is None
+        json.dumps(summary)
+
+    def test_report_total(self):
+        """Test the total merges every command type."""
+        status, toggle = CommandStats(), CommandStats()
+        status.latencies.extend([0.01, 0.02])
+        toggle.latencies.append(0.05)
+        toggle.errors["Rejected"] += 1
+
+        data = BenchReport({"status": status, "toggle": toggle}, 1.0).to_dict()
+
+        assert data["total"]["requests"] == 4
+        assert data["total"]["max"] == 0.05
+        assert data["total"]["errors"] == {"Rejected": 1}
+
+    def test_read_hosts_file(self, tmp_path):
+        """Test the simulate hosts file format is read."""
+        path = tmp_path / "hosts.txt"
+        path.write_text("# lab\n127.0.0.1:9000\n\n127.0.0.1:9001\n")
+        assert read_hosts_file(str(path)) == ["127.0.0.1:9000", "127.0.0.1:9001"]
+
+
+class TestRunBench:
+    """Test workloads against simulated devices."""
+
+    @pytest.mark.asyncio
+    async def test_status_requests(self, simulator):
+        """Test a fixed number of status reads spread over the devices."""
+        devices = await simulator.add_devices(3)
+        clients = make_clients(devices)
+        try:
+            report = await run_bench(clients, requests=30, concurrency=3)
+        finally:
+            await close_all(clients)
+
+        stats = report.stats["status"]
+        assert stats.ok == 30
+        assert not stats.errors
+        assert [device.counts["ok"] for device in devices] == [10, 10, 10]
+        assert report.to_dict()["commands"]["status"]["p50"] > 0
+
+    @pytest.mark.asyncio
+    async def test_set_alternates(self, simulator):
+        """Test set commands alternate ON and OFF on each outlet."""
+        device = await simulator.add_device(overlap=OVERLAP_QUEUE)
+        clients = make_clients([device])
+        try:
+            report = await run_bench(
+                clients, workload="set", requests=5, outlets=(1, 2)
+            )
+        finally:
+            await close_all(clients)
+
+        assert report.stats["set"].ok == 5
+        # Outlet 1: ON, OFF, ON; outlet 2: ON, OFF
+        assert device.outlets == 0b01
+
+    @pytest.mark.asyncio
+    async def test_errors_are_broken_down(self, simulator):
+        """Test failed commands are counted by error type, not timed."""
+        device = await simulator.add_device(error_rate=1.0)
+        clients = make_clients([device], failure_threshold=0)
+        try:
+            report = await run_bench(clients, workload="toggle", requests=4)
+        finally:
+            await close_all(clients)
+
+        stats = report.stats["toggle"]
+        assert stats.ok == 0
+        assert stats.failed == 4
+        assert len(stats.errors) == 1
+
+    @pytest.mark.asyncio
+    async def test_mixed(self, simulator):
+        """Test the mixed workload runs every command type."""
+        devices = await simulator.add_devices(2, overlap=OVERLAP_ALLOW)
+        clients = make_clients(devices)
+        try:
+            report = await run_bench(
+                clients,
+                workload="mixed",
+                requests=200,
+                concurrency=4,
+                rng=random.Random(1),
+            )
+        finally:
+            await close_all(clients)
+
+        assert set(report.stats) == set(MIXED_WEIGHTS)
+        assert report.total.ok == 200
+        assert report.stats["status"].ok > report.stats["set"].ok
+
+    @pytest.mark.asyncio
+    async def test_rate(self, simulator):
+        """Test an open-loop rate paces command starts."""
+        device = await simulator.add_device()
+        clients = make_clients([device])
+        try:
+            report = await run_bench(clients, rate=100, requests=10)
+        finally:
+            await close_all(clients)
+
+        assert report.stats["status"].ok == 10
+        # Ten starts at 100/s span 90 ms
+        assert report.duration >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_duration(self, simulator):
+        """Test a duration stops starting new commands."""
+        device = await simulator.add_device(latency=0.01)
+        clients = make_clients([device])
+        try:
+            report = await run_bench(clients, duration=0.1)
+        finally:
+            await close_all(clients)
+
+        assert 1 <= report.stats["status"].ok <= 11
+        assert report.duration < 0.5
+
+    @pytest.mark.asyncio
+    async def test_invalid_workload(self, simulator):
+        """Test unknown workloads are rejected."""
+        device = await simulator.add_device()
+        clients = make_clients([device])
+        try:
+            with pytest.raises(ValueError):
+                await run_bench(clients, workload="reboot", requests=1)
+        finally:
+            await close_all(clients)
+
+
+class TestBenchCommand:
+    """Test the bench CLI command."""
+
+    def test_requires_devices(self):
+        """Test bench without any device fails."""
+        result = CliRunner().invoke(
+            cli,
+            ["bench", "-n", "1"],
+            obj={},
+            env={"NETCOMMANDER_HOST": None, "NETCOMMANDER_TRANSPORT": None},
+        )
+        assert result.exit_code == 1
+        assert "No devices" in result.output
+
+    def test_switching_needs_confirmation(self):
+        """Test switching workloads ask before touching outlets."""
+        result = CliRunner().invoke(
+            cli,
+            ["--host", "192.0.2.1", "bench", "-w", "toggle", "-n", "1"],
+            obj={},
+            input="n\n",
+        )
+        assert result.exit_code == 1
+        assert "Continue?" in result.output
+
+    def test_transport_with_devices_rejected(self):
+        """Test --transport is not silently ignored for a device list."""
+        result = CliRunner().invoke(
+            cli,
+            ["--transport", "telnet://192.0.2.1", "bench", "--device", "192.0.2.2", "-n", "1"],
+            obj={},
+        )
+        assert result.exit_code == 1
+        assert "--transport cannot be combined" in result.output
@@ -1,5 +1,7 @@
 """Tests for NetCommander client."""
+import asyncio
 import pytest
+import time
 from unittest.mock import AsyncMock, patch
 import sys
 import os
@@ -9,7 +11,6 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 from netcommander import NetCommanderClient
 from netcommander.exceptions import (
     AuthenticationError,
-    ConnectionError,
     CommandError,
     InvalidOutletError,
     ParseError,
@@ -124,14 +125,22 @@ class TestNetCommanderClient:
                 assert result is True
 
     @pytest.mark.asyncio
-    async def test_invalid_outlet_number(self, connection_params):
-        """Test invalid outlet number raises error."""
-        async with NetCommanderClient(**connection_params) as client:
-            with pytest.raises(InvalidOutletError):
-                await client.turn_on(0)
+    async def test_invalid_outlet_number(
+        self, connection_params, mock_session, device_session
+    ):
+        """Test invalid outlet numbers raise before a command is sent."""
+        commands = device_session("10101")
 
-            with pytest.raises(InvalidOutletError):
-                await client.turn_on(6)
+        with patch("aiohttp.ClientSession", return_value=mock_session):
+            async with NetCommanderClient(**connection_params) as client:
+                with pytest.raises(InvalidOutletError):
+                    await client.turn_on(0)
+
+                await client.get_status()
+                with pytest.raises(InvalidOutletError):
+                    await client.turn_on(6)
+
+        assert commands == ["$A5"]
 
     @pytest.mark.asyncio
     async def test_authentication_error(self, connection_params, mock_session):
@@ -156,32 +165,28 @@ class TestNetCommanderClient:
                     await client._send_command("$A5")
 
     @pytest.mark.asyncio
-    async def test_turn_on_all(self, connection_params, mock_session):
+    async def test_turn_on_all(self, connection_params, mock_session, device_session):
         """Test turning on all outlets."""
-        mock_session.get.return_value.__aenter__.return_value.text = AsyncMock(
-            return_value="$A0"
-        )
+        commands = device_session("00000")
 
         with patch("aiohttp.ClientSession", return_value=mock_session):
             async with NetCommanderClient(**connection_params) as client:
                 results = await client.turn_on_all()
 
-                assert len(results) == 5
-                assert all(results.values())
+        assert results == {1: True, 2: True, 3: True, 4: True, 5: True}
+        assert commands == ["$A5"] + [f"$A3 {n} 1" for n in range(1, 6)] + ["$A5"]
 
     @pytest.mark.asyncio
-    async def test_turn_off_all(self, connection_params, mock_session):
+    async def test_turn_off_all(self, connection_params, mock_session, device_session):
         """Test turning off all outlets."""
-        mock_session.get.return_value.__aenter__.return_value.text = AsyncMock(
-            return_value="$A0"
-        )
+        commands = device_session("11111")
 
         with patch("aiohttp.ClientSession", return_value=mock_session):
             async with NetCommanderClient(**connection_params) as client:
                 results = await client.turn_off_all()
 
-                assert len(results) == 5
-                assert all(results.values())
+        assert results == {1: True, 2: True, 3: True, 4: True, 5: True}
+        assert commands == ["$A5"] + [f"$A3 {n} 0" for n in range(1, 6)] + ["$A5"]
 
     @pytest.mark.asyncio
     async def test_get_outlet_state(self, connection_params, mock_session):
@@ -209,7 +214,6 @@ class TestStatusParsing:
 
         status = client._parse_status_response(response)
 
-        assert all(status.outlets.values())
         assert status.total_current_amps == 5.0
         assert status.temperature == "30"
 
@@ -220,7 +224,6 @@ class TestStatusParsing:
 
         status = client._parse_status_response(response)
 
-        assert not any(status.outlets.values())
         assert status.total_current_amps == 0.0
         assert status.temperature == "XX"
 
@@ -284,3 +287,317 @@ class TestDeviceInfoParsing:
 
         with pytest.raises(ParseError):
             client._parse_device_info_response("$AF,Error")
+
+
+class TestStatusCoalescing:
+    """Test single-flight coalescing of concurrent status reads."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_get_status_single_request(
+        self, connection_params, mock_session
+    ):
+        """Test concurrent get_status() calls share one device request."""
+        async def slow_text(**kwargs):
+            await asyncio.sleep(0.01)
+            return "$A0,10101,2.50,25"
+
+        mock_session.get.return_value.__aenter__.return_value.text = slow_text
+
+        with patch("aiohttp.ClientSession", return_value=mock_session):
+            async with NetCommanderClient(**connection_params) as client:
+                results = await asyncio.gather(
+                    *(client.get_status() for _ in range(5))
+                )
+
+                assert mock_session.get.call_count == 1
+                assert all(status is results[0] for status in results)
+
+                # A new call after completion issues a fresh request
+                await client.get_status()
+                assert mock_session.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_get_status_shares_error(
+        self, connection_params, mock_session
+    ):
+        """Test all coalesced callers receive the same failure."""
+        mock_session.get.return_value.__aenter__.return_value.status = 401
+
+        with patch("aiohttp.ClientSession", return_value=mock_session):
+            async with NetCommanderClient(**connection_params) as client:
+                results = await asyncio.gather(
+                    *(client.get_status() for _ in range(3)),
+                    return_exceptions=True,
+                )
+
+                assert mock_session.get.call_count == 1
+                assert all(isinstance(r, AuthenticationError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_clients_with_other_credentials_not_folded(
+        self, connection_params, mock_session
+    ):
+        """Test clients with different credentials each get their own read."""
+
+        async def slow_text(**kwargs):
+            await asyncio.sleep(0.01)
+            return "$A0,10101,2.50,25"
+
+        mock_session.get.return_value.__aenter__.return_value.text = slow_text
+
+        with patch("aiohttp.ClientSession", return_value=mock_session):
+            async with NetCommanderClient(**connection_params) as admin:
+                async with NetCommanderClient(
+                    **{**connection_params, "username": "guest", "password": "x"}
+                ) as guest:
+                    assert guest.scheduler is admin.scheduler
+                    # Occupy the device so both polls wait in the queue
+                    busy = asyncio.create_task(admin.turn_on(1))
+                    await asyncio.sleep(0)
+                    await asyncio.gather(admin.get_status(), guest.get_status())
+                    await busy
+
+        auths = [call.kwargs.get("auth") for call in mock_session.get.call_args_list]
+        assert mock_session.get.call_count == 3
+        assert {auth.login for auth in auths[1:]} == {"admin", "guest"}
+
+
+class TestStatusCache:
+    """Test the TTL status cache and write-through updates."""
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled_by_default(self, connection_params, mock_session):
+        """Test every read goes to the device without a max age."""
+        with patch("aiohttp.ClientSession", return_value=mock_session):
+            async with NetCommanderClient(**connection_params) as client:
+                await client.get_status()
+                await client.get_status()
+                assert mock_session.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_reads_within_max_age_served_from_cache(
+        self, connection_params, mock_session
+    ):
+        """Test reads within the TTL do not hit the device."""
+        with patch("aiohttp.ClientSession", return_value=mock_session):
+            async with NetCommanderClient(
+                **connection_params, status_max_age=60
+            ) as client:
+                first = await client.get_status()
+                assert await client.get_status() is first
+                assert await client.get_outlet_state(1) is True
+                assert mock_session.get.call_count == 1
+
+                await client.get_status(force=True)
+                assert mock_session.get.call_count == 2
+
+                await client.get_status(max_age=0)
+                assert mock_session.get.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_set_outlet_patches_cache(self, connection_params, mock_session):
+        """Test set_outlet() and toggle_outlet() update the cached status."""
+        response = mock_session.get.return_value.__aenter__.return_value
+
+        with patch("aiohttp.ClientSession", return_value=mock_session):
+            async with NetCommanderClient(
+                **connection_params, status_max_age=60
+            ) as client:
+                await client.get_status()
+
+                response.text = AsyncMock(return_value="$A0")
+                await client.turn_off(1)
+                await client.toggle_outlet(2)
+
+                status = await client.get_status()
+                assert status.outlets[1] is False
+                assert status.outlets[2] is True
+                assert status.total_current_amps == 2.50
+                assert mock_session.get.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_command_invalidates_cache(
+        self, connection_params, mock_session
+    ):
+        """Test a failed outlet command forces the next read to the device."""
+        response = mock_session.get.return_value.__aenter__.return_value
+
+        with patch("aiohttp.ClientSession", return_value=mock_session):
+            async with NetCommanderClient(
+                **connection_params, status_max_age=60
+            ) as client:
+                await client.get_status()
+
+                response.text = AsyncMock(return_value="$AF")
+                with pytest.raises(CommandError):
+                    await client.turn_on(2)
+
+                response.text = AsyncMock(return_value="$A0,10101,2.50,25")
+                await client.get_status()
+                assert mock_session.get.call_count == 3
+
+
+class TestSetOutlets:
+    """Test batch outlet control."""
+
+    @pytest.mark.asyncio
+    async def test_set_outlets_only_sends_changes(
+        self, connection_params, mock_session, device_session
+    ):
+        """Test only outlets that differ get a command."""
+        commands = device_session("10101")
+
+        with patch("aiohttp.ClientSession", return_value=mock_session):
+            async with NetCommanderClient(**connection_params) as client:
+                result = await client.set_outlets({1: True, 2: True, 3: False})
+
+        assert commands == ["$A5", "$A3 2 1", "$A3 3 0", "$A5"]
+        assert result.changed == [2, 3]
+        assert result.results == {1: True, 2: True, 3: True}
+        assert result.all_succeeded
+        assert result.status.outlets[2] is True
+        assert result.status.outlets[3] is False
+
+    @pytest.mark.asyncio
+    async def test_set_outlets_no_changes(
+        self, connection_params, mock_session, device_session
+    ):
+        """Test nothing is sent when outlets are already in state."""
+        commands = device_session("10101")
+
+        with patch("aiohttp.ClientSession", return_value=mock_session):
+            async with NetCommanderClient(**connection_params) as client:
+                result = await client.set_outlets({1: True, 2: False})
+
+        assert commands == ["$A5"]
+        assert result.changed == []
+        assert result.status.outlets[1] is True
+
+    @pytest.mark.asyncio
+    async def test_set_outlets_invalid_outlet(
+        self, connection_params, mock_session, device_session
+    ):
+        """Test unknown outlets are rejected before any command is sent."""
+        commands = device_session("10101")
+
+        with patch("aiohttp.ClientSession", return_value=mock_session):
+            async with NetCommanderClient(**connection_params) as client:
+                with pytest.raises(InvalidOutletError):
+                    await client.set_outlets({1: False, 6: True})
+
+        assert commands == ["$A5"]
+
+    @pytest.mark.asyncio
+    async def test_turn_on_all_skips_outlets_already_on(
+        self, connection_params, mock_session, device_session
+    ):
+        """Test turn_on_all() only commands outlets that are off."""
+        commands = device_session("10101")
+
+        with patch("aiohttp.ClientSession", return_value=mock_session):
+            async with NetCommanderClient(**connection_params) as client:
+                results = await client.turn_on_all()
+
+        assert results == {1: True, 2: True, 3: True, 4: True, 5: True}
+        assert commands == ["$A5", "$A3 2 1", "$A3 4 1", "$A5"]
+
+
+class TestBulkFanOut:
+    """Test concurrency and stagger of bulk outlet operations."""
+
+    @pytest.mark.asyncio
+    async def test_serial_by_default(
+        self, connection_params, mock_session, device_session
+    ):
+        """Test bulk commands run one at a time by default."""
+        commands = device_session("00000")
+        running = 0
+        peak = 0
+        get = mock_session.get.side_effect
+
+        def tracking_get(url, **kwargs):
+            response = get(url, **kwargs)
+            text = response.text.return_value
+
+            async def slow_text(**kwargs):
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+                return text
+
+            response.text = slow_text
+            return response
+
+        mock_session.get.side_effect = tracking_get
+
+        with patch("aiohttp.ClientSession", return_value=mock_session):
+            async with NetCommanderClient(**connection_params) as client:
+                await client.turn_on_all()
+                assert peak == 1
+
+        with patch("aiohttp.ClientSession", return_value=mock_session):
+            async with NetCommanderClient(
+                **{**connection_params, "host": "192.168.1.150"},
+                max_concurrency=3,
+            ) as client:
+                await client.turn_off_all()
+                assert peak == 3
+
+        assert len(commands) == 14
+
+    @pytest.mark.asyncio
+    async def test_failing_outlet_isolated(
+        self, connection_params, mock_session, device_session
+    ):
+        """Test one failing outlet does not stop the others."""
+        device_session("00000")
+        get = mock_session.get.side_effect
+
+        def failing_get(url, **kwargs):
+            response = get(url, **kwargs)
+            if url.endswith("$A3 3 1"):
+                response.text = AsyncMock(return_value="$AF")
+            return response
+
+        mock_session.get.side_effect = failing_get
+
+        with patch("aiohttp.ClientSession", return_value=mock_session):
+            async with NetCommanderClient(**connection_params) as client:
+                results = await client.turn_on_all(concurrency=2)
+
+        assert results == {1: True, 2: True, 3: False, 4: True, 5: True}
+
+    @pytest.mark.asyncio
+    async def test_stagger_spaces_commands(
+        self, connection_params, mock_session, device_session
+    ):
+        """Test stagger enforces a gap between command starts."""
+        device_session("00000")
+
+        with patch("aiohttp.ClientSession", return_value=mock_session):
+            async with NetCommanderClient(**connection_params) as client:
+                started = time.monotonic()
+                await client.set_outlets({1: True, 2: True, 3: True}, stagger=0.02)
+                assert time.monotonic() - started >= 0.04
+
+
+class TestCompactStatusReads:
+    """Test compact status reads."""
+
+    @pytest.mark.asyncio
+    async def test_get_status_compact(self, connection_params, mock_session):
+        """Test get_status_compact() shares the cache with get_status()."""
+        with patch("aiohttp.ClientSession", return_value=mock_session):
+            async with NetCommanderClient(
+                **connection_params, status_max_age=60
+            ) as client:
+                compact = await client.get_status_compact()
+                assert compact.bitmask == 0b10101
+                assert compact.num_outlets == 5
+
+                status = await client.get_status()
+                assert status.raw_response == "$A0,10101,2.50,25"
+                assert status.outlets == compact.outlets
+                assert mock_session.get.call_count == 1
@@ -0,0 +1,162 @@
+"""Tests for the Prometheus exporter."""
+import asyncio
+import math
+import time
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from aiohttp.test_utils import TestClient, TestServer
+
+from netcommander import FleetClient, PollResult
+from netcommander.exceptions import NetCommanderConnectionError
+from netcommander.models import CompactStatus
+
+from netcommander_cli.exporter import (
+    CONTENT_TYPE,
+    LATENCY_BUCKETS,
+    Exporter,
+    escape_label,
+    format_value,
+    parse_temperature,
+)
+
+
+def samples(page: bytes) -> dict:
+    """Parse a metrics page into {name{labels}: value}."""
+    result = {}
+    for line in page.decode("utf-8").splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            result[name] = float(value)
+    return result
+
+
+@pytest.fixture
+async def fleet(simulator):
+    """Open a fleet of two simulated devices, one with a sensor."""
+    await simulator.add_device(outlets=0b10101, temperature="27")
+    await simulator.add_device(num_outlets=8)
+    names = [f"127.0.0.1:{port}" for port in simulator.devices]
+    async with FleetClient(names, "admin", "admin", retries=0) as fleet:
+        yield fleet
+
+
+class TestFormatting:
+    """Test text format helpers."""
+
+    def test_format_value(self):
+        """Test sample values."""
+        assert format_value(1) == "1"
+        assert format_value(True) == "1"
+        assert format_value(2.5) == "2.5"
+        assert format_value(math.inf) == "+Inf"
+        assert format_value(math.nan) == "NaN"
+
+    def test_escape_label(self):
+        """Test label values are escaped."""
+        assert escape_label('a"b\\c\nd') == 'a\\"b\\\\c\\nd'
+
+    def test_parse_temperature(self):
+        """Test devices without a sensor have no temperature."""
+        assert parse_temperature("27") == 27.0
+        assert parse_temperature("XX") is None
+        assert parse_temperature(None) is None
+
+    def test_buckets_are_client_bucket_bounds(self):
+        """Test exported bounds line up with the client's histogram."""
+        from netcommander.stats import bucket_upper_bound
+
+        bounds = [bucket_upper_bound(index) for index in range(80)]
+        for bound in LATENCY_BUCKETS:
+            assert bound == pytest.approx(min(bounds, key=lambda b: abs(b - bound)))
+
+
+class TestExporter:
+    """Test the exporter against simulated devices."""
+
+    @pytest.mark.asyncio
+    async def test_metrics(self, fleet):
+        """Test polled state and request statistics are exported."""
+        exporter = Exporter(fleet, interval=0.2, jitter=0)
+        async with exporter:
+            for _ in range(50):
+                if exporter.poller.polls >= 2:
+                    break
+                await asyncio.sleep(0.02)
+            page = samples(exporter.render())
+
+        first, second = fleet.devices
+        assert page[f'netcommander_up{{device="{first}"}}'] == 1
+        assert page[f'netcommander_outlet_on{{device="{first}",outlet="1"}}'] == 1
+        assert page[f'netcommander_outlet_on{{device="{first}",outlet="2"}}'] == 0
+        assert page[f'netcommander_outlet_on{{device="{second}",outlet="8"}}'] == 0
+        assert page[f'netcommander_current_amps{{device="{first}"}}'] == 0.66
+        assert page[f'netcommander_temperature_celsius{{device="{first}"}}'] == 27
+        assert f'netcommander_temperature_celsius{{device="{second}"}}' not in page
+
+        labels = f'device="{first}",command="$A5"'
+        requests = page[f"netcommander_requests_total{{{labels},outcome=\"ok\"}}"]
+        assert requests >= 1
+        assert page[f'netcommander_request_duration_seconds_bucket{{{labels},le="+Inf"}}'] == requests
+        assert page[f"netcommander_request_duration_seconds_count{{{labels}}}"] == requests
+        assert page["netcommander_exporter_devices"] == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_poll_keeps_recent_status(self, fleet):
+        """Test a failed poll marks the device down without a gap."""
+        device = fleet.devices[0]
+        exporter = Exporter(fleet, interval=10)
+        status = CompactStatus(0b1, 5, 0.26, "XX")
+        now = time.time()
+        exporter.update(PollResult(device, status, None, now, 0.01))
+        exporter.update(
+            PollResult(
+                device, None, NetCommanderConnectionError(device), now, 0.5
+            )
+        )
+
+        page = samples(exporter.render())
+
+        assert page[f'netcommander_up{{device="{device}"}}'] == 0
+        assert page[f'netcommander_current_amps{{device="{device}"}}'] == 0.26
+
+    @pytest.mark.asyncio
+    async def test_stale_status_is_dropped(self, fleet):
+        """Test a status older than stale_after is no longer exported."""
+        device = fleet.devices[0]
+        exporter = Exporter(fleet, interval=10, stale_after=60)
+        status = CompactStatus(0b1, 5, 0.26, "XX")
+        exporter.update(PollResult(device, status, None, time.time() - 120, 0.01))
+
+        page = samples(exporter.render())
+
+        assert page[f'netcommander_up{{device="{device}"}}'] == 1
+        assert f'netcommander_current_amps{{device="{device}"}}' not in page
+
+    @pytest.mark.asyncio
+    async def test_page_is_cached_between_polls(self, fleet):
+        """Test scrapes reuse the page until a poll result arrives."""
+        exporter = Exporter(fleet, interval=10)
+        page = exporter.render()
+        assert exporter.render() is page
+
+        status = CompactStatus(0, 5, 0.06, "XX")
+        exporter.update(PollResult(fleet.devices[0], status, None, time.time(), 0.01))
+        assert exporter.render() is not page
+
+    @pytest.mark.asyncio
+    async def test_http_endpoint(self, fleet):
+        """Test /metrics is served in the text format without device I/O."""
+        exporter = Exporter(fleet, interval=10)
+        async with TestClient(TestServer(exporter.application())) as http:
+            response = await http.get("/metrics")
+            body = await response.read()
+
+        assert response.status == 200
+        assert response.headers["Content-Type"] == CONTENT_TYPE
+        assert b"# TYPE netcommander_up gauge" in body
+        assert exporter.scrapes == 1
+        assert all(not stats.commands for stats in fleet.stats().values())
@@ -0,0 +1,195 @@
+"""Tests for FleetClient."""
+import asyncio
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from netcommander import FleetClient, FleetResult
+from netcommander.exceptions import NetCommanderConnectionError
+from netcommander.fleet import parse_device
+from netcommander.models import CompactStatus, OutletBatchResult
+
+from tests.test_transports import FakeHttpDevice
+
+
+@pytest.fixture
+async def http_devices():
+    """Run several fake device HTTP servers."""
+    devices = [FakeHttpDevice() for _ in range(4)]
+    for device in devices:
+        device.port = await device.start()
+        device.name = f"127.0.0.1:{device.port}"
+    yield devices
+    for device in devices:
+        await device.stop()
+
+
+def make_fleet(devices, **options):
+    """Create a fleet for fake devices without retries."""
+    options.setdefault("retries", 0)
+    return FleetClient(
+        [device.name for device in devices], "admin", "admin", **options
+    )
+
+
+class TestParseDevice:
+    """Test device name parsing."""
+
+    def test_host_only(self):
+        """Test the HTTP port is the default."""
+        assert parse_device("10.0.0.1") == ("10.0.0.1", 80)
+
+    def test_host_and_port(self):
+        """Test an explicit port."""
+        assert parse_device("pdu-1.lab:8080") == ("pdu-1.lab", 8080)
+
+    def test_invalid(self):
+        """Test unparsable names are rejected."""
+        with pytest.raises(ValueError):
+            parse_device("10.0.0.1:http")
+        with pytest.raises(ValueError):
+            FleetClient([""], "admin", "admin")
+
+
+class TestFleetClient:
+    """Test FleetClient against local fake devices."""
+
+    @pytest.mark.asyncio
+    async def test_status_all(self, http_devices):
+        """Test every device's status is read, in fleet order."""
+        http_devices[1].outlets = "11111"
+        async with make_fleet(http_devices) as fleet:
+            results = await fleet.status_all()
+
+        assert list(results) == [device.name for device in http_devices]
+        assert all(result.ok for result in results.values())
+        status = results[http_devices[1].name].value
+        assert isinstance(status, CompactStatus)
+        assert status.all_on
+
+    @pytest.mark.asyncio
+    async def test_shared_session(self, http_devices):
+        """Test every device client uses the fleet's session."""
+        async with make_fleet(http_devices) as fleet:
+            sessions = {
+                id(fleet.client(device.name)._session) for device in http_devices
+            }
+            assert len(sessions) == 1
+            assert fleet.client(http_devices[0].name) is fleet.client(
+                http_devices[0].name
+            )
+
+    @pytest.mark.asyncio
+    async def test_errors_do_not_stop_sweep(self, http_devices):
+        """Test an unreachable device is reported without failing the rest."""
+        await http_devices[0].stop()
+        http_devices[0]._server = await asyncio.start_server(
+            lambda r, w: w.close(), "127.0.0.1", 0
+        )
+        async with make_fleet(http_devices, failure_threshold=0) as fleet:
+            results = await fleet.status_all()
+
+        failed = results[http_devices[0].name]
+        assert not failed.ok
+        assert isinstance(failed.error, NetCommanderConnectionError)
+        assert all(results[device.name].ok for device in http_devices[1:])
+
+    @pytest.mark.asyncio
+    async def test_bounded_concurrency(self, http_devices):
+        """Test no more than concurrency devices are worked on at once."""
+        running = 0
+        peak = 0
+
+        async def operation(client):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            try:
+                await asyncio.sleep(0.01)
+                return await client.get_status_compact()
+            finally:
+                running -= 1
+
+        async with make_fleet(http_devices, concurrency=2) as fleet:
+            results = [result async for result in fleet.as_completed(operation)]
+
+        assert len(results) == len(http_devices)
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_as_completed_order(self, http_devices):
+        """Test results stream in completion order."""
+        http_devices[0].delay = 0.1
+        async with make_fleet(http_devices) as fleet:
+            results = [
+                result
+                async for result in fleet.iter_status(
+                    devices=[http_devices[0].name, http_devices[1].name]
+                )
+            ]
+
+        assert [result.device for result in results] == [
+            http_devices[1].name,
+            http_devices[0].name,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_early_exit_cancels_pending(self, http_devices):
+        """Test leaving the stream early cancels the remaining operations."""
+        started = []
+
+        async def operation(client):
+            started.append(client.port)
+            await asyncio.sleep(10)
+
+        async def first():
+            async for result in fleet.as_completed(operation):
+                return result
+
+        async with make_fleet(http_devices, concurrency=2) as fleet:
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(first(), 0.05)
+
+        assert len(started) == 2
+
+    @pytest.mark.asyncio
+    async def test_set_outlets_many(self, http_devices):
+        """Test outlets are set on several devices."""
+        first, second = http_devices[:2]
+        async with make_fleet(http_devices) as fleet:
+            results = await fleet.set_outlets_many({
+                first.name: {2: True},
+                second.name: {1: False, 2: False},
+            })
+
+        assert list(results) == [first.name, second.name]
+        assert isinstance(results[first.name].value, OutletBatchResult)
+        assert results[first.name].value.changed == [2]
+        assert results[second.name].value.changed == [1]
+        assert first.outlets == "10111"
+        assert second.outlets == "10100"
+
+    @pytest.mark.asyncio
+    async def test_unknown_device(self, http_devices):
+        """Test selecting a device outside the fleet raises KeyError."""
+        async with make_fleet(http_devices) as fleet:
+            with pytest.raises(KeyError):
+                await fleet.status_all(devices=["10.9.9.9"])
+
+    @pytest.mark.asyncio
+    async def test_add_and_remove_device(self, http_devices):
+        """Test the fleet can change while open."""
+        fleet = make_fleet(http_devices[:1])
+        async with fleet:
+            fleet.add_device(http_devices[1].name)
+            assert len(fleet) == 2
+            await fleet.status_all()
+            await fleet.remove_device(http_devices[0].name)
+            assert fleet.devices == [http_devices[1].name]
+
+    def test_result(self):
+        """Test FleetResult success flag."""
+        assert FleetResult("a", 1).ok
+        assert not FleetResult("a", error=NetCommanderConnectionError("a", "x")).ok
@@ -82,6 +82,29 @@ class TestNetCommanderCoordinator:
         mock_client.get_device_info.assert_not_called()
         mock_client.get_status.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_coordinator_update_records_history(self, hass, mock_client):
+        """Test polled statuses are kept in the history for derived sensors."""
+        coordinator = NetCommanderCoordinator(
+            hass,
+            host="192.168.1.100",
+            username="admin",
+            password="admin",
+            scan_interval=60,
+        )
+        coordinator.client = mock_client
+
+        await coordinator._async_update_data()
+        await coordinator._async_update_data()
+
+        assert coordinator.history.capacity == 61
+        assert len(coordinator.history) == 2
+        sample = coordinator.history.latest()
+        assert sample.current == 2.5
+        assert sample.temperature == 25.0
+        assert sample.bitmask == 0b10101
+        assert coordinator.history.mean(300) == 2.5
+
     @pytest.mark.asyncio
     async def test_coordinator_update_failure(self, hass, mock_client):
         """Test update failure handling."""
@@ -135,6 +158,53 @@ class TestNetCommanderCoordinator:
         mock_client.turn_off.assert_called_once_with(5)
         coordinator.async_request_refresh.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_coordinator_turn_on_optimistic(self, hass, mock_client, device_status):
+        """Test turning on an outlet updates cached state before polling."""
+        coordinator = NetCommanderCoordinator(
+            hass,
+            host="192.168.1.100",
+            username="admin",
+            password="admin",
+        )
+        coordinator.client = mock_client
+        coordinator.data = device_status
+        coordinator.async_set_updated_data = MagicMock()
+        coordinator.async_request_refresh = AsyncMock()
+
+        result = await coordinator.async_turn_on(2)
+
+        assert result is True
+        coordinator.async_set_updated_data.assert_called_once()
+        updated = coordinator.async_set_updated_data.call_args[0][0]
+        assert updated.outlets[2] is True
+        assert updated.outlets[1] is True
+        mock_client.get_status.assert_not_called()
+        coordinator.async_request_refresh.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_coordinator_turn_off_not_applied_on_failure(
+        self, hass, mock_client, device_status
+    ):
+        """Test a rejected command does not change cached state."""
+        coordinator = NetCommanderCoordinator(
+            hass,
+            host="192.168.1.100",
+            username="admin",
+            password="admin",
+        )
+        coordinator.client = mock_client
+        coordinator.data = device_status
+        coordinator.async_set_updated_data = MagicMock()
+        coordinator.async_request_refresh = AsyncMock()
+        mock_client.turn_off.return_value = False
+
+        result = await coordinator.async_turn_off(1)
+
+        assert result is False
+        coordinator.async_set_updated_data.assert_not_called()
+        coordinator.async_request_refresh.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_coordinator_reboot_outlet(self, hass, mock_client):
         """Test rebooting an outlet."""
@@ -0,0 +1,85 @@
+"""Tests for the in-memory status history."""
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from netcommander import CompactStatus, DeviceStatus, HistorySample, StatusHistory
+
+
+class TestStatusHistory:
+    """Test the ring buffer and its window statistics."""
+
+    def test_empty(self):
+        """Test an empty history has no figures."""
+        history = StatusHistory(capacity=4)
+        assert len(history) == 0
+        assert history.latest() is None
+        assert history.mean(300) is None
+        assert history.peak(300) is None
+        assert list(history) == []
+
+    def test_invalid_capacity(self):
+        """Test the capacity must be positive."""
+        with pytest.raises(ValueError):
+            StatusHistory(capacity=0)
+
+    def test_wraps_around(self):
+        """Test the oldest samples are dropped when full."""
+        history = StatusHistory(capacity=3)
+        for second in range(5):
+            history.append(float(second), float(second))
+
+        assert len(history) == 3
+        assert [sample.timestamp for sample in history] == [2.0, 3.0, 4.0]
+        assert history.latest() == HistorySample(4.0, 4.0, None, 0)
+
+    def test_window(self):
+        """Test statistics only cover the window."""
+        history = StatusHistory(capacity=10)
+        for timestamp, current in ((0, 9.0), (100, 1.0), (200, 2.5), (300, 3.5)):
+            history.append(float(timestamp), current, 20.0 + current)
+
+        assert [s.current for s in history.window(200, now=300)] == [1.0, 2.5, 3.5]
+        assert history.mean(200, now=300) == 2.33
+        assert history.peak(200, now=300) == 3.5
+        assert history.minimum(200, now=300) == 1.0
+        assert history.peak(200, field="temperature", now=300) == 23.5
+        assert history.mean(60, now=1000) is None
+
+    def test_missing_temperatures(self):
+        """Test samples without a sensor reading are skipped."""
+        history = StatusHistory()
+        history.append(0.0, 1.0, None)
+        history.append(1.0, 1.0, 30.0)
+        assert history.mean(60, field="temperature", now=1) == 30.0
+        assert history.window(60, now=1)[0].temperature is None
+        with pytest.raises(ValueError):
+            history.mean(60, field="bitmask")
+
+    def test_add_status(self):
+        """Test device and compact statuses are sampled."""
+        history = StatusHistory()
+        history.add(
+            DeviceStatus(
+                outlets={1: True, 2: False, 3: True},
+                total_current_amps=1.2,
+                temperature="XX",
+                raw_response="$A0,101,1.20,XX",
+            ),
+            timestamp=10.0,
+        )
+        history.add(CompactStatus(0b11, 3, 0.7, "24"), timestamp=20.0)
+
+        first, second = history
+        assert first == HistorySample(10.0, 1.2, None, 0b101)
+        assert second == HistorySample(20.0, 0.7, 24.0, 0b11)
+
+    def test_clear(self):
+        """Test clearing drops all samples."""
+        history = StatusHistory(capacity=2)
+        history.append(0.0, 1.0)
+        history.clear()
+        assert len(history) == 0
+        assert history.peak(60, now=0) is None
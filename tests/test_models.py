@@ -5,7 +5,7 @@ import os
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
-from netcommander.models import DeviceStatus, DeviceInfo, OutletState
+from netcommander.models import CompactStatus, DeviceStatus, DeviceInfo, OutletState
 
 
 class TestDeviceStatus:
@@ -78,6 +78,76 @@ class TestDeviceStatus:
         assert len(status.outlets_on) == 0
         assert len(status.outlets_off) == 5
 
+    def test_with_outlet(self):
+        """Test with_outlet returns an updated copy."""
+        status = DeviceStatus(
+            outlets={1: True, 2: False, 3: True, 4: False, 5: True},
+            total_current_amps=2.5,
+            temperature="25",
+            raw_response="$A0,10101,2.50,25",
+        )
+
+        updated = status.with_outlet(2, True)
+
+        assert updated.outlets[2] is True
+        assert status.outlets[2] is False
+        assert updated.total_current_amps == 2.5
+
+        with pytest.raises(ValueError):
+            status.with_outlet(6, True)
+
+
+class TestCompactStatus:
+    """Test CompactStatus representation."""
+
+    def test_views(self):
+        """Test dict-style views are derived from the bitmask."""
+        status = CompactStatus(0b10101, 5, 2.5, "25")
+
+        assert status.outlets == {1: True, 2: False, 3: True, 4: False, 5: True}
+        assert status.outlets_on == [1, 3, 5]
+        assert status.outlets_off == [2, 4]
+        assert status.status_string == "10101"
+        assert status.get_outlet_state(3) is True
+        assert not status.all_on
+        assert not status.all_off
+        assert CompactStatus(0b11111, 5, 5.0).all_on
+        assert CompactStatus(0, 5, 0.0).all_off
+
+    def test_device_status_round_trip(self):
+        """Test conversion to and from DeviceStatus."""
+        device_status = DeviceStatus(
+            outlets={1: True, 2: False, 3: True, 4: False, 5: True},
+            total_current_amps=2.5,
+            temperature="25",
+            raw_response="$A0,10101,2.50,25",
+        )
+
+        compact = CompactStatus.from_device_status(device_status)
+        assert compact.bitmask == device_status.bitmask == 0b10101
+        assert compact.to_device_status() == device_status
+
+    def test_with_outlet(self):
+        """Test with_outlet flips a single bit."""
+        status = CompactStatus(0b10101, 5, 2.5, "25")
+
+        assert status.with_outlet(2, True).bitmask == 0b10111
+        assert status.with_outlet(1, False).bitmask == 0b10100
+        assert status.bitmask == 0b10101
+
+        with pytest.raises(ValueError):
+            status.with_outlet(6, True)
+
+    def test_immutable_and_slotted(self):
+        """Test instances cannot be changed and carry no __dict__."""
+        status = CompactStatus(0b10101, 5, 2.5, "25")
+
+        with pytest.raises(AttributeError):
+            status.bitmask = 0
+        assert not hasattr(status, "__dict__")
+        assert status == CompactStatus(0b10101, 5, 2.5, "25")
+        assert hash(status) == hash(CompactStatus(0b10101, 5, 2.5, "25"))
+
 
 class TestDeviceInfo:
     """Test DeviceInfo model."""
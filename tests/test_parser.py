@@ -0,0 +1,87 @@
+"""Tests for byte-level response parsers."""
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from netcommander.exceptions import ParseError
+from netcommander.parser import (
+    bitmask_to_status_string,
+    outlets_from_bitmask,
+    parse_status_bytes,
+)
+
+
+class TestParseStatusBytes:
+    """Test parse_status_bytes()."""
+
+    def test_parse_bytes_with_trailing_crlf(self):
+        """Test parsing a raw device response."""
+        bitmask, num_outlets, current, temperature = parse_status_bytes(
+            b"$A0,10101,2.50,25\r\n\r\n\r\n"
+        )
+
+        assert bitmask == 0b10101
+        assert num_outlets == 5
+        assert current == 2.50
+        assert temperature == "25"
+
+    def test_parse_str(self):
+        """Test text responses are accepted too."""
+        assert parse_status_bytes("$A0,00001,0.15,XX") == (1, 5, 0.15, "XX")
+
+    def test_bit_order(self):
+        """Test rightmost character is outlet 1."""
+        bitmask, num_outlets, _, _ = parse_status_bytes(b"$A0,10000001,1.00,XX")
+
+        assert num_outlets == 8
+        assert outlets_from_bitmask(bitmask, num_outlets) == {
+            1: True, 2: False, 3: False, 4: False,
+            5: False, 6: False, 7: False, 8: True,
+        }
+
+    def test_extra_fields(self):
+        """Test fields after the temperature are ignored."""
+        assert parse_status_bytes(b"$A0,11111,5.00,25,1\r\n") == (0b11111, 5, 5.0, "25")
+
+    def test_missing_temperature(self):
+        """Test temperature is optional."""
+        assert parse_status_bytes(b"$A0,11111,5.00") == (0b11111, 5, 5.0, None)
+
+    def test_non_ascii_temperature(self):
+        """Test non-ASCII bytes are decoded as Latin-1, not rejected."""
+        assert parse_status_bytes(b"$A0,10101,2.50,\xb0C") == (0b10101, 5, 2.5, "°C")
+        assert parse_status_bytes("$A0,10101,2.50,°C")[3] == "°C"
+
+    @pytest.mark.parametrize(
+        "response",
+        [
+            b"INVALID",
+            b"\xff\xfe",
+            b"$AF",
+            b"$A0,123",
+            b"$A0,10101",
+            b"$A0,,1.00,XX",
+            b"$A0,10201,1.00,XX",
+            b"$A0,10101,abc,XX",
+            b"$A0,10101,-1.00,XX",
+            b"$A0,10101,2.50abc",
+            b"$A0,10101,2.50abc,25",
+            b"$A0,10111x,2.50,25",
+            b"$A0,10101,2.50,25\r\nXX",
+        ],
+    )
+    def test_invalid_responses(self, response):
+        """Test malformed responses raise ParseError."""
+        with pytest.raises(ParseError):
+            parse_status_bytes(response)
+
+
+class TestBitmaskHelpers:
+    """Test bitmask conversion helpers."""
+
+    def test_status_string_round_trip(self):
+        """Test formatting a bitmask back into a status string."""
+        bitmask, num_outlets, _, _ = parse_status_bytes(b"$A0,01010,1.25,28")
+        assert bitmask_to_status_string(bitmask, num_outlets) == "01010"
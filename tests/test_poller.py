@@ -0,0 +1,219 @@
+"""Tests for the staggered status poller."""
+import asyncio
+import itertools
+import random
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from netcommander import Poller, PollResult
+from netcommander.exceptions import NetCommanderConnectionError
+from netcommander.models import CompactStatus
+from netcommander.poller import next_tick, phase_offset
+
+
+class FakeClient:
+    """Stand-in for NetCommanderClient that records poll times."""
+
+    def __init__(self, host="10.0.0.1", port=80, delay=0.0, fail=False, error=None):
+        self.host = host
+        self.port = port
+        self.delay = delay
+        self.fail = fail
+        self.error = error
+        self.polled_at = []
+
+    async def get_status_compact(self, max_age=None):
+        self.polled_at.append(asyncio.get_running_loop().time())
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        if self.fail:
+            raise NetCommanderConnectionError(self.host, "unreachable")
+        return CompactStatus(0b10101, 5, 2.5, "25")
+
+
+class TestSchedule:
+    """Test phase and tick computation."""
+
+    def test_phase_is_deterministic(self):
+        """Test a device always gets the same phase within the interval."""
+        phase = phase_offset("10.0.0.1:80", 30.0)
+        assert phase == phase_offset("10.0.0.1:80", 30.0)
+        assert 0 <= phase < 30.0
+        assert phase_offset("10.0.0.1:80", 60.0) == pytest.approx(2 * phase)
+
+    def test_phases_are_spread(self):
+        """Test many devices fill the interval evenly."""
+        phases = [
+            phase_offset(f"10.0.{i // 256}.{i % 256}:80", 1.0) for i in range(1000)
+        ]
+        buckets = [0] * 10
+        for phase in phases:
+            buckets[int(phase * 10)] += 1
+        assert min(buckets) > 60
+        assert max(buckets) < 140
+
+    def test_next_tick(self):
+        """Test ticks are aligned to the phase."""
+        assert next_tick(2.0, 10.0, 0.0) == 2.0
+        assert next_tick(2.0, 10.0, 2.0) == 2.0
+        assert next_tick(2.0, 10.0, 2.5) == 12.0
+        assert next_tick(2.0, 10.0, 1234.0) == 1242.0
+
+
+class TestPoller:
+    """Test Poller against fake clients."""
+
+    @pytest.mark.asyncio
+    async def test_publishes_results(self):
+        """Test subscribers receive every poll result."""
+        client = FakeClient()
+        results = []
+        poller = Poller([client], interval=0.05, jitter=0)
+        poller.subscribe(results.append)
+
+        async with poller:
+            await asyncio.sleep(0.22)
+
+        assert poller.devices == ["10.0.0.1:80"]
+        assert 3 <= len(results) <= 5
+        assert all(isinstance(result, PollResult) for result in results)
+        assert results[0].ok
+        assert results[0].status.outlets_on == [1, 3, 5]
+        assert poller.polls == len(results)
+
+    @pytest.mark.asyncio
+    async def test_no_drift(self):
+        """Test poll times stay on the schedule despite slow polls."""
+        client = FakeClient(delay=0.02)
+        poller = Poller({"pdu": client}, interval=0.05, jitter=0)
+
+        async with poller:
+            await asyncio.sleep(0.33)
+
+        loop_offset = poller._clock_offset
+        phase = poller.phase("pdu")
+        for polled in client.polled_at:
+            # Distance from the nearest scheduled tick, in wall clock time
+            position = (polled + loop_offset - phase) % 0.05
+            assert min(position, 0.05 - position) < 0.015
+        assert len(client.polled_at) >= 5
+
+    @pytest.mark.asyncio
+    async def test_overrunning_poll_is_skipped(self):
+        """Test a tick is skipped while the previous poll still runs."""
+        client = FakeClient(delay=0.12)
+        poller = Poller([client], interval=0.05, jitter=0)
+
+        async with poller:
+            await asyncio.sleep(0.3)
+
+        assert poller.missed > 0
+        for earlier, later in itertools.pairwise(client.polled_at):
+            assert later - earlier >= 0.1
+
+    @pytest.mark.asyncio
+    async def test_errors_are_published(self):
+        """Test failed polls are published with their error."""
+        results = []
+        poller = Poller([FakeClient(fail=True)], interval=0.05, jitter=0)
+        poller.subscribe(results.append)
+
+        async with poller:
+            await asyncio.sleep(0.12)
+
+        assert results
+        assert not results[0].ok
+        assert results[0].status is None
+        assert isinstance(results[0].error, NetCommanderConnectionError)
+        assert poller.errors == len(results)
+
+    @pytest.mark.asyncio
+    async def test_unexpected_errors_are_published(self):
+        """Test a poll failing with a non-library error is still published."""
+        results = []
+        poller = Poller(
+            [FakeClient(error=KeyError("bug"))], interval=0.05, jitter=0
+        )
+        poller.subscribe(results.append)
+
+        async with poller:
+            await asyncio.sleep(0.12)
+
+        assert results
+        assert isinstance(results[0].error, KeyError)
+        assert poller.errors == len(results)
+
+    @pytest.mark.asyncio
+    async def test_broken_subscriber(self):
+        """Test a failing subscriber doesn't stop the others."""
+        results = []
+
+        def broken(result):
+            raise RuntimeError("boom")
+
+        poller = Poller([FakeClient()], interval=0.05, jitter=0)
+        poller.subscribe(broken)
+        poller.subscribe(results.append)
+
+        async with poller:
+            await asyncio.sleep(0.12)
+
+        assert results
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe(self):
+        """Test unsubscribed callbacks receive nothing."""
+        results = []
+        poller = Poller([FakeClient()], interval=0.05, jitter=0)
+        unsubscribe = poller.subscribe(results.append)
+        unsubscribe()
+
+        async with poller:
+            await asyncio.sleep(0.12)
+
+        assert results == []
+        assert poller.polls > 0
+
+    @pytest.mark.asyncio
+    async def test_jitter_bounds(self):
+        """Test jitter moves polls by at most the configured fraction."""
+        client = FakeClient()
+        poller = Poller(
+            {"pdu": client}, interval=0.1, jitter=0.1, rng=random.Random(1)
+        )
+
+        async with poller:
+            await asyncio.sleep(0.55)
+
+        phase = poller.phase("pdu")
+        for polled in client.polled_at:
+            position = (polled + poller._clock_offset - phase) % 0.1
+            # Up to 0.01 of jitter plus scheduling slack
+            assert min(position, 0.1 - position) < 0.02
+
+    @pytest.mark.asyncio
+    async def test_add_and_remove_while_running(self):
+        """Test devices can join and leave a running poller."""
+        first, second = FakeClient("10.0.0.1"), FakeClient("10.0.0.2")
+        poller = Poller([first], interval=0.05, jitter=0)
+
+        async with poller:
+            poller.add(second)
+            poller.add(second)
+            await asyncio.sleep(0.12)
+            poller.remove("10.0.0.1:80")
+            polls = len(first.polled_at)
+            await asyncio.sleep(0.12)
+
+        assert len(first.polled_at) == polls
+        assert 3 <= len(second.polled_at) <= 6
+        assert not poller.running
+
+    def test_invalid_interval(self):
+        """Test the interval must be positive."""
+        with pytest.raises(ValueError):
+            Poller(interval=0)
@@ -0,0 +1,170 @@
+"""Tests for the sans-IO protocol module."""
+import math
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from netcommander.exceptions import CommandError, ParseError
+from netcommander.models import CompactStatus, DeviceStatus
+from netcommander.protocol import (
+    check_response,
+    decode_ack,
+    decode_ack_batch,
+    decode_device_info,
+    decode_device_status,
+    decode_mac_address,
+    decode_status,
+    decode_status_batch,
+    encode_get_info,
+    encode_get_status,
+    encode_set_outlet,
+    encode_toggle_outlet,
+    extract_response,
+)
+
+
+class TestEncoders:
+    """Test command encoding."""
+
+    def test_encode_queries(self):
+        """Test status and info requests."""
+        assert encode_get_status() == "$A5"
+        assert encode_get_info() == "$A8"
+
+    def test_encode_set_outlet(self):
+        """Test arguments are separated by spaces."""
+        assert encode_set_outlet(1, True) == "$A3 1 1"
+        assert encode_set_outlet(5, False) == "$A3 5 0"
+
+    def test_encode_toggle_outlet(self):
+        """Test the rly index is zero-based."""
+        assert encode_toggle_outlet(1) == "rly=0"
+        assert encode_toggle_outlet(5) == "rly=4"
+
+
+class TestDecoders:
+    """Test single response decoding."""
+
+    def test_check_response(self):
+        """Test $AF raises and anything else passes through."""
+        assert check_response("$A5", b"$A0,10101,2.50,25") == b"$A0,10101,2.50,25"
+        with pytest.raises(CommandError):
+            check_response("$A3 9 1", b"$AF")
+
+    def test_decode_ack(self):
+        """Test acknowledgements from bytes and text."""
+        assert decode_ack(b"$A0") is True
+        assert decode_ack("$A0\r\n") is True
+        assert decode_ack(b"$AF") is False
+        assert decode_ack(b"") is False
+
+    def test_extract_response(self):
+        """Test echo and prompts around the response are removed."""
+        assert extract_response(b"> $A5 $A0,10101,2.50,25\r\n") == (
+            b"$A0,10101,2.50,25"
+        )
+        assert extract_response(b"$AF\r\n") == b"$AF"
+        assert extract_response(b"Welcome\r\n") is None
+
+    def test_decode_status(self):
+        """Test status decoding into both status types."""
+        compact = decode_status(b"$A0,10101,2.50,25\r\n")
+        assert isinstance(compact, CompactStatus)
+        assert compact.outlets_on == [1, 3, 5]
+
+        status = decode_device_status(b"$A0,10101,2.50,25")
+        assert isinstance(status, DeviceStatus)
+        assert status.total_current_amps == 2.50
+        assert status.raw_response == "$A0,10101,2.50,25"
+
+        with pytest.raises(ParseError):
+            decode_status(b"$AF")
+
+    def test_decode_device_info(self):
+        """Test device info decoding."""
+        info = decode_device_info(b"$A0,NP0501DU, HW4.3 BL1.6 -7.72-8.5")
+
+        assert info.model == "NP0501DU"
+        assert info.hardware_version == "4.3"
+        assert info.bootloader_version == "1.6"
+        assert info.firmware_version == "-7.72-8.5"
+        assert info.mac_address is None
+
+    def test_decode_device_info_model_only(self):
+        """Test a response without version details."""
+        info = decode_device_info("$A0,NP0801D")
+
+        assert info.model == "NP0801D"
+        assert info.hardware_version is None
+
+    def test_decode_mac_address(self):
+        """Test the MAC address is found on the root page."""
+        page = "<html><p>MAC Address: 0c-73-eb-b0-9e-5c</p></html>"
+        assert decode_mac_address(page) == "0c-73-eb-b0-9e-5c"
+        assert decode_mac_address("<html>netBooter</html>") is None
+
+    def test_decode_device_info_failure(self):
+        """Test non-success responses raise ParseError."""
+        with pytest.raises(ParseError):
+            decode_device_info(b"$AF")
+
+
+class TestBatchDecoders:
+    """Test decoding many responses at once."""
+
+    def test_decode_status_batch(self):
+        """Test responses are decoded into columns."""
+        batch = decode_status_batch([
+            b"$A0,10101,2.50,25",
+            "$A0,00001,0.15,XX",
+            b"$A0,11111111,4.00,30",
+        ])
+
+        assert len(batch) == 3
+        assert list(batch.bitmasks) == [0b10101, 0b00001, 0b11111111]
+        assert list(batch.num_outlets) == [5, 5, 8]
+        assert list(batch.currents) == [2.50, 0.15, 4.00]
+        assert batch.temperatures == ["25", "XX", "30"]
+        assert batch.errors == {}
+        assert batch.total_current() == pytest.approx(6.65)
+        assert batch.outlet_states(2) == [False, False, True]
+        assert batch.outlet_states(8) == [None, None, True]
+
+    def test_decode_status_batch_errors(self):
+        """Test failures are collected without stopping the batch."""
+        batch = decode_status_batch([b"$AF", b"$A0,10101,2.50,25"])
+
+        assert len(batch) == 2
+        assert isinstance(batch.errors[0], ParseError)
+        assert batch.status(0) is None
+        assert math.isnan(batch.currents[0])
+        assert batch.outlet_states(1) == [None, True]
+        assert batch.total_current() == 2.50
+        assert batch.status(1) == decode_status(b"$A0,10101,2.50,25")
+
+    def test_decode_status_batch_non_ascii(self):
+        """Test garbage and non-ASCII responses don't lose the batch."""
+        batch = decode_status_batch([
+            b"$A0,10101,2.50,25",
+            b"\xff\x00garbage",
+            b"$A0,10101,2.50,\xb0C",
+            "$A0,1€,2.50,25",
+            b"$A0,00001,0.15,XX",
+        ])
+
+        assert len(batch) == 5
+        assert sorted(batch.errors) == [1, 3]
+        assert batch.temperatures[2] == "°C"
+        assert batch.total_current() == pytest.approx(5.15)
+
+    def test_decode_status_batch_too_many_outlets(self):
+        """Test devices wider than the bitmask column are rejected."""
+        batch = decode_status_batch([b"$A0," + b"1" * 65 + b",1.00,XX"])
+
+        assert 0 in batch.errors
+
+    def test_decode_ack_batch(self):
+        """Test acknowledgements over many responses."""
+        assert decode_ack_batch([b"$A0", b"$AF", "$A0"]) == [True, False, True]
@@ -0,0 +1,264 @@
+"""Tests for the on-disk time-series recorder."""
+import asyncio
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from click.testing import CliRunner
+
+from netcommander import FleetClient, Poller, PollResult
+from netcommander.models import CompactStatus
+from netcommander.recorder import (
+    FLAG_BLOCK,
+    FLAG_ERROR,
+    FLAG_HEARTBEAT,
+    FLAG_START,
+    HEADER,
+    RECORD,
+    RECORD_DTYPE,
+    TEMPERATURE_NONE,
+    Recorder,
+    SeriesReader,
+    SeriesWriter,
+    encode_temperature,
+    series_path,
+)
+
+from netcommander_cli.cli import cli
+
+
+def status(bitmask=0b101, current=1.5, temperature="25"):
+    """Create a status of a five-outlet device."""
+    return CompactStatus(bitmask, 5, current, temperature)
+
+
+@pytest.fixture
+def path(tmp_path):
+    """Path of a series file."""
+    return str(tmp_path / "pdu.ncts")
+
+
+class TestSeriesWriter:
+    """Test what gets recorded."""
+
+    def test_changes_and_heartbeat(self, path):
+        """Test unchanged polls are skipped until the heartbeat."""
+        with SeriesWriter(path, "pdu", heartbeat=60) as writer:
+            assert writer.append(0, status())
+            assert not writer.append(1, status())
+            assert not writer.append(2, status(current=1.52))  # Within deadband
+            assert writer.append(3, status(current=1.6))
+            assert writer.append(4, status(bitmask=0b111, current=1.6))
+            assert writer.append(5, status(bitmask=0b111, current=1.6, temperature="26"))
+            assert not writer.append(64, status(bitmask=0b111, current=1.6, temperature="26"))
+            assert writer.append(65, status(bitmask=0b111, current=1.6, temperature="26"))
+
+        with SeriesReader(path) as series:
+            samples = list(series.samples())
+        assert [s.timestamp for s in samples] == [0, 3, 4, 5, 65]
+        assert samples[0].flags == FLAG_BLOCK | FLAG_START
+        assert samples[-1].flags == FLAG_HEARTBEAT
+        assert samples[1].current == 1.6
+        assert samples[2].get_outlet_state(2)
+        assert samples[3].temperature == 26.0
+
+    def test_failed_polls(self, path):
+        """Test failures are recorded once with the last known values."""
+        with SeriesWriter(path, "pdu", heartbeat=60) as writer:
+            assert not writer.append(0, None)  # Nothing known yet
+            assert writer.append(1, status())
+            assert writer.append(2, None)
+            assert not writer.append(3, None)
+            assert writer.append(62, None)
+            assert writer.append(63, status())
+
+        with SeriesReader(path) as series:
+            samples = list(series.samples())
+        assert [s.error for s in samples] == [False, True, True, False]
+        assert samples[1].current == 1.5
+        assert samples[2].flags == FLAG_ERROR | FLAG_HEARTBEAT
+
+    def test_clock_stepping_back(self, path):
+        """Test timestamps never decrease."""
+        with SeriesWriter(path, "pdu") as writer:
+            writer.append(100, status())
+            writer.append(90, status(bitmask=0))
+        with SeriesReader(path) as series:
+            assert [s.timestamp for s in series.samples()] == [100, 100]
+
+    def test_reopen_appends(self, path):
+        """Test a reopened file continues, without a partial record."""
+        with SeriesWriter(path, "pdu", block_records=2) as writer:
+            writer.append(0, status(bitmask=0))
+            writer.append(1, status(bitmask=1))
+            writer.append(2, status(bitmask=2))
+        with open(path, "ab") as f:
+            f.write(b"\0" * 5)  # Torn write
+
+        with SeriesWriter(path, "pdu", block_records=100) as writer:
+            assert writer.block_records == 2
+            assert writer.records == 3
+            assert writer.append(3, status(bitmask=2))  # Restart is recorded
+            writer.append(4, status(bitmask=3))
+
+        assert os.path.getsize(path) == HEADER.size + 5 * RECORD.size
+        with SeriesReader(path) as series:
+            flags = [s.flags for s in series.samples()]
+        assert flags[3] == FLAG_START
+        assert flags[4] == FLAG_BLOCK
+        assert [bool(f & FLAG_BLOCK) for f in flags] == [True, False, True, False, True]
+
+    def test_flush_on_unchanged_poll(self, path):
+        """Test buffered records are written once the interval passed."""
+        with SeriesWriter(path, "pdu", heartbeat=60, flush_interval=10) as writer:
+            writer.append(0, status())
+            assert os.path.getsize(path) < HEADER.size + RECORD.size
+            assert not writer.append(10, status())  # Nothing new to record
+            assert os.path.getsize(path) == HEADER.size + RECORD.size
+
+    def test_encode_temperature(self):
+        """Test temperatures are stored in tenths; XX is no sensor."""
+        assert encode_temperature("25") == 250
+        assert encode_temperature("-3.5") == -35
+        assert encode_temperature("XX") == TEMPERATURE_NONE
+        assert encode_temperature(None) == TEMPERATURE_NONE
+
+    def test_not_a_series_file(self, path):
+        """Test other files are refused."""
+        with open(path, "wb") as f:
+            f.write(b"x" * 100)
+        with pytest.raises(ValueError):
+            SeriesWriter(path, "pdu")
+        with pytest.raises(ValueError):
+            SeriesReader(path)
+
+
+class TestSeriesReader:
+    """Test reading and seeking."""
+
+    @pytest.fixture
+    def series(self, path):
+        """A series of 1000 one-second records in blocks of 64."""
+        with SeriesWriter(path, "10.0.0.1:80", heartbeat=0, block_records=64) as writer:
+            for second in range(1000):
+                writer.append(1000.0 + second, status(current=second / 100))
+        with SeriesReader(path) as series:
+            yield series
+
+    def test_header(self, series):
+        """Test the header is read."""
+        assert series.device == "10.0.0.1:80"
+        assert series.block_records == 64
+        assert len(series) == 1000
+        assert series[-1].timestamp == 1999.0
+
+    def test_index(self, series):
+        """Test the index holds every block's start time."""
+        index = series.index()
+        assert len(index) == 16
+        assert index[1] == 1064.0
+
+    def test_find(self, series):
+        """Test seeking by time."""
+        assert series.find(0) == 0
+        assert series.find(1100.0) == 100
+        assert series.find(1100.5) == 101
+        assert series.find(5000) == 1000
+
+    def test_range(self, series):
+        """Test samples and columns between two times."""
+        samples = list(series.samples(start=1100, end=1110))
+        assert [s.timestamp for s in samples] == [1100.0 + i for i in range(10)]
+
+        columns = series.columns(start=1990)
+        assert list(columns) == [name for name, _ in RECORD_DTYPE]
+        assert list(columns["timestamp"]) == [1990.0 + i for i in range(10)]
+        assert columns["temperature"][0] == 250
+        assert series.columns(start=3000)["timestamp"].tolist() == []
+
+    def test_memory_map_with_numpy(self, series, path):
+        """Test the file maps onto a numpy structured array."""
+        numpy = pytest.importorskip("numpy")
+        records = numpy.memmap(
+            path, dtype=numpy.dtype(RECORD_DTYPE), mode="r", offset=HEADER.size
+        )
+        assert len(records) == 1000
+        assert records["timestamp"][100] == 1100.0
+        assert records["current"][500] == pytest.approx(5.0)
+
+    def test_find_ties_across_blocks(self, path):
+        """Test a timestamp repeated across a block boundary finds the first."""
+        with SeriesWriter(path, "pdu", heartbeat=0, block_records=4) as writer:
+            for bitmask, timestamp in enumerate([1, 2, 3, 5, 5, 6, 7, 8]):
+                writer.append(timestamp, status(bitmask=bitmask))
+        with SeriesReader(path) as series:
+            assert series.find(5) == 3
+            assert [s.bitmask for s in series.samples(start=5, end=6)] == [3, 4]
+
+    def test_empty(self, path):
+        """Test a file without records."""
+        SeriesWriter(path, "pdu").close()
+        with SeriesReader(path) as series:
+            assert len(series) == 0
+            assert list(series.samples()) == []
+            assert series.find(10) == 0
+
+
+class TestRecorder:
+    """Test recording poll results."""
+
+    def test_series_path(self):
+        """Test device names map to file names."""
+        assert series_path("d", "10.0.0.1:80") == os.path.join("d", "10.0.0.1_80.ncts")
+
+    @pytest.mark.asyncio
+    async def test_records_polls(self, simulator, tmp_path):
+        """Test a poller's results land in one file per device."""
+        devices = await simulator.add_devices(2)
+        devices[0].outlets = 0b11
+        names = [f"127.0.0.1:{device.port}" for device in devices]
+
+        with Recorder(str(tmp_path), heartbeat=0) as recorder:
+            async with FleetClient(names, "admin", "admin", retries=0) as fleet:
+                async with Poller.from_fleet(fleet, interval=0.05, jitter=0) as poller:
+                    poller.subscribe(recorder)
+                    await asyncio.sleep(0.3)
+        assert recorder.written >= 4
+
+        for name, device in zip(names, devices, strict=True):
+            with SeriesReader(series_path(str(tmp_path), name)) as series:
+                assert series.device == name
+                assert len(series) >= 2
+                assert series[0].bitmask == device.outlets
+
+
+    def test_periodic_flush(self, tmp_path):
+        """Test every device's file is flushed, also without new polls."""
+        with Recorder(str(tmp_path), heartbeat=60, flush_interval=3600) as recorder:
+            recorder(PollResult("a", status(), None, 0, 0))
+            recorder(PollResult("b", status(), None, 0, 0))
+            size = os.path.getsize(series_path(str(tmp_path), "a"))
+            assert size < HEADER.size + RECORD.size
+
+            recorder.flush_interval = 0
+            recorder(PollResult("b", status(), None, 1, 0))
+            for name in ("a", "b"):
+                size = os.path.getsize(series_path(str(tmp_path), name))
+                assert size == HEADER.size + RECORD.size
+
+
+class TestRecordCommand:
+    """Test the record CLI command."""
+
+    def test_requires_devices(self):
+        """Test record without any device fails."""
+        result = CliRunner().invoke(
+            cli,
+            ["record"],
+            obj={},
+            env={"NETCOMMANDER_HOST": None, "NETCOMMANDER_TRANSPORT": None},
+        )
+        assert result.exit_code == 1
+        assert "No devices" in result.output
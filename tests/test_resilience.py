@@ -0,0 +1,290 @@
+"""Tests for retries and the per-device circuit breaker."""
+import asyncio
+import pytest
+from unittest.mock import MagicMock, patch
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from netcommander import NetCommanderClient
+from netcommander.exceptions import (
+    CircuitOpenError,
+    CommandError,
+    NetCommanderConnectionError,
+)
+from netcommander.resilience import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+    backoff_delay,
+    get_circuit_breaker,
+    is_idempotent,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _flaky_session(mock_session, mock_response, failures):
+    """Make the first `failures` requests time out, then answer normally."""
+    calls = []
+
+    def get(url, **kwargs):
+        calls.append(url.split("?", 1)[1])
+        if len(calls) <= failures:
+            raise asyncio.TimeoutError()
+        return mock_response
+
+    mock_session.get = MagicMock(side_effect=get)
+    return calls
+
+
+class TestIdempotency:
+    """Test command classification."""
+
+    def test_idempotent_commands(self):
+        """Test only commands that are safe to resend are retried."""
+        assert is_idempotent("$A5")
+        assert is_idempotent("$A8")
+        assert is_idempotent("$A3 1 1")
+        assert not is_idempotent("rly=0")
+
+    def test_backoff_bounds(self):
+        """Test backoff ceiling doubles per attempt up to the maximum."""
+        for _ in range(50):
+            assert 0 <= backoff_delay(0, 0.25, 2.0) <= 0.25
+            assert 0 <= backoff_delay(2, 0.25, 2.0) <= 1.0
+            assert 0 <= backoff_delay(10, 0.25, 2.0) <= 2.0
+
+
+class TestCircuitBreaker:
+    """Test CircuitBreaker class."""
+
+    def test_opens_after_threshold(self):
+        """Test consecutive failures open the circuit."""
+        breaker = CircuitBreaker("pdu", failure_threshold=3, clock=FakeClock())
+
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.before_request()
+        assert breaker.state == STATE_CLOSED
+
+        breaker.record_failure()
+        assert breaker.state == STATE_OPEN
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_request()
+        assert exc_info.value.retry_after == 30.0
+
+    def test_success_resets_count(self):
+        """Test a success in between keeps the circuit closed."""
+        breaker = CircuitBreaker("pdu", failure_threshold=2, clock=FakeClock())
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == STATE_CLOSED
+        assert breaker.failures == 1
+
+    def test_single_probe_after_reset_timeout(self):
+        """Test one probe is let through once the reset timeout passes."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(
+            "pdu", failure_threshold=1, reset_timeout=10, clock=clock
+        )
+        breaker.record_failure()
+
+        clock.now += 10
+        assert breaker.state == STATE_HALF_OPEN
+        breaker.before_request()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+        breaker.record_success()
+        assert breaker.state == STATE_CLOSED
+        breaker.before_request()
+
+    def test_failed_probe_reopens(self):
+        """Test a failed probe keeps the circuit open for another period."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(
+            "pdu", failure_threshold=1, reset_timeout=10, clock=clock
+        )
+        breaker.record_failure()
+        clock.now += 10
+        breaker.before_request()
+
+        clock.now += 1
+        breaker.record_failure()
+
+        assert breaker.state == STATE_OPEN
+        clock.now += 9
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+    def test_disabled(self):
+        """Test failure_threshold=0 never opens the circuit."""
+        breaker = CircuitBreaker("pdu", failure_threshold=0, clock=FakeClock())
+
+        for _ in range(10):
+            breaker.record_failure()
+
+        breaker.before_request()
+        assert breaker.state == STATE_CLOSED
+
+    def test_shared_per_device(self):
+        """Test clients of one device share a breaker."""
+        first = get_circuit_breaker("192.168.1.100", 80)
+        assert get_circuit_breaker("192.168.1.100", 80) is first
+        assert get_circuit_breaker("192.168.1.101", 80) is not first
+
+
+class TestClientRetries:
+    """Test retries in NetCommanderClient."""
+
+    @pytest.mark.asyncio
+    async def test_status_retried(self, mock_session, mock_response):
+        """Test a dropped status request is retried."""
+        calls = _flaky_session(mock_session, mock_response, failures=2)
+
+        with patch("aiohttp.ClientSession", return_value=mock_session):
+            async with NetCommanderClient(
+                "192.168.1.160", "admin", "admin", retry_backoff=0.001
+            ) as client:
+                status = await client.get_status()
+
+        assert status.outlets[1] is True
+        assert calls == ["$A5", "$A5", "$A5"]
+        assert client.circuit_breaker.state == STATE_CLOSED
+
+    @pytest.mark.asyncio
+    async def test_retries_exhausted(self, mock_session, mock_response):
+        """Test the connection error surfaces after the last retry."""
+        calls = _flaky_session(mock_session, mock_response, failures=10)
+
+        with patch("aiohttp.ClientSession", return_value=mock_session):
+            async with NetCommanderClient(
+                "192.168.1.161",
+                "admin",
+                "admin",
+                retries=1,
+                retry_backoff=0.001,
+                failure_threshold=0,
+            ) as client:
+                with pytest.raises(NetCommanderConnectionError):
+                    await client.get_status()
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_toggle_not_retried(self, mock_session, mock_response):
+        """Test rly toggles are sent at most once."""
+        calls = _flaky_session(mock_session, mock_response, failures=1)
+
+        with patch("aiohttp.ClientSession", return_value=mock_session):
+            async with NetCommanderClient(
+                "192.168.1.162", "admin", "admin", retry_backoff=0.001
+            ) as client:
+                with pytest.raises(NetCommanderConnectionError):
+                    await client.toggle_outlet(1)
+
+        assert calls == ["rly=0"]
+
+    @pytest.mark.asyncio
+    async def test_command_error_not_retried(self, mock_session, mock_response):
+        """Test a $AF answer is not retried and counts as reachable."""
+        calls = _flaky_session(mock_session, mock_response, failures=0)
+        mock_response.text.return_value = "$AF"
+
+        with patch("aiohttp.ClientSession", return_value=mock_session):
+            async with NetCommanderClient(
+                "192.168.1.163", "admin", "admin", failure_threshold=1
+            ) as client:
+                with pytest.raises(CommandError):
+                    await client._send_command("$A3 1 1")
+                assert client.circuit_breaker.state == STATE_CLOSED
+
+        assert len(calls) == 1
+
+
+class TestClientCircuitBreaker:
+    """Test the circuit breaker in NetCommanderClient."""
+
+    @pytest.mark.asyncio
+    async def test_dead_device_fails_fast(self, mock_session, mock_response):
+        """Test requests stop reaching a device once its circuit opens."""
+        calls = _flaky_session(mock_session, mock_response, failures=100)
+
+        with patch("aiohttp.ClientSession", return_value=mock_session):
+            async with NetCommanderClient(
+                "192.168.1.164",
+                "admin",
+                "admin",
+                retries=0,
+                failure_threshold=3,
+            ) as client:
+                for _ in range(3):
+                    with pytest.raises(NetCommanderConnectionError):
+                        await client.get_status()
+                assert len(calls) == 3
+                assert client.circuit_breaker.state == STATE_OPEN
+
+                with pytest.raises(CircuitOpenError):
+                    await client.get_status()
+                assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_retries_count_as_one_failure(self, mock_session, mock_response):
+        """Test one failed call does not open the circuit with the defaults."""
+        calls = _flaky_session(mock_session, mock_response, failures=100)
+
+        with patch("aiohttp.ClientSession", return_value=mock_session):
+            async with NetCommanderClient(
+                "192.168.1.166", "admin", "admin", retry_backoff=0.001
+            ) as client:
+                with pytest.raises(NetCommanderConnectionError):
+                    await client.get_status()
+                assert len(calls) == 3
+                assert client.circuit_breaker.failures == 1
+                assert client.circuit_breaker.state == STATE_CLOSED
+
+    @pytest.mark.asyncio
+    async def test_probe_closes_circuit(self, mock_session, mock_response):
+        """Test the device is probed again after the reset timeout."""
+        calls = _flaky_session(mock_session, mock_response, failures=1)
+
+        with patch("aiohttp.ClientSession", return_value=mock_session):
+            async with NetCommanderClient(
+                "192.168.1.165",
+                "admin",
+                "admin",
+                retries=0,
+                failure_threshold=1,
+                reset_timeout=0.01,
+            ) as client:
+                with pytest.raises(NetCommanderConnectionError):
+                    await client.get_status()
+                with pytest.raises(CircuitOpenError):
+                    await client.get_status()
+
+                await asyncio.sleep(0.02)
+                status = await client.get_status()
+
+                assert status.outlets[1] is True
+                assert client.circuit_breaker.state == STATE_CLOSED
+
+        assert len(calls) == 2
+
+    def test_negative_retries_rejected(self):
+        """Test a negative retry count is refused."""
+        with pytest.raises(ValueError):
+            NetCommanderClient("192.168.1.164", "admin", "admin", retries=-1)
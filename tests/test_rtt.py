@@ -0,0 +1,123 @@
+"""Tests for adaptive RTT-based timeouts."""
+import pytest
+from unittest.mock import patch
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from netcommander import NetCommanderClient
+from netcommander.const import DEFAULT_INITIAL_TIMEOUT
+from netcommander.rtt import AdaptiveTimeouts, RttEstimator, get_adaptive_timeouts
+
+
+class TestRttEstimator:
+    """Test RttEstimator class."""
+
+    def test_no_samples(self):
+        """Test an estimator without samples has no estimate."""
+        assert RttEstimator().rto is None
+
+    def test_first_sample(self):
+        """Test the first sample seeds SRTT and RTTVAR (RFC 6298)."""
+        rtt = RttEstimator()
+        rtt.observe(0.2)
+
+        assert rtt.srtt == 0.2
+        assert rtt.rttvar == 0.1
+        assert rtt.rto == pytest.approx(0.6)
+
+    def test_smoothing(self):
+        """Test later samples move the estimate by the RFC gains."""
+        rtt = RttEstimator()
+        rtt.observe(0.2)
+        rtt.observe(0.4)
+
+        assert rtt.rttvar == pytest.approx(0.75 * 0.1 + 0.25 * 0.2)
+        assert rtt.srtt == pytest.approx(0.875 * 0.2 + 0.125 * 0.4)
+
+    def test_stable_link_converges(self):
+        """Test a steady RTT shrinks the variance term."""
+        rtt = RttEstimator()
+        for _ in range(50):
+            rtt.observe(0.03)
+
+        assert rtt.rto == pytest.approx(0.03, abs=0.001)
+
+    def test_backoff_until_next_sample(self):
+        """Test timeouts double the estimate until a sample arrives."""
+        rtt = RttEstimator()
+        rtt.observe(0.2)
+
+        rtt.backoff()
+        rtt.backoff()
+        assert rtt.rto == pytest.approx(2.4)
+
+        rtt.observe(0.2)
+        assert rtt.rto < 0.6
+
+
+class TestAdaptiveTimeouts:
+    """Test AdaptiveTimeouts class."""
+
+    def test_initial_timeout(self):
+        """Test the initial timeout is used before any samples."""
+        timeouts = AdaptiveTimeouts(min_timeout=0.5, max_timeout=10)
+
+        assert timeouts.connect_timeout() == DEFAULT_INITIAL_TIMEOUT
+        assert timeouts.read_timeout() == DEFAULT_INITIAL_TIMEOUT
+
+    def test_clamped(self):
+        """Test estimates are clamped to the floor and ceiling."""
+        timeouts = AdaptiveTimeouts(min_timeout=0.5, max_timeout=2)
+
+        timeouts.read.observe(0.01)
+        assert timeouts.read_timeout() == 0.5
+
+        timeouts.read.observe(5.0)
+        assert timeouts.read_timeout() == 2
+
+    def test_connect_falls_back_to_read(self):
+        """Test the connect timeout uses the read estimate until timed."""
+        timeouts = AdaptiveTimeouts(min_timeout=0.1, max_timeout=10)
+        timeouts.read.observe(0.5)
+
+        assert timeouts.connect_timeout() == timeouts.read_timeout()
+
+        timeouts.connect.observe(0.05)
+        assert timeouts.connect_timeout() == pytest.approx(0.15)
+
+    def test_estimates_shared_per_device(self):
+        """Test clients of a device share estimates but not limits."""
+        first = get_adaptive_timeouts("192.168.1.100", 80, 0.5, 10)
+        second = get_adaptive_timeouts("192.168.1.100", 80, 1.0, 5)
+        other = get_adaptive_timeouts("192.168.1.101", 80)
+
+        assert second.read is first.read
+        assert second.connect is first.connect
+        assert other.read is not first.read
+        assert second.min_timeout == 1.0
+
+
+class TestClientTimeouts:
+    """Test adaptive timeouts in NetCommanderClient."""
+
+    @pytest.mark.asyncio
+    async def test_request_timeout_learned(
+        self, connection_params, mock_session
+    ):
+        """Test aiohttp requests use and update the device's estimate."""
+        with patch("aiohttp.ClientSession", return_value=mock_session):
+            async with NetCommanderClient(
+                **connection_params, min_timeout=0.25, timeout=5
+            ) as client:
+                await client.get_status(force=True)
+                timeout = mock_session.get.call_args.kwargs["timeout"]
+                assert timeout.sock_read == DEFAULT_INITIAL_TIMEOUT
+                assert timeout.total == 5
+
+                await client.get_status(force=True)
+                timeout = mock_session.get.call_args.kwargs["timeout"]
+                assert timeout.sock_read == 0.25
+                assert timeout.sock_connect == 0.25
+                assert client.timeouts.read.samples == 2
@@ -0,0 +1,238 @@
+"""Tests for the per-device command scheduler."""
+import asyncio
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from netcommander.scheduler import (
+    CommandScheduler,
+    PRIORITY_COMMAND,
+    PRIORITY_POLL,
+    command_priority,
+    get_scheduler,
+)
+
+
+class TestCommandPriority:
+    """Test command priority classification."""
+
+    def test_user_commands_first(self):
+        """Test outlet commands outrank polls."""
+        assert command_priority("$A3 1 1") == PRIORITY_COMMAND
+        assert command_priority("rly=0") == PRIORITY_COMMAND
+        assert command_priority("$A5") == PRIORITY_POLL
+        assert command_priority("$A8") == PRIORITY_POLL
+        assert PRIORITY_COMMAND < PRIORITY_POLL
+
+
+class TestCommandScheduler:
+    """Test CommandScheduler class."""
+
+    @pytest.mark.asyncio
+    async def test_requests_serialized(self):
+        """Test only one request runs at a time."""
+        scheduler = CommandScheduler()
+        running = 0
+        peak = 0
+
+        async def request():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return "$A0"
+
+        results = await asyncio.gather(
+            *(scheduler.submit(f"$A3 {n} 1", request) for n in range(1, 6))
+        )
+
+        assert results == ["$A0"] * 5
+        assert peak == 1
+        assert scheduler.stats().completed == 5
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency(self):
+        """Test requests overlap up to max_concurrency."""
+        scheduler = CommandScheduler(max_concurrency=2)
+        running = 0
+        peak = 0
+
+        async def request():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        await asyncio.gather(
+            *(scheduler.submit(f"$A3 {n} 1", request) for n in range(1, 6))
+        )
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_commands_before_polls(self):
+        """Test queued user commands run ahead of queued polls."""
+        scheduler = CommandScheduler()
+        order = []
+        release = asyncio.Event()
+
+        async def blocker():
+            await release.wait()
+
+        def recorder(name):
+            async def request():
+                order.append(name)
+
+            return request
+
+        busy = asyncio.create_task(scheduler.submit("$A5", blocker))
+        await asyncio.sleep(0)
+
+        queued = [
+            asyncio.create_task(scheduler.submit("$A8", recorder("$A8"))),
+            asyncio.create_task(scheduler.submit("$A3 1 1", recorder("$A3"))),
+            asyncio.create_task(scheduler.submit("rly=1", recorder("rly"))),
+        ]
+        await asyncio.sleep(0)
+        assert scheduler.queue_depth == 3
+
+        release.set()
+        await asyncio.gather(busy, *queued)
+
+        assert order == ["$A3", "rly", "$A8"]
+
+    @pytest.mark.asyncio
+    async def test_queued_poll_superseded(self):
+        """Test a newer poll shares the identical poll already queued."""
+        scheduler = CommandScheduler()
+        release = asyncio.Event()
+        calls = 0
+
+        async def blocker():
+            await release.wait()
+
+        async def poll():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        busy = asyncio.create_task(scheduler.submit("$A3 1 1", blocker))
+        await asyncio.sleep(0)
+
+        polls = [asyncio.create_task(scheduler.submit("$A5", poll)) for _ in range(4)]
+        await asyncio.sleep(0)
+        assert scheduler.queue_depth == 1
+
+        release.set()
+        await busy
+        results = await asyncio.gather(*polls)
+
+        assert calls == 1
+        assert results == [1, 1, 1, 1]
+        assert scheduler.stats().superseded == 3
+
+    @pytest.mark.asyncio
+    async def test_polls_folded_per_key(self):
+        """Test polls with different fold keys each run."""
+        scheduler = CommandScheduler()
+        release = asyncio.Event()
+
+        async def blocker():
+            await release.wait()
+
+        def poll(user):
+            async def request():
+                return user
+
+            return request
+
+        busy = asyncio.create_task(scheduler.submit("$A3 1 1", blocker))
+        await asyncio.sleep(0)
+
+        polls = [
+            asyncio.create_task(scheduler.submit("$A5", poll(user), key=user))
+            for user in ("admin", "guest", "admin")
+        ]
+        await asyncio.sleep(0)
+        assert scheduler.queue_depth == 2
+
+        release.set()
+        await busy
+        assert await asyncio.gather(*polls) == ["admin", "guest", "admin"]
+        assert scheduler.stats().superseded == 1
+
+    @pytest.mark.asyncio
+    async def test_error_propagates(self):
+        """Test request errors reach every waiter."""
+        scheduler = CommandScheduler()
+
+        async def failing():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await scheduler.submit("$A5", failing)
+
+        assert scheduler.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_queued_request_dropped(self):
+        """Test a request cancelled while queued never runs."""
+        scheduler = CommandScheduler()
+        release = asyncio.Event()
+        ran = False
+
+        async def blocker():
+            await release.wait()
+
+        async def request():
+            nonlocal ran
+            ran = True
+
+        busy = asyncio.create_task(scheduler.submit("$A3 1 1", blocker))
+        await asyncio.sleep(0)
+        queued = asyncio.create_task(scheduler.submit("$A3 2 1", request))
+        await asyncio.sleep(0)
+
+        queued.cancel()
+        release.set()
+        await busy
+        await asyncio.sleep(0)
+
+        assert ran is False
+        assert scheduler.queue_depth == 0
+
+    @pytest.mark.asyncio
+    async def test_wait_stats(self):
+        """Test wait time statistics are recorded."""
+        scheduler = CommandScheduler()
+
+        async def request():
+            await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(scheduler.submit("$A3 1 1", request) for _ in range(3)))
+
+        stats = scheduler.stats()
+        assert stats.queue_depth == 0
+        assert stats.in_flight == 0
+        assert stats.max_wait >= 0.01
+        assert stats.mean_wait > 0
+
+    def test_get_scheduler_shared_per_device(self):
+        """Test clients of one device share a scheduler."""
+        first = get_scheduler("192.168.1.100", 80)
+        assert get_scheduler("192.168.1.100", 80) is first
+        assert get_scheduler("192.168.1.101", 80) is not first
+
+    def test_get_scheduler_strictest_limit(self):
+        """Test the lowest max_concurrency asked for a device applies."""
+        scheduler = get_scheduler("192.168.1.102", 80, max_concurrency=3)
+        assert get_scheduler("192.168.1.102", 80, max_concurrency=4) is scheduler
+        assert scheduler.max_concurrency == 3
+        get_scheduler("192.168.1.102", 80, max_concurrency=2)
+        assert scheduler.max_concurrency == 2
+        with pytest.raises(ValueError):
+            get_scheduler("192.168.1.102", 80, max_concurrency=0)
@@ -0,0 +1,195 @@
+"""Tests for the device simulator."""
+import asyncio
+import random
+import aiohttp
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from netcommander import FleetClient, NetCommanderClient
+from netcommander.exceptions import (
+    AuthenticationError,
+    CommandError,
+    NetCommanderConnectionError,
+)
+from netcommander.simulator import (
+    OVERLAP_ALLOW,
+    OVERLAP_QUEUE,
+    SimulatedDevice,
+    lognormal_latency,
+    uniform_latency,
+)
+
+
+def make_client(device, **options):
+    """Create a client for a simulated device without retries."""
+    options.setdefault("retries", 0)
+    return NetCommanderClient(
+        "127.0.0.1", "admin", "admin", port=device.port, **options
+    )
+
+
+class TestSimulatedDevice:
+    """Test the device command logic."""
+
+    def test_status(self):
+        """Test the status response format and bit order."""
+        device = SimulatedDevice(outlets=0b00001, temperature="25")
+        assert device.execute("$A5") == b"$A0,00001,0.26,25\r\n\r\n\r\n"
+
+    def test_set_outlet(self):
+        """Test $A3 sets one outlet and rejects invalid ones."""
+        device = SimulatedDevice(num_outlets=8)
+        assert device.execute("$A3 8 1") == b"$A0\r\n\r\n"
+        assert device.get_outlet_state(8)
+        assert device.execute("$A3 8 0") == b"$A0\r\n\r\n"
+        assert device.outlets == 0
+        assert device.execute("$A3 9 1") == b"$AF\r\n\r\n"
+        assert device.execute("$A3 1 2") == b"$AF\r\n\r\n"
+        assert device.execute("$A3,1,1") == b"$AF\r\n\r\n"
+
+    def test_toggle(self):
+        """Test rly toggles by zero-based index."""
+        device = SimulatedDevice()
+        device.execute("rly=4")
+        assert device.outlets == 0b10000
+        device.execute("rly=4")
+        assert device.outlets == 0
+        assert device.execute("rly=5") == b"$AF\r\n\r\n"
+
+    def test_info_and_page(self):
+        """Test $A8 and the root page."""
+        device = SimulatedDevice(model="NP0801D", mac_address="0C:73:EB:00:00:01")
+        assert device.execute("$A8").startswith(b"$A0,NP0801D, HW")
+        assert b"0C:73:EB:00:00:01" in device.page()
+        assert device.execute("$A9") == b"$AF\r\n\r\n"
+
+    def test_invalid_overlap(self):
+        """Test unknown overlap behaviours are rejected."""
+        with pytest.raises(ValueError):
+            SimulatedDevice(overlap="sometimes")
+
+    def test_latency_distributions(self):
+        """Test latency helpers stay in range."""
+        uniform = uniform_latency(0.01, 0.02, random.Random(1))
+        assert all(0.01 <= uniform() <= 0.02 for _ in range(100))
+        lognormal = lognormal_latency(0.02, 0.5, random.Random(1))
+        samples = sorted(lognormal() for _ in range(1001))
+        assert samples[500] == pytest.approx(0.02, rel=0.2)
+
+
+class TestDeviceSimulator:
+    """Test the client against simulated devices."""
+
+    @pytest.mark.asyncio
+    async def test_client_round_trip(self, simulator):
+        """Test status, outlet commands and device info."""
+        device = await simulator.add_device(mac_address="0C:73:EB:B0:9E:5C")
+        async with make_client(device) as client:
+            assert (await client.get_status()).outlets_on == []
+            assert await client.set_outlet(2, True)
+            assert await client.toggle_outlet(5)
+            assert (await client.get_status(force=True)).outlets_on == [2, 5]
+            info = await client.get_device_info()
+
+        assert device.outlets == 0b10010
+        assert info.model == "NP0501DU"
+        assert info.mac_address == "0C:73:EB:B0:9E:5C"
+        assert device.counts["ok"] == 6
+
+    @pytest.mark.asyncio
+    async def test_authentication(self, simulator):
+        """Test wrong credentials get 401."""
+        device = await simulator.add_device(password="secret")
+        async with make_client(device) as client:
+            with pytest.raises(AuthenticationError):
+                await client.get_status()
+        assert device.counts["unauthorized"] == 1
+
+    @pytest.mark.asyncio
+    async def test_error_injection(self, simulator):
+        """Test injected errors are answered with $AF."""
+        device = await simulator.add_device(error_rate=1.0)
+        async with make_client(device) as client:
+            with pytest.raises(CommandError):
+                await client.set_outlet(1, True)
+        assert device.counts["failed"] == 1
+        assert device.outlets == 0
+
+    @pytest.mark.asyncio
+    async def test_timeout_injection(self, simulator):
+        """Test injected hangs time out on the client."""
+        device = await simulator.add_device(timeout_rate=1.0)
+        async with make_client(device, timeout=0.2, min_timeout=0.2) as client:
+            with pytest.raises(NetCommanderConnectionError):
+                await client.get_status()
+        assert device.counts["hung"] == 1
+
+    @pytest.mark.asyncio
+    async def test_latency(self, simulator):
+        """Test responses are delayed by the configured latency."""
+        device = await simulator.add_device(latency=0.05)
+        async with make_client(device) as client:
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            await client.get_status()
+            assert loop.time() - started >= 0.05
+
+    async def _overlapping(self, device, count=3):
+        """Send overlapping raw requests, bypassing the client's scheduler."""
+        auth = aiohttp.BasicAuth("admin", "admin")
+        url = f"http://127.0.0.1:{device.port}/cmd.cgi?$A5"
+
+        async def get(session):
+            async with session.get(url, auth=auth) as resp:
+                return await resp.text()
+
+        async with aiohttp.ClientSession() as session:
+            return await asyncio.gather(
+                *(get(session) for _ in range(count)), return_exceptions=True
+            )
+
+    @pytest.mark.asyncio
+    async def test_overlap_drop(self, simulator):
+        """Test overlapping requests are dropped like the firmware does."""
+        device = await simulator.add_device(latency=0.05)
+        results = await self._overlapping(device)
+
+        assert sum(isinstance(r, aiohttp.ClientError) for r in results) == 2
+        assert device.counts["dropped"] == 2
+        assert device.counts["ok"] == 1
+
+    @pytest.mark.asyncio
+    async def test_overlap_queue_and_allow(self, simulator):
+        """Test the queueing and concurrent behaviours serve every request."""
+        for overlap in (OVERLAP_QUEUE, OVERLAP_ALLOW):
+            device = await simulator.add_device(latency=0.02, overlap=overlap)
+            results = await self._overlapping(device)
+            assert all(r.startswith("$A0") for r in results)
+            assert device.counts["ok"] == 3
+
+    @pytest.mark.asyncio
+    async def test_many_devices(self, simulator):
+        """Test one simulator serves a fleet on separate ports."""
+        devices = await simulator.add_devices(50, latency=0.01)
+        devices[7].outlets = 0b11111
+
+        async with FleetClient(
+            [f"127.0.0.1:{device.port}" for device in devices], "admin", "admin"
+        ) as fleet:
+            results = await fleet.status_all()
+
+        assert len({device.port for device in devices}) == 50
+        assert all(result.ok for result in results.values())
+        assert results[f"127.0.0.1:{devices[7].port}"].value.all_on
+
+    @pytest.mark.asyncio
+    async def test_remove_device(self, simulator):
+        """Test a removed device stops answering."""
+        device = await simulator.add_device()
+        await simulator.remove_device(device.port)
+        async with make_client(device) as client:
+            with pytest.raises(NetCommanderConnectionError):
+                await client.get_status()
@@ -0,0 +1,212 @@
+"""Tests for per-device command statistics."""
+import math
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from netcommander import DeviceStats, FleetClient, NetCommanderClient
+from netcommander.exceptions import (
+    CommandError,
+    NetCommanderConnectionError,
+    NetCommanderTimeoutError,
+)
+from netcommander.stats import (
+    OUTCOME_ERROR,
+    OUTCOME_FAILED,
+    OUTCOME_OK,
+    OUTCOME_TIMEOUT,
+    LatencyHistogram,
+    StatsRecorder,
+    bucket_index,
+    bucket_upper_bound,
+    classify,
+    command_kind,
+    get_stats_recorder,
+)
+
+
+def make_client(device, **options):
+    """Create a client for a simulated device without retries."""
+    options.setdefault("retries", 0)
+    return NetCommanderClient(
+        "127.0.0.1", "admin", "admin", port=device.port, **options
+    )
+
+
+class TestLatencyHistogram:
+    """Test the log-bucketed histogram."""
+
+    def test_buckets_cover_latencies(self):
+        """Test every latency falls in a bucket whose bounds contain it."""
+        for latency in (1e-5, 1e-4, 0.00123, 0.030, 0.5, 7.0, 99.0):
+            index = bucket_index(latency)
+            assert latency <= bucket_upper_bound(index)
+            if index:
+                assert latency > bucket_upper_bound(index - 1)
+
+    def test_overflow_bucket(self):
+        """Test very long latencies land in the unbounded last bucket."""
+        histogram = LatencyHistogram()
+        histogram.record(3600.0)
+        assert histogram.buckets() == [(math.inf, 1)]
+        assert histogram.percentile(0.99) == 3600.0
+
+    def test_percentile_accuracy(self):
+        """Test percentiles are within the bucket resolution."""
+        histogram = LatencyHistogram()
+        latencies = [0.001 * i for i in range(1, 1001)]
+        for latency in latencies:
+            histogram.record(latency)
+
+        for fraction in (0.5, 0.9, 0.99):
+            exact = latencies[math.ceil(fraction * len(latencies)) - 1]
+            estimate = histogram.percentile(fraction)
+            assert exact <= estimate <= exact * 2 ** 0.25
+        assert histogram.count == 1000
+        assert histogram.min == 0.001
+        assert histogram.max == 1.0
+        assert histogram.sum == pytest.approx(sum(latencies))
+
+    def test_empty(self):
+        """Test an empty histogram has no percentiles."""
+        assert LatencyHistogram().percentile(0.5) is None
+
+    def test_merge(self):
+        """Test merged histograms hold both sample sets."""
+        first, second = LatencyHistogram(), LatencyHistogram()
+        first.record(0.01)
+        second.record(0.02)
+        second.record(0.04)
+        first.merge(second)
+        assert first.count == 3
+        assert first.max == 0.04
+        assert sum(count for _, count in first.buckets()) == 3
+
+
+class TestStatsRecorder:
+    """Test counters per command and outcome."""
+
+    def test_command_kind(self):
+        """Test requests are grouped by command."""
+        assert command_kind("$A5") == "$A5"
+        assert command_kind("$A3 1 1") == "$A3"
+        assert command_kind("rly=3") == "rly"
+        assert command_kind("GET /") == "GET /"
+
+    def test_classify(self):
+        """Test errors map to outcomes."""
+        assert classify(None) == OUTCOME_OK
+        assert classify(CommandError("$A3 9 1")) == OUTCOME_FAILED
+        assert classify(NetCommanderTimeoutError("h")) == OUTCOME_TIMEOUT
+        assert classify(NetCommanderConnectionError("h")) == OUTCOME_ERROR
+
+    def test_outcomes(self):
+        """Test outcomes are counted and only answers are timed."""
+        recorder = StatsRecorder("10.0.0.1", 80)
+        recorder.record("$A3 1 1", OUTCOME_OK, 0.02)
+        recorder.record("$A3 2 0", OUTCOME_FAILED, 0.03)
+        recorder.record("$A3 1 0", OUTCOME_TIMEOUT, 3.0)
+        recorder.record("$A3 1 0", OUTCOME_ERROR, 0.001)
+
+        stats = recorder.snapshot().commands["$A3"]
+
+        assert (stats.requests, stats.ok, stats.failed) == (4, 1, 1)
+        assert (stats.timeouts, stats.errors) == (1, 1)
+        assert stats.answered == 2
+        assert stats.latency_max == 0.03
+        assert stats.latency_mean == pytest.approx(0.025)
+
+    def test_shared_per_device(self):
+        """Test clients of one device share their recorder."""
+        first = get_stats_recorder("10.0.0.1", 80)
+        assert get_stats_recorder("10.0.0.1", 80) is first
+        assert get_stats_recorder("10.0.0.1", 8080) is not first
+
+
+class TestClientStats:
+    """Test client instrumentation against simulated devices."""
+
+    @pytest.mark.asyncio
+    async def test_requests_are_counted(self, simulator):
+        """Test status, set and device info requests are recorded."""
+        device = await simulator.add_device()
+        async with make_client(device) as client:
+            await client.get_status()
+            await client.get_status(force=True)
+            await client.turn_on(1)
+            await client.get_device_info()
+            stats = client.stats()
+
+        assert isinstance(stats, DeviceStats)
+        assert stats.port == device.port
+        assert stats.commands["$A5"].ok == 2
+        assert stats.commands["$A3"].ok == 1
+        assert stats.commands["$A8"].ok == 1
+        assert stats.commands["GET /"].ok == 1
+        assert stats.requests == 5
+        assert stats.commands["$A5"].p99 > 0
+
+    @pytest.mark.asyncio
+    async def test_failures_and_timeouts(self, simulator):
+        """Test $AF answers and timeouts are counted apart."""
+        failing = await simulator.add_device(error_rate=1.0)
+        hanging = await simulator.add_device(timeout_rate=1.0)
+
+        async with make_client(failing, failure_threshold=0) as client:
+            with pytest.raises(CommandError):
+                await client.turn_on(1)
+            failed = client.stats().commands["$A3"]
+        async with make_client(
+            hanging, timeout=0.2, min_timeout=0.2, failure_threshold=0
+        ) as client:
+            with pytest.raises(NetCommanderTimeoutError):
+                await client.get_status()
+            timed_out = client.stats().commands["$A5"]
+
+        assert (failed.requests, failed.failed, failed.answered) == (1, 1, 1)
+        assert (timed_out.requests, timed_out.timeouts) == (1, 1)
+        assert timed_out.latency_max is None
+
+    @pytest.mark.asyncio
+    async def test_on_command_hook(self, simulator):
+        """Test the hook gets an event per request and may fail safely."""
+        device = await simulator.add_device()
+        events = []
+
+        def hook(event):
+            events.append(event)
+            raise RuntimeError("broken hook")
+
+        async with make_client(device, on_command=hook) as client:
+            assert await client.set_outlet(2, True)
+
+        event, = events
+        assert event.command == "$A3 2 1"
+        assert event.kind == "$A3"
+        assert event.outcome == OUTCOME_OK
+        assert event.port == device.port
+        assert event.latency > 0
+        assert event.error is None
+
+    @pytest.mark.asyncio
+    async def test_disabled(self, simulator):
+        """Test collect_stats=False records nothing."""
+        device = await simulator.add_device()
+        async with make_client(device, collect_stats=False) as client:
+            await client.get_status()
+            assert client.stats().commands == {}
+        assert get_stats_recorder("127.0.0.1", device.port).commands == {}
+
+    @pytest.mark.asyncio
+    async def test_fleet_stats(self, simulator):
+        """Test the fleet reports statistics per device used."""
+        devices = await simulator.add_devices(3)
+        names = [f"127.0.0.1:{device.port}" for device in devices]
+        async with FleetClient(names, "admin", "admin", retries=0) as fleet:
+            await fleet.status_all(devices=names[:2])
+            stats = fleet.stats()
+
+        assert list(stats) == names[:2]
+        assert all(s.commands["$A5"].ok == 1 for s in stats.values())
@@ -0,0 +1,625 @@
+"""Tests for alternative device transports."""
+import aiohttp
+import asyncio
+import base64
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from netcommander import NetCommanderClient
+from netcommander.exceptions import (
+    AuthenticationError,
+    CommandError,
+    NetCommanderConnectionError,
+)
+from netcommander.rtt import AdaptiveTimeouts
+from netcommander.transports import (
+    AiohttpTransport,
+    RecordingTransport,
+    ReplayTransport,
+    SerialTransport,
+    StreamHttpTransport,
+    TelnetTransport,
+    create_transport,
+)
+from netcommander.transports.telnet import (
+    strip_telnet_options,
+    translate_command,
+)
+
+
+class FakeHttpDevice:
+    """Minimal stand-in for the device's HTTP server."""
+
+    def __init__(self, username="admin", password="admin", outlets="10101"):
+        self.outlets = outlets
+        self.requests = []
+        self.hosts = []
+        self.delay = 0.0
+        self._auth = "Basic " + base64.b64encode(
+            f"{username}:{password}".encode()
+        ).decode()
+        self._server = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        head = await reader.readuntil(b"\r\n\r\n")
+        lines = head.decode().split("\r\n")
+        target = lines[0].split(" ")[1]
+        headers = dict(line.split(": ", 1) for line in lines[1:] if line)
+        self.requests.append(target)
+        self.hosts.append(headers.get("Host"))
+        await asyncio.sleep(self.delay)
+
+        if headers.get("Authorization") != self._auth:
+            writer.write(b"HTTP/1.0 401 Unauthorized\r\n\r\n")
+        else:
+            body = self._respond(target)
+            writer.write(
+                b"HTTP/1.0 200 OK\r\nContent-Type: text/html\r\n"
+                + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                + body
+            )
+        await writer.drain()
+        writer.close()
+
+    def _respond(self, target):
+        if target == "/":
+            return b"<html>MAC: 0C:73:EB:B0:9E:5C</html>"
+        command = target.split("?", 1)[1].replace("%20", " ").replace("+", " ")
+        if command == "$A5":
+            return f"$A0,{self.outlets},2.50,25\r\n\r\n\r\n".encode()
+        if command.startswith("$A3 "):
+            _, outlet, value = command.split(" ")
+            chars = list(self.outlets)
+            chars[len(chars) - int(outlet)] = value
+            self.outlets = "".join(chars)
+            return b"$A0\r\n\r\n"
+        if command == "$A8":
+            return b"$A0,NP0501DU, HW4.3 BL1.6 -7.72-8.5\r\n"
+        return b"$AF\r\n\r\n"
+
+
+class FakeTelnetDevice:
+    """Minimal stand-in for the device's Telnet command interface."""
+
+    def __init__(self, username="admin", password="admin", outlets="10101"):
+        self.outlets = outlets
+        self.commands = []
+        self.connections = 0
+        self._login = f"$A1,{username},{password}"
+        self._writers = []
+        self._server = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self.drop_sessions()
+        self._server.close()
+        await self._server.wait_closed()
+
+    def drop_sessions(self):
+        """Close every open session, as a device reboot would."""
+        for writer in self._writers:
+            writer.close()
+        self._writers.clear()
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        self._writers.append(writer)
+        # Offer echo, as real Telnet servers do, and print a banner
+        writer.write(bytes((255, 251, 1)) + b"\r\nnetBooter>")
+        logged_in = False
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                # Skip the client's option replies
+                line = line.replace(bytes((255, 254, 1)), b"").strip().decode()
+                if not logged_in:
+                    logged_in = line == self._login
+                    writer.write(b"$A0\r\n" if logged_in else b"$AF\r\n")
+                    continue
+                self.commands.append(line)
+                if line == "$A2":
+                    break
+                writer.write(line.encode() + b"\r\n" + self._respond(line) + b"\r\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        writer.close()
+
+    def _respond(self, line):
+        if line == "$A5":
+            return f"$A0,{self.outlets},2.50,25".encode()
+        if line.startswith("$A3,"):
+            _, outlet, value = line.split(",")
+            chars = list(self.outlets)
+            chars[len(chars) - int(outlet)] = value
+            self.outlets = "".join(chars)
+            return b"$A0"
+        if line == "$A8":
+            return b"$A0,NP0501DU, HW4.3 BL1.6 -7.72-8.5"
+        return b"$AF"
+
+
+class FakeSerialDevice:
+    """Device serial console on the master side of a pty."""
+
+    def __init__(self, outlets="10101", echo=True):
+        self.outlets = outlets
+        self.echo = echo
+        self.commands = []
+        self.respond = True
+        self.master, self.slave = os.openpty()
+        self.path = os.ttyname(self.slave)
+        self._buffer = b""
+        os.set_blocking(self.master, False)
+        asyncio.get_running_loop().add_reader(self.master, self._on_data)
+
+    # Same command set as the Telnet interface
+    _respond = FakeTelnetDevice._respond
+
+    def close(self):
+        asyncio.get_running_loop().remove_reader(self.master)
+        os.close(self.master)
+        os.close(self.slave)
+
+    def _on_data(self):
+        try:
+            self._buffer += os.read(self.master, 1024)
+        except OSError:
+            return
+        while b"\r\n" in self._buffer:
+            line, self._buffer = self._buffer.split(b"\r\n", 1)
+            line = line.decode()
+            self.commands.append(line)
+            if not self.respond:
+                continue
+            response = b"$A0" if line.startswith("$A1,") else self._respond(line)
+            reply = f"{line}\r\n" if self.echo else ""
+            reply += response.decode() + "\r\n>"
+            os.write(self.master, reply.encode())
+
+
+@pytest.fixture
+async def serial_device():
+    """Run a fake device serial console on a pty."""
+    device = FakeSerialDevice()
+    yield device
+    device.close()
+
+
+@pytest.fixture
+async def telnet_device():
+    """Run a fake device Telnet server."""
+    device = FakeTelnetDevice()
+    device.port = await device.start()
+    yield device
+    await device.stop()
+
+
+@pytest.fixture
+async def http_device():
+    """Run a fake device HTTP server."""
+    device = FakeHttpDevice()
+    device.port = await device.start()
+    yield device
+    await device.stop()
+
+
+class TestStreamHttpTransport:
+    """Test StreamHttpTransport against a local fake device."""
+
+    @pytest.mark.asyncio
+    async def test_send_command(self, http_device):
+        """Test a command round trip returns the raw body."""
+        transport = StreamHttpTransport("127.0.0.1", http_device.port)
+
+        body = await transport.send_command("$A3 2 1")
+
+        assert body.strip() == b"$A0"
+        assert http_device.requests == ["/cmd.cgi?$A3%202%201"]
+        assert http_device.hosts == [f"127.0.0.1:{http_device.port}"]
+        assert http_device.outlets == "10111"
+
+    def test_host_header(self):
+        """Test the Host header carries the port unless it is 80."""
+        assert b"\r\nHost: pdu\r\n" in StreamHttpTransport("pdu", 80)._headers
+        assert b"\r\nHost: [::1]:8080\r\n" in StreamHttpTransport("::1", 8080)._headers
+
+    @pytest.mark.asyncio
+    async def test_authentication_error(self, http_device):
+        """Test a 401 raises AuthenticationError."""
+        transport = StreamHttpTransport(
+            "127.0.0.1", http_device.port, password="wrong"
+        )
+
+        with pytest.raises(AuthenticationError):
+            await transport.send_command("$A5")
+
+    @pytest.mark.asyncio
+    async def test_timeout(self, http_device):
+        """Test a slow device raises a connection error."""
+        http_device.delay = 0.5
+        transport = StreamHttpTransport("127.0.0.1", http_device.port, timeout=0.05)
+
+        with pytest.raises(NetCommanderConnectionError):
+            await transport.send_command("$A5")
+
+    @pytest.mark.asyncio
+    async def test_connection_refused(self, http_device):
+        """Test an unreachable port raises a connection error."""
+        await http_device.stop()
+        transport = StreamHttpTransport("127.0.0.1", http_device.port)
+
+        with pytest.raises(NetCommanderConnectionError):
+            await transport.send_command("$A5")
+        await http_device.start()
+
+    @pytest.mark.asyncio
+    async def test_client_over_stream_transport(self, http_device):
+        """Test the client API works unchanged over the stream transport."""
+        transport = StreamHttpTransport("127.0.0.1", http_device.port)
+
+        async with NetCommanderClient(
+            "127.0.0.1", "admin", "admin", port=http_device.port, transport=transport
+        ) as client:
+            status = await client.get_status()
+            assert status.outlets == {1: True, 2: False, 3: True, 4: False, 5: True}
+            assert status.raw_response == "$A0,10101,2.50,25"
+
+            assert await client.turn_off(1) is True
+            assert (await client.get_status()).outlets[1] is False
+
+            info = await client.get_device_info()
+            assert info.model == "NP0501DU"
+            assert info.mac_address == "0C:73:EB:B0:9E:5C"
+
+            with pytest.raises(CommandError):
+                await client._send_command("$A9")
+
+    @pytest.mark.asyncio
+    async def test_adaptive_timeouts(self, http_device):
+        """Test per-call timeouts are learned from and enforced per phase."""
+        transport = StreamHttpTransport("127.0.0.1", http_device.port)
+        timeouts = AdaptiveTimeouts(min_timeout=0.05, max_timeout=10)
+
+        for _ in range(3):
+            await transport.send_command("$A5", timeouts)
+        assert timeouts.connect.samples == 3
+        assert timeouts.read.samples == 3
+        assert timeouts.read_timeout() == 0.05
+
+        # A device that turns slow is detected at the learned timeout, and
+        # the timeout backs off for the next attempt
+        rto = timeouts.read.rto
+        http_device.delay = 1.0
+        with pytest.raises(NetCommanderConnectionError, match="Read timeout"):
+            await asyncio.wait_for(transport.send_command("$A5", timeouts), 0.5)
+        assert timeouts.read.rto == rto * 2
+
+
+class TestAiohttpTransport:
+    """Test AiohttpTransport timeout handling."""
+
+    @pytest.mark.asyncio
+    async def test_only_read_timeouts_back_off(self, mock_session):
+        """Test a connect timeout leaves the read estimate alone."""
+        transport = AiohttpTransport("127.0.0.1", session=mock_session)
+        timeouts = AdaptiveTimeouts(min_timeout=0.05, max_timeout=10)
+        timeouts.read.observe(0.1)
+        rto = timeouts.read.rto
+
+        mock_session.get.side_effect = aiohttp.ServerTimeoutError(
+            "Connection timeout to host http://127.0.0.1:80/cmd.cgi?$A5"
+        )
+        with pytest.raises(NetCommanderConnectionError, match="Connect timeout"):
+            await transport.send_command("$A5", timeouts)
+        assert timeouts.read.rto == rto
+
+        mock_session.get.side_effect = aiohttp.ServerTimeoutError(
+            "Timeout on reading data from socket"
+        )
+        with pytest.raises(NetCommanderConnectionError):
+            await transport.send_command("$A5", timeouts)
+        assert timeouts.read.rto == rto * 2
+
+
+class TestTelnetTransport:
+    """Test TelnetTransport against a local fake device."""
+
+    def test_translate_command(self):
+        """Test HTTP-style commands are rewritten to Telnet syntax."""
+        assert translate_command("$A3 1 1") == b"$A3,1,1\r\n"
+        assert translate_command("$A5") == b"$A5\r\n"
+        with pytest.raises(CommandError):
+            translate_command("rly=0")
+
+    def test_strip_telnet_options(self):
+        """Test option negotiation is removed and refused."""
+        data, reply = strip_telnet_options(
+            bytes((255, 251, 1, 255, 253, 24)) + b"$A0\r\n"
+        )
+
+        assert data == b"$A0\r\n"
+        assert reply == bytes((255, 254, 1, 255, 252, 24))
+
+    @pytest.mark.asyncio
+    async def test_client_over_telnet(self, telnet_device):
+        """Test the client works over one persistent Telnet session."""
+        transport = TelnetTransport("127.0.0.1", telnet_device.port)
+
+        async with NetCommanderClient(
+            "127.0.0.1", "admin", "admin", port=telnet_device.port, transport=transport
+        ) as client:
+            status = await client.get_status()
+            assert status.outlets == {1: True, 2: False, 3: True, 4: False, 5: True}
+
+            assert await client.turn_off(1) is True
+            assert (await client.get_status(force=True)).outlets[1] is False
+
+            info = await client.get_device_info()
+            assert info.model == "NP0501DU"
+            assert info.mac_address is None
+
+        # Closing the client logs out of the session
+        for _ in range(100):
+            if telnet_device.commands[-1:] == ["$A2"]:
+                break
+            await asyncio.sleep(0.01)
+
+        assert telnet_device.connections == 1
+        assert telnet_device.commands == ["$A5", "$A3,1,0", "$A5", "$A8", "$A2"]
+
+    @pytest.mark.asyncio
+    async def test_login_rejected(self, telnet_device):
+        """Test a rejected login raises AuthenticationError."""
+        transport = TelnetTransport(
+            "127.0.0.1", telnet_device.port, password="wrong"
+        )
+
+        with pytest.raises(AuthenticationError):
+            await transport.send_command("$A5")
+        assert not transport.connected
+
+    @pytest.mark.asyncio
+    async def test_reconnect_after_drop(self, telnet_device):
+        """Test a dropped session is reopened transparently."""
+        transport = TelnetTransport("127.0.0.1", telnet_device.port)
+
+        assert await transport.send_command("$A5") == b"$A0,10101,2.50,25"
+        telnet_device.drop_sessions()
+        assert await transport.send_command("$A5") == b"$A0,10101,2.50,25"
+
+        assert telnet_device.connections == 2
+        await transport.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_commands_serialized(self, telnet_device):
+        """Test concurrent callers get their own responses."""
+        transport = TelnetTransport("127.0.0.1", telnet_device.port)
+
+        responses = await asyncio.gather(
+            transport.send_command("$A5"),
+            transport.send_command("$A3 2 1"),
+            transport.send_command("$A8"),
+        )
+
+        assert responses[0] == b"$A0,10101,2.50,25"
+        assert responses[1] == b"$A0"
+        assert responses[2].startswith(b"$A0,NP0501DU")
+        assert telnet_device.connections == 1
+        await transport.close()
+
+    @pytest.mark.asyncio
+    async def test_unreachable(self, telnet_device):
+        """Test an unreachable port raises a connection error."""
+        await telnet_device.stop()
+        transport = TelnetTransport("127.0.0.1", telnet_device.port, timeout=1)
+
+        with pytest.raises(NetCommanderConnectionError):
+            await transport.send_command("$A5")
+        await telnet_device.start()
+
+
+class TestSerialTransport:
+    """Test SerialTransport against a pty-backed fake device."""
+
+    @pytest.mark.asyncio
+    async def test_client_over_serial(self, serial_device):
+        """Test the client works over the serial console."""
+        transport = SerialTransport(serial_device.path)
+
+        async with NetCommanderClient(
+            "192.168.1.100", "admin", "admin", transport=transport
+        ) as client:
+            status = await client.get_status()
+            assert status.outlets == {1: True, 2: False, 3: True, 4: False, 5: True}
+
+            assert await client.turn_on(2) is True
+            assert (await client.get_status(force=True)).outlets[2] is True
+
+        assert serial_device.commands == ["$A5", "$A3,2,1", "$A5"]
+        assert not transport.connected
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_multiplexed(self, serial_device):
+        """Test concurrent callers take turns and get their own responses."""
+        transport = SerialTransport(serial_device.path)
+
+        responses = await asyncio.gather(
+            transport.send_command("$A5"),
+            transport.send_command("$A3 5 0"),
+            transport.send_command("$A8"),
+            transport.send_command("$A5"),
+        )
+
+        assert responses[0] == b"$A0,10101,2.50,25"
+        assert responses[1] == b"$A0"
+        assert responses[2].startswith(b"$A0,NP0501DU")
+        assert responses[3] == b"$A0,00101,2.50,25"
+        await transport.close()
+
+    @pytest.mark.asyncio
+    async def test_login(self, serial_device):
+        """Test credentials are sent once when the port opens."""
+        transport = SerialTransport(
+            serial_device.path, username="admin", password="admin"
+        )
+
+        await transport.send_command("$A5")
+        await transport.send_command("$A5")
+
+        assert serial_device.commands == ["$A1,admin,admin", "$A5", "$A5"]
+        await transport.close()
+
+    @pytest.mark.asyncio
+    async def test_no_response(self, serial_device):
+        """Test a silent device times out and the port is reopened later."""
+        transport = SerialTransport(serial_device.path, timeout=0.05)
+
+        serial_device.respond = False
+        with pytest.raises(NetCommanderConnectionError):
+            await transport.send_command("$A5")
+        assert not transport.connected
+
+        serial_device.respond = True
+        assert await transport.send_command("$A5") == b"$A0,10101,2.50,25"
+        await transport.close()
+
+    @pytest.mark.asyncio
+    async def test_end_of_file(self):
+        """Test end of file stops watching the port and ends pending reads."""
+        transport = SerialTransport("/dev/null")
+        read_fd, write_fd = os.pipe()
+        os.close(write_fd)
+        reader = asyncio.StreamReader()
+        loop = asyncio.get_running_loop()
+        loop.add_reader(read_fd, transport._on_readable, read_fd, reader)
+
+        with pytest.raises(asyncio.IncompleteReadError):
+            await asyncio.wait_for(reader.readuntil(b"\n"), 1)
+        assert not loop.remove_reader(read_fd)
+        os.close(read_fd)
+
+    @pytest.mark.asyncio
+    async def test_missing_port(self):
+        """Test a missing device raises a connection error."""
+        transport = SerialTransport("/dev/does-not-exist")
+
+        with pytest.raises(NetCommanderConnectionError):
+            await transport.send_command("$A5")
+
+
+class TestTransportRegistry:
+    """Test transport selection by URL scheme."""
+
+    def test_schemes(self):
+        """Test each scheme creates its transport with URL settings."""
+        http = create_transport("http://192.168.1.100:8080", "admin", "secret")
+        assert isinstance(http, AiohttpTransport)
+        assert (http.host, http.port) == ("192.168.1.100", 8080)
+
+        stream = create_transport("http+stream://192.168.1.100")
+        assert isinstance(stream, StreamHttpTransport)
+        assert stream.port == 80
+
+        telnet = create_transport("telnet://operator:pw@192.168.1.100")
+        assert isinstance(telnet, TelnetTransport)
+        assert (telnet.port, telnet.username) == (23, "operator")
+
+        serial = create_transport("serial:///dev/ttyUSB1?baudrate=19200")
+        assert isinstance(serial, SerialTransport)
+        assert (serial.device, serial.baudrate) == ("/dev/ttyUSB1", 19200)
+        assert serial.username is None
+
+        replay = create_transport("replay://recordings/pdu.jsonl")
+        assert isinstance(replay, ReplayTransport)
+        assert str(replay.path) == "recordings/pdu.jsonl"
+
+    def test_unknown_scheme(self):
+        """Test an unknown scheme is rejected."""
+        with pytest.raises(ValueError, match="ftp"):
+            create_transport("ftp://192.168.1.100")
+
+    def test_missing_host(self):
+        """Test a network URL without a host is rejected."""
+        with pytest.raises(ValueError, match="no host"):
+            create_transport("telnet://:23")
+
+    @pytest.mark.asyncio
+    async def test_client_accepts_url(self, telnet_device):
+        """Test the client creates its transport from a URL."""
+        async with NetCommanderClient(
+            "127.0.0.1",
+            "admin",
+            "admin",
+            transport=f"telnet://127.0.0.1:{telnet_device.port}",
+        ) as client:
+            assert isinstance(client.transport, TelnetTransport)
+            assert (await client.get_status()).outlets[1] is True
+
+
+class TestReplayTransport:
+    """Test recording and replaying device sessions."""
+
+    @pytest.mark.asyncio
+    async def test_record_and_replay(self, http_device, tmp_path):
+        """Test a recorded session replays through the client."""
+        recording = tmp_path / "pdu.jsonl"
+        transport = RecordingTransport(
+            StreamHttpTransport("127.0.0.1", http_device.port), recording
+        )
+        async with NetCommanderClient(
+            "127.0.0.1", "admin", "admin", transport=transport
+        ) as client:
+            await client.get_status()
+            await client.turn_off(1)
+            await client.get_status(force=True)
+            await client.get_device_info()
+
+        async with NetCommanderClient(
+            "127.0.0.1", "admin", "admin", transport=f"replay://{recording}"
+        ) as client:
+            assert (await client.get_status()).outlets[1] is True
+            assert await client.turn_off(1) is True
+            assert (await client.get_status(force=True)).outlets[1] is False
+            # Responses run out: the last one repeats
+            assert (await client.get_status(force=True)).outlets[1] is False
+
+            info = await client.get_device_info()
+            assert info.mac_address == "0C:73:EB:B0:9E:5C"
+
+            with pytest.raises(CommandError):
+                await client.turn_on(3)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "content",
+        [
+            '{"command": "$A5", "response": "$A0,1,0.00,XX"}\nnot json\n',
+            '{"command": "$A5", "response": "$A0,1,0.00,XX"}\n{"command": "$A5"}\n',
+            '{"command": "$A5", "response": "$A0,1,0.00,XX"}\n["$A5"]\n',
+        ],
+    )
+    async def test_malformed_recording(self, tmp_path, content):
+        """Test a bad line is reported with the file and line number."""
+        recording = tmp_path / "pdu.jsonl"
+        recording.write_text(content)
+
+        with pytest.raises(NetCommanderConnectionError, match="line 2") as info:
+            await ReplayTransport(recording).send_command("$A5")
+        assert str(recording) in str(info.value)